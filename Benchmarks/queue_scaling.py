@@ -0,0 +1,71 @@
+"""
+Scaling benchmark for the ready queue of the Round Robin and FIFO schedulers.
+
+Runs the current schedulers and the list based reference copies of the old ones
+(reference_schedulers.py) on the same growing workloads of back-to-back processes, in the same
+process, and prints both curves side by side. The reference schedulers are quadratic, so they
+are skipped above --reference-limit processes:
+
+    python3 Benchmarks/queue_scaling.py
+    python3 Benchmarks/queue_scaling.py --sizes 1000,10000,100000 --reference-limit 100000
+"""
+import argparse
+import os
+import sys
+import time
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if REPO_ROOT not in sys.path:
+    sys.path.insert(0, REPO_ROOT)
+
+from Benchmarks.reference_schedulers import reference_fifo_scheduler, reference_round_robin_scheduler
+from Dependencies.data_structure import Process
+from Dependencies.Scheduler_Algorithms.fifo_scheduler import fifo_scheduler
+from Dependencies.Scheduler_Algorithms.round_robin_scheduler import round_robin_scheduler
+
+
+def make_workload(count):
+    """
+    Build a workload where every process arrives before the CPU frees up, keeping the ready queue long.
+
+    :param count: Number of processes
+    :return: Tuple (process_list, run_for)
+    """
+    process_list = [Process(f"P{i}", i, 4) for i in range(count)]
+    return process_list, 4 * count + 1
+
+
+def time_scheduler(scheduler, count, *args):
+    """
+    :param scheduler: The scheduler function, called as scheduler(process_list, run_for, *args)
+    :param count: Number of processes of the workload
+    :return: Seconds taken by the scheduler on a fresh workload
+    """
+    process_list, run_for = make_workload(count)
+    start = time.perf_counter()
+    scheduler(process_list, run_for, *args)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Ready queue scaling benchmark, old and new side by side")
+    parser.add_argument("--sizes", default="1000,10000,100000,1000000", help="comma separated process counts")
+    parser.add_argument("--quantum", type=int, default=2, help="Round Robin quantum")
+    parser.add_argument("--reference-limit", type=int, default=100000,
+                        help="largest process count the list based reference schedulers are run on")
+    args = parser.parse_args()
+
+    print(f"{'processes':>10} {'old rr (s)':>11} {'new rr (s)':>11} {'old fcfs (s)':>13} {'new fcfs (s)':>13}")
+    for count in [int(size) for size in args.sizes.split(",")]:
+        if count <= args.reference_limit:
+            old_rr = f"{time_scheduler(reference_round_robin_scheduler, count, args.quantum):.3f}"
+            old_fifo = f"{time_scheduler(reference_fifo_scheduler, count):.3f}"
+        else:
+            old_rr = old_fifo = "-"
+        new_rr = time_scheduler(round_robin_scheduler, count, args.quantum)
+        new_fifo = time_scheduler(fifo_scheduler, count)
+        print(f"{count:>10} {old_rr:>11} {new_rr:>11.3f} {old_fifo:>13} {new_fifo:>13.3f}", flush=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+"""
+Reference copies of the Round Robin and FIFO schedulers as they were before the deque ready
+queue and the arrival cursor: both dequeue with list.pop(0) and Round Robin steps through each
+time slice one tick at a time. They are only kept so that queue_scaling.py can time the old and
+the new ready queue in the same process, and are not used by the program.
+"""
+
+
+# Round-Robin Scheduler Algorithm, list based reference
+def reference_round_robin_scheduler(process_list, run_for, quantum):
+    """
+    Simulate the Round Robin scheduling algorithm with a list ready queue.
+
+    Parameters:
+    process_list (list of Process): List of processes to be scheduled.
+    run_for (int): Total time units to run the simulation.
+    quantum (int): Time slice for Round Robin scheduling.
+
+    Returns:
+    list of str: Event log detailing the scheduling process.
+    """
+    current_time = 0
+    event_log = []
+    ready_queue = []
+    process_queue = sorted(process_list, key=lambda p: p.arrival_time)
+
+    while current_time < run_for and (process_queue or ready_queue):
+        while process_queue and process_queue[0].arrival_time <= current_time:
+            process = process_queue.pop(0)
+            ready_queue.append(process)
+            event_log.append(f"Time {current_time} : {process.name} arrived")
+
+        if not ready_queue:
+            event_log.append(f"Time {current_time} : Idle")
+            current_time += 1
+            continue
+
+        current_process = ready_queue.pop(0)
+        if current_process.start_time == -1:
+            current_process.set_start_time(current_time)
+        event_log.append(f"Time {current_time} : {current_process.name} selected (burst {current_process.remaining_burst_time})")
+
+        execution_time = min(quantum, current_process.remaining_burst_time)
+        for _ in range(execution_time):
+            current_time += 1
+            current_process.remaining_burst_time -= 1
+            while process_queue and process_queue[0].arrival_time <= current_time:
+                process = process_queue.pop(0)
+                ready_queue.append(process)
+                event_log.append(f"Time {current_time} : {process.name} arrived")
+            if current_process.remaining_burst_time == 0:
+                break
+
+        if current_process.remaining_burst_time == 0:
+            current_process.set_finish_time(current_time)
+            event_log.append(f"Time {current_time} : {current_process.name} finished")
+        else:
+            ready_queue.append(current_process)
+
+        while process_queue and process_queue[0].arrival_time <= current_time:
+            process = process_queue.pop(0)
+            ready_queue.append(process)
+            event_log.append(f"Time {current_time} : {process.name} arrived")
+
+    while current_time < run_for:
+        event_log.append(f"Time {current_time} : Idle")
+        current_time += 1
+
+    return event_log
+
+
+# Function for the FIFO scheduler algorithm, list based reference
+def reference_fifo_scheduler(process_list, run_for):
+    """
+    Simulate the First-Come First-Served scheduling algorithm with a list process queue.
+
+    Parameters:
+    process_list (list of Process): List of processes to be scheduled.
+    run_for (int): Total time units to run the simulation.
+
+    Returns:
+    list of str: Event log detailing the scheduling process.
+    """
+    current_time = 0
+    event_log = []
+    process_queue = sorted(process_list, key=lambda p: p.arrival_time)
+    while current_time < run_for and process_queue:
+        current_process = process_queue.pop(0)
+        if current_time < current_process.arrival_time:
+            event_log.append(f"Time {current_time} : Idle")
+            current_time = current_process.arrival_time
+
+        current_process.set_start_time(current_time)
+        event_log.append(f"Time {current_time} : {current_process.name} selected (burst {current_process.burst_time})")
+        current_time += current_process.burst_time
+        current_process.finish_time = current_time
+        current_process.update_metrics(current_time)
+        event_log.append(f"Time {current_time} : {current_process.name} finished")
+
+    while current_time < run_for:
+        event_log.append(f"Time {current_time} : Idle")
+        current_time += 1
+
+    return event_log
@@ -0,0 +1,224 @@
+"""
+Benchmark suite for the four schedulers.
+
+Two series are measured for every scheduler on seeded synthetic workloads:
+    processes   growing process counts (10^2 to 10^7 by default)
+    horizon     a fixed number of processes with growing 'runfor' horizons (10^4 to 10^8 by default)
+
+Every case runs in a fresh interpreter so its peak RSS can be measured. Once a case of a series
+takes longer than the time budget, the larger cases of that series are skipped for that scheduler.
+The results are written as JSON and can be compared against a stored baseline. Benchmarks/baseline.json
+is a --quick run, it only holds the quick sizes and horizons:
+
+    python3 Benchmarks/scheduler_benchmark.py --quick --output results.json
+    python3 Benchmarks/scheduler_benchmark.py --quick --baseline Benchmarks/baseline.json
+"""
+import argparse
+import json
+import os
+import platform
+import random
+import resource
+import subprocess
+import sys
+import time
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if REPO_ROOT not in sys.path:
+    sys.path.insert(0, REPO_ROOT)
+
+from Benchmarks.workload_generator import generate_workload
+from Dependencies.Scheduler_Algorithms.fifo_scheduler import fifo_events, vectorized_fifo_scheduler
+from Dependencies.Scheduler_Algorithms.fair_scheduler import fair_events
+from Dependencies.Scheduler_Algorithms.lottery_scheduler import lottery_events
+from Dependencies.Scheduler_Algorithms.mlfq_scheduler import mlfq_events
+from Dependencies.Scheduler_Algorithms.round_robin_scheduler import round_robin_events
+from Dependencies.Scheduler_Algorithms.sjf_scheduler import preemptive_sjf_events
+
+SCHEDULERS = ("fcfs", "fcfs-vectorized", "sjf", "rr", "mlfq", "fair", "lottery")
+DEFAULT_SIZES = "100,1000,10000,100000,1000000,10000000"
+DEFAULT_HORIZONS = "10000,100000,1000000,10000000,100000000"
+QUICK_SIZES = "100,1000,10000,100000"
+QUICK_HORIZONS = "10000,100000,1000000"
+
+
+def scheduler_events(algorithm, process_table, run_for, quantum, counters=None):
+    """
+    Returns the event generator of a scheduler for a workload.
+
+    :param algorithm: One of SCHEDULERS
+    :param process_table: The processes of the workload
+    :param run_for: Total time units to run the simulation
+    :param quantum: Time slice for Round Robin scheduling, of the highest MLFQ level and minimum granularity
+                    of the fair scheduler
+    :param counters: Optional dictionary for the hot-path counters of fcfs, sjf, rr and lottery
+    """
+    if algorithm == "fcfs":
+        return fifo_events(process_table, run_for, counters=counters)
+    if algorithm == "fcfs-vectorized":
+        # Metrics only, the closed form engine produces no events
+        vectorized_fifo_scheduler(process_table, run_for)
+        return ()
+    if algorithm == "sjf":
+        return preemptive_sjf_events(process_table, run_for, counters=counters)
+    if algorithm == "rr":
+        return round_robin_events(process_table, run_for, quantum, counters=counters)
+    if algorithm == "mlfq":
+        # Three levels with doubling quanta, boosted every hundred quanta
+        return mlfq_events(process_table, run_for, (quantum, 2 * quantum, 4 * quantum), 100 * quantum)
+    if algorithm == "fair":
+        # Minimum granularity of one quantum, target latency of eight
+        return fair_events(process_table, run_for, 8 * quantum, quantum)
+    return lottery_events(process_table, run_for, counters=counters)
+
+
+def run_case(case):
+    """
+    Runs one benchmark case in the current interpreter. Only the scheduler is timed, building
+    the workload is not.
+
+    :param case: Dictionary describing the case (scheduler, series, processes, mean_burst, seed, quantum)
+    :return: Dictionary with the measurements of the case
+    """
+    process_table, run_for = generate_workload(case["processes"], case["seed"], mean_interarrival=case["mean_burst"] / 2,
+                                               mean_burst=case["mean_burst"])
+    workload_rss_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    random.seed(case["seed"])
+    counters = {}
+    start = time.perf_counter()
+    events = sum(1 for _ in scheduler_events(case["scheduler"], process_table, run_for, case["quantum"], counters))
+    seconds = time.perf_counter() - start
+
+    result = dict(case)
+    result.update({
+        "run_for": run_for,
+        "events": events,
+        "seconds": seconds,
+        "seconds_per_process": seconds / case["processes"],
+        "seconds_per_tick": seconds / run_for,
+        "workload_rss_kb": workload_rss_kb,
+        "peak_rss_kb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+        # Engine work against the workload shape, such as heap churn under sjf for the simulated ticks
+        "counters": counters,
+        "iterations_per_tick": counters["loop_iterations"] / run_for if counters else None,
+    })
+    return result
+
+
+def run_case_in_subprocess(case):
+    """
+    Runs one benchmark case in a fresh interpreter so that its peak RSS is its own.
+
+    :param case: Dictionary describing the case
+    :return: Dictionary with the measurements of the case
+    """
+    completed = subprocess.run([sys.executable, os.path.abspath(__file__), "--case", json.dumps(case)],
+                               capture_output=True, text=True, check=True, cwd=REPO_ROOT)
+    return json.loads(completed.stdout)
+
+
+def build_series(args):
+    """
+    Lists the cases of both series, smallest first.
+
+    :param args: Parsed command line arguments
+    :return: Dictionary mapping (scheduler, series) to its list of cases
+    """
+    sizes = [int(size) for size in args.sizes.split(",")]
+    horizons = [int(horizon) for horizon in args.horizons.split(",")]
+    series = {}
+    for scheduler in args.schedulers.split(","):
+        base = {"scheduler": scheduler, "seed": args.seed, "quantum": args.quantum}
+        series[(scheduler, "processes")] = [
+            dict(base, series="processes", processes=size, mean_burst=args.mean_burst) for size in sizes]
+        series[(scheduler, "horizon")] = [
+            dict(base, series="horizon", processes=args.horizon_processes,
+                 mean_burst=max(1, horizon // args.horizon_processes)) for horizon in horizons]
+    return series
+
+
+def case_key(result):
+    return (result["scheduler"], result["series"], result["processes"], result["mean_burst"])
+
+
+def compare_with_baseline(results, baseline, tolerance):
+    """
+    Prints the time of every case next to its baseline time.
+
+    :param results: Results of this run
+    :param baseline: Results loaded from the baseline file
+    :param tolerance: Allowed slowdown before a case counts as a regression (0.2 is 20%)
+    :return: Number of regressions
+    """
+    baseline_results = {case_key(result): result for result in baseline["results"]}
+    regressions = 0
+    print(f"{'scheduler':>9} {'series':>9} {'processes':>10} {'run_for':>11} {'baseline s':>11} {'now s':>9} {'ratio':>7}")
+    for result in results:
+        reference = baseline_results.get(case_key(result))
+        if reference is None:
+            continue
+        ratio = result["seconds"] / reference["seconds"] if reference["seconds"] else float("inf")
+        flag = ""
+        if ratio > 1 + tolerance:
+            regressions += 1
+            flag = "  REGRESSION"
+        print(f"{result['scheduler']:>9} {result['series']:>9} {result['processes']:>10} {result['run_for']:>11} "
+              f"{reference['seconds']:>11.4f} {result['seconds']:>9.4f} {ratio:>7.2f}{flag}")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Scheduler benchmark suite")
+    parser.add_argument("--schedulers", default=",".join(SCHEDULERS), help="comma separated schedulers to run")
+    parser.add_argument("--sizes", default=DEFAULT_SIZES, help="process counts of the 'processes' series")
+    parser.add_argument("--horizons", default=DEFAULT_HORIZONS, help="approximate 'runfor' of the 'horizon' series")
+    parser.add_argument("--quick", action="store_true", help=f"use sizes {QUICK_SIZES} and horizons {QUICK_HORIZONS}")
+    parser.add_argument("--horizon-processes", type=int, default=100, help="process count of the 'horizon' series")
+    parser.add_argument("--mean-burst", type=int, default=10, help="mean burst of the 'processes' series")
+    parser.add_argument("--quantum", type=int, default=4, help="Round Robin quantum")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--budget", type=float, default=60.0, help="seconds after which the larger cases of a series are skipped")
+    parser.add_argument("--output", help="JSON file to write the results to")
+    parser.add_argument("--baseline", help="JSON results to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="allowed slowdown against the baseline")
+    parser.add_argument("--case", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.case:
+        print(json.dumps(run_case(json.loads(args.case))))
+        return
+
+    if args.quick:
+        args.sizes, args.horizons = QUICK_SIZES, QUICK_HORIZONS
+
+    results = []
+    for (scheduler, series), cases in build_series(args).items():
+        for case in cases:
+            result = run_case_in_subprocess(case)
+            results.append(result)
+            print(f"{scheduler:>8} {series:>9} processes={result['processes']:<9} run_for={result['run_for']:<10} "
+                  f"{result['seconds']:.4f} s  {result['seconds_per_process'] * 1e6:.2f} us/process  "
+                  f"{result['seconds_per_tick'] * 1e9:.1f} ns/tick  peak {result['peak_rss_kb'] // 1024} MB", flush=True)
+            if result["seconds"] > args.budget:
+                break
+
+    report = {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "seed": args.seed,
+        "results": results,
+    }
+    if args.output:
+        with open(args.output, 'w') as file:
+            json.dump(report, file, indent=2)
+
+    if args.baseline:
+        with open(args.baseline, 'r') as file:
+            baseline = json.load(file)
+        if compare_with_baseline(results, baseline, args.tolerance):
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+"""
+Seeded synthetic workload generator for the benchmarks.
+
+Arrival and burst times are drawn from configurable distributions with a fixed seed, so the same
+arguments always give the same workload. Workloads are built as a ProcessTable to keep the memory
+of the largest sizes low, or written as an input file:
+
+    python3 Benchmarks/workload_generator.py 1000 --algorithm rr --quantum 3 --output workload.in
+"""
+import argparse
+import os
+import random
+import sys
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if REPO_ROOT not in sys.path:
+    sys.path.insert(0, REPO_ROOT)
+
+from Dependencies.data_structure import ProcessTable
+from Dependencies.input_file_parsing import input_file_lines
+
+ARRIVAL_DISTRIBUTIONS = ("poisson", "uniform", "batch")
+BURST_DISTRIBUTIONS = ("exponential", "uniform", "bimodal")
+
+
+def draw_arrivals(rng, count, distribution, mean_interarrival):
+    """
+    Draws sorted arrival times.
+
+    :param rng: Seeded random.Random instance
+    :param count: Number of processes
+    :param distribution: 'poisson' (exponential gaps), 'uniform' (uniform over the same span) or 'batch' (all at 0)
+    :param mean_interarrival: Mean gap between two arrivals
+    :return: List of arrival times, in increasing order
+    """
+    if distribution == "batch":
+        return [0] * count
+    if distribution == "uniform":
+        span = int(count * mean_interarrival)
+        return sorted(rng.randint(0, span) for _ in range(count))
+    arrivals = []
+    clock = 0.0
+    for _ in range(count):
+        arrivals.append(int(clock))
+        clock += rng.expovariate(1.0 / mean_interarrival) if mean_interarrival > 0 else 0.0
+    return arrivals
+
+
+def draw_burst(rng, distribution, mean_burst):
+    """
+    Draws one burst time, at least 1.
+
+    :param rng: Seeded random.Random instance
+    :param distribution: 'exponential', 'uniform' or 'bimodal' (90% short jobs, 10% jobs ten times longer)
+    :param mean_burst: Mean burst time
+    """
+    if distribution == "uniform":
+        return rng.randint(1, max(1, 2 * mean_burst - 1))
+    if distribution == "bimodal":
+        short_burst = max(1, round(mean_burst / 1.9))
+        return short_burst * 10 if rng.random() < 0.1 else short_burst
+    return max(1, round(rng.expovariate(1.0 / mean_burst)))
+
+
+def generate_workload(count, seed=0, arrival="poisson", burst="exponential", mean_interarrival=5.0, mean_burst=10):
+    """
+    Generates a synthetic workload.
+
+    :param count: Number of processes
+    :param seed: Seed of the random generator
+    :param arrival: Arrival distribution, one of ARRIVAL_DISTRIBUTIONS
+    :param burst: Burst distribution, one of BURST_DISTRIBUTIONS
+    :param mean_interarrival: Mean gap between two arrivals
+    :param mean_burst: Mean burst time
+    :return: Tuple (process_table, run_for) where run_for leaves time for every process to finish
+    """
+    rng = random.Random(seed)
+    process_table = ProcessTable()
+    total_burst = 0
+    last_arrival = 0
+    for index, arrival_time in enumerate(draw_arrivals(rng, count, arrival, mean_interarrival)):
+        burst_time = draw_burst(rng, burst, mean_burst)
+        process_table.add_process(f"P{index + 1}", arrival_time, burst_time)
+        total_burst += burst_time
+        last_arrival = arrival_time
+    return process_table, last_arrival + total_burst
+
+
+def write_input_file(input_file, process_table, run_for, algorithm, quantum=None):
+    """
+    Writes a workload in the input file format of the program.
+
+    :param input_file: Path of the input file to write
+    :param process_table: The processes of the workload
+    :param run_for: Total time units to run the simulation
+    :param algorithm: The scheduling algorithm to use
+    :param quantum: Time slice for Round Robin scheduling (if applicable)
+    """
+    with open(input_file, 'w', buffering=1 << 20) as file:
+        file.writelines(line + "\n" for line in input_file_lines(process_table, run_for, algorithm, quantum))
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate a seeded synthetic workload")
+    parser.add_argument("count", type=int, help="number of processes")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--arrival", choices=ARRIVAL_DISTRIBUTIONS, default="poisson")
+    parser.add_argument("--burst", choices=BURST_DISTRIBUTIONS, default="exponential")
+    parser.add_argument("--mean-interarrival", type=float, default=5.0)
+    parser.add_argument("--mean-burst", type=int, default=10)
+    parser.add_argument("--algorithm", default="fcfs", help="algorithm written in the 'use' line")
+    parser.add_argument("--quantum", type=int, default=None)
+    parser.add_argument("--output", required=True, help="input file to write")
+    args = parser.parse_args()
+
+    process_table, run_for = generate_workload(args.count, args.seed, args.arrival, args.burst,
+                                               args.mean_interarrival, args.mean_burst)
+    write_input_file(args.output, process_table, run_for, args.algorithm, args.quantum)
+
+
+if __name__ == "__main__":
+    main()
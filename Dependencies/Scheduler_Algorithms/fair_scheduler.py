@@ -0,0 +1,131 @@
+import heapq
+
+from Dependencies.event_log import *
+
+
+# Fair Scheduler Algorithm, modeled on the Linux Completely Fair Scheduler (CFS)
+def fair_scheduler(process_list, run_for, target_latency, min_granularity):
+    """
+    Simulate the fair (CFS) scheduling algorithm.
+
+    Parameters:
+    process_list (list of Process): List of processes to be scheduled.
+    run_for (int): Total time units to run the simulation.
+    target_latency (int): Time units in which every runnable process should run once.
+    min_granularity (int): Shortest time slice a process is given.
+
+    Returns:
+    EventLog: Event log detailing the scheduling process.
+    """
+    return EventLog.collect(process_list, fair_events(process_list, run_for, target_latency, min_granularity))
+
+
+# Generator version of the Fair Scheduler Algorithm
+def fair_events(process_list, run_for, target_latency, min_granularity, state=None):
+    """
+    Simulate the fair (CFS) scheduling algorithm, yielding the events as they happen.
+    The process metrics are complete once the generator is exhausted.
+
+    Every process has a virtual runtime, the CPU time it received (all the processes have the
+    same weight). The runnable process with the smallest virtual runtime runs next, for a time
+    slice of 'target_latency' divided by the number of runnable processes, but never less than
+    'min_granularity'. A new process starts at the smallest virtual runtime of the runnable
+    processes, so it cannot monopolize the CPU. As in CFS, an arrival does not preempt the
+    running process right away, but it shrinks its share of the target latency, and the running
+    process is preempted once it ran for its new share.
+
+    The runnable processes are kept in a min-heap on (virtual runtime, process id), so a
+    scheduling decision costs O(log n) however many processes are runnable.
+
+    Parameters:
+    process_list (list of Process): List of processes to be scheduled.
+    run_for (int): Total time units to run the simulation.
+    target_latency (int): Time units in which every runnable process should run once.
+    min_granularity (int): Shortest time slice a process is given.
+    state (dict): Optional scheduler state. The state of a checkpointed simulation is resumed from
+    it when it is not empty, and the state at the end of the simulation is stored in it.
+
+    Yields:
+    tuple: Event record (time, kind, process id, value), see EventLog.
+    """
+    current_time = 0
+    run_queue = []                                  # Min-heap of (virtual runtime, process id)
+    min_vruntime = 0                                # Smallest virtual runtime, never goes backwards
+
+    # Sort process ids by arrival time, arrivals are consumed through an index cursor
+    arrival_order = sorted(range(len(process_list)), key=lambda i: process_list[i].arrival_time)
+    next_arrival = 0
+    total_processes = len(arrival_order)
+
+    if state:
+        current_time = state["current_time"]
+        run_queue = state["run_queue"]
+        min_vruntime = state["min_vruntime"]
+        next_arrival = state["next_arrival"]
+
+    while current_time < run_for and (next_arrival < total_processes or run_queue):
+
+        # New processes start at the smallest virtual runtime
+        while next_arrival < total_processes and process_list[arrival_order[next_arrival]].arrival_time <= current_time:
+            process_id = arrival_order[next_arrival]
+            next_arrival += 1
+            heapq.heappush(run_queue, (min_vruntime, process_id))
+            yield (current_time, EVENT_ARRIVED, process_id, 0)
+
+        if not run_queue:
+            # If no process is runnable, CPU is idle until the next arrival
+            idle_until = min(process_list[arrival_order[next_arrival]].arrival_time, run_for)
+            yield (current_time, EVENT_IDLE, -1, idle_until - current_time)
+            current_time = idle_until
+            continue
+
+        # Pick the process with the smallest virtual runtime
+        vruntime, current_id = heapq.heappop(run_queue)
+        current_process = process_list[current_id]
+        min_vruntime = max(min_vruntime, vruntime)
+
+        # Log process selection
+        current_process.set_start_time(current_time)
+        yield (current_time, EVENT_SELECTED, current_id, current_process.remaining_burst_time)
+
+        # The runnable processes share the target latency
+        time_slice = max(min_granularity, target_latency // (len(run_queue) + 1))
+        slice_start = current_time
+        slice_end = current_time + min(time_slice, current_process.remaining_burst_time)
+
+        # Processes arriving during the time slice are queued at their own arrival time, at the
+        # smallest virtual runtime of that time. Each arrival shortens the share of the running
+        # process, which is preempted once it ran for its share
+        while next_arrival < total_processes and process_list[arrival_order[next_arrival]].arrival_time <= slice_end:
+            process_id = arrival_order[next_arrival]
+            next_arrival += 1
+            arrival_time = process_list[process_id].arrival_time
+            running_vruntime = vruntime + arrival_time - slice_start
+            if run_queue:
+                min_vruntime = max(min_vruntime, min(running_vruntime, run_queue[0][0]))
+            else:
+                min_vruntime = max(min_vruntime, running_vruntime)
+            heapq.heappush(run_queue, (min_vruntime, process_id))
+            yield (arrival_time, EVENT_ARRIVED, process_id, 0)
+
+            time_slice = max(min_granularity, target_latency // (len(run_queue) + 1))
+            slice_end = max(arrival_time, min(slice_end, slice_start + time_slice))
+
+        execution_time = slice_end - slice_start
+        current_time = slice_end
+        current_process.remaining_burst_time -= execution_time
+
+        # Log process completion or put the process back with its new virtual runtime
+        if current_process.remaining_burst_time == 0:
+            current_process.set_finish_time(current_time)
+            yield (current_time, EVENT_FINISHED, current_id, 0)
+        else:
+            heapq.heappush(run_queue, (vruntime + execution_time, current_id))
+
+    # Fill the remaining time with idle events if simulation time is not exhausted
+    if current_time < run_for:
+        yield (current_time, EVENT_IDLE, -1, run_for - current_time)
+
+    if state is not None:
+        state.update(current_time=max(current_time, run_for), run_queue=run_queue, min_vruntime=min_vruntime,
+                     next_arrival=next_arrival)
@@ -1,24 +1,167 @@
+from Dependencies.data_structure import ProcessTable
+from Dependencies.event_log import *
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional, the closed form FCFS engine then uses a plain Python pass
+    np = None
 
 # Function for the FIFO scheduler algorithm    
-def fifo_scheduler(process_list, run_for):
+def fifo_scheduler(process_list, run_for, counters=None):
+    return EventLog.collect(process_list, fifo_events(process_list, run_for, counters=counters))
+
+
+# Generator version of the FIFO scheduler algorithm, yields (time, kind, process id, value) event records.
+# A checkpointed simulation is resumed from 'state' when it is not empty, and the final state is stored in it.
+# The hot-path counters (loop iterations, context switches, idle and simulated ticks) are stored in 'counters'
+def fifo_events(process_list, run_for, state=None, counters=None):
     current_time = 0
-    event_log = []
-    process_queue = sorted(process_list, key=lambda p: p.arrival_time)
-    while current_time < run_for and process_queue:
-        current_process = process_queue.pop(0)
+    arrival_order = sorted(range(len(process_list)), key=lambda i: process_list[i].arrival_time)
+    next_arrival = 0  # Index of the next process to run in arrival_order
+    if state:
+        current_time = state["current_time"]
+        next_arrival = state["next_arrival"]
+    start_time, start_arrival = current_time, next_arrival
+    idle_ticks = 0
+    while current_time < run_for and next_arrival < len(arrival_order):
+        current_id = arrival_order[next_arrival]
+        current_process = process_list[current_id]
+        next_arrival += 1
         if current_time < current_process.arrival_time:
-            event_log.append(f"Time {current_time} : Idle")
+            idle_ticks += current_process.arrival_time - current_time
+            yield (current_time, EVENT_IDLE, -1, 1)
             current_time = current_process.arrival_time
         
         current_process.set_start_time(current_time)
-        event_log.append(f"Time {current_time} : {current_process.name} selected (burst {current_process.burst_time})")
+        yield (current_time, EVENT_SELECTED, current_id, current_process.burst_time)
         current_time += current_process.burst_time
         current_process.finish_time = current_time
         current_process.update_metrics(current_time)
-        event_log.append(f"Time {current_time} : {current_process.name} finished")
-    
-    while current_time < run_for:
-        event_log.append(f"Time {current_time} : Idle")
-        current_time += 1
+        yield (current_time, EVENT_FINISHED, current_id, 0)
     
+    if current_time < run_for:
+        idle_ticks += run_for - current_time
+        yield (current_time, EVENT_IDLE, -1, run_for - current_time)
+
+    if state is not None:
+        state.update(current_time=max(current_time, run_for), next_arrival=next_arrival)
+
+    if counters is not None:
+        # Every iteration dispatches the next process in arrival order
+        dispatches = next_arrival - start_arrival
+        counters.update(loop_iterations=dispatches, context_switches=dispatches, idle_ticks=idle_ticks,
+                        simulated_ticks=max(current_time, run_for) - start_time)
+
+
+# Closed form version of the FIFO scheduler algorithm
+def vectorized_fifo_scheduler(process_list, run_for, trace=False):
+    """
+    Computes the FIFO schedule in closed form instead of simulating it. With the processes sorted
+    by arrival, finish_i = start_i + burst_i where start_i = max(arrival_i, finish_(i-1)), which
+    unrolls to finish_i = C_i + max(0, max over j <= i of (arrival_j - C_(j-1))) with C the
+    cumulative bursts. The whole schedule is a cumulative sum and a cumulative maximum, done with
+    NumPy when it is installed. Gives the same metrics (and events) as fifo_scheduler.
+
+    Parameters:
+    process_list (list of Process or ProcessTable): List of processes to be scheduled.
+    run_for (int): Total time units to run the simulation.
+    trace (bool): Whether to build the event log. Metrics-only runs skip it.
+
+    Returns:
+    EventLog or None: Event log detailing the scheduling process if trace is True.
+    """
+    if np is not None:
+        arrival_order, start_times, finish_times = _fifo_schedule_numpy(process_list, run_for)
+    else:
+        arrival_order, start_times, finish_times = _fifo_schedule_python(process_list, run_for)
+
+    _store_fifo_metrics(process_list, arrival_order, start_times, finish_times)
+
+    if not trace:
+        return None
+
+    event_log = EventLog(process_list)
+    current_time = 0
+    for process_id, start_time, finish_time in zip(arrival_order, start_times, finish_times):
+        process_id, start_time, finish_time = int(process_id), int(start_time), int(finish_time)
+        if current_time < start_time:
+            event_log.append(current_time, EVENT_IDLE, -1, 1)
+        event_log.append(start_time, EVENT_SELECTED, process_id, finish_time - start_time)
+        event_log.append(finish_time, EVENT_FINISHED, process_id, 0)
+        current_time = finish_time
+    event_log.append(current_time, EVENT_IDLE, -1, run_for - current_time)
     return event_log
+
+
+def _fifo_schedule_numpy(process_list, run_for):
+    """
+    Computes the FIFO start and finish times with NumPy.
+
+    :return: Tuple (arrival order, start times, finish times) of the processes that get the CPU
+             before 'run_for', in the order they run
+    """
+    if isinstance(process_list, ProcessTable):
+        arrival_times = np.frombuffer(process_list.columns["arrival_time"], dtype=np.int64)
+        burst_times = np.frombuffer(process_list.columns["burst_time"], dtype=np.int64)
+    else:
+        arrival_times = np.fromiter((p.arrival_time for p in process_list), dtype=np.int64, count=len(process_list))
+        burst_times = np.fromiter((p.burst_time for p in process_list), dtype=np.int64, count=len(process_list))
+
+    arrival_order = np.argsort(arrival_times, kind="stable")
+    arrivals = arrival_times[arrival_order]
+    cumulative_bursts = np.cumsum(burst_times[arrival_order])
+    previous_bursts = cumulative_bursts - burst_times[arrival_order]
+    finish_times = cumulative_bursts + np.maximum(np.maximum.accumulate(arrivals - previous_bursts), 0)
+
+    # A process gets the CPU only if the previous one finished before 'run_for'
+    previous_finish = np.concatenate(([0], finish_times[:-1]))
+    count = int(np.searchsorted(previous_finish, run_for, side="left"))
+    finish_times = finish_times[:count]
+    return arrival_order[:count], finish_times - burst_times[arrival_order[:count]], finish_times
+
+
+def _fifo_schedule_python(process_list, run_for):
+    """
+    Computes the FIFO start and finish times in a single plain Python pass.
+
+    :return: Tuple (arrival order, start times, finish times) of the processes that get the CPU
+             before 'run_for', in the order they run
+    """
+    arrival_order = sorted(range(len(process_list)), key=lambda i: process_list[i].arrival_time)
+    start_times = []
+    finish_times = []
+    current_time = 0
+    for process_id in arrival_order:
+        if current_time >= run_for:
+            break
+        process = process_list[process_id]
+        current_time = max(current_time, process.arrival_time)
+        start_times.append(current_time)
+        current_time += process.burst_time
+        finish_times.append(current_time)
+    return arrival_order[:len(finish_times)], start_times, finish_times
+
+
+def _store_fifo_metrics(process_list, arrival_order, start_times, finish_times):
+    """
+    Stores the start, finish, turnaround, waiting and response times of the processes that ran.
+    The columns of a ProcessTable are written in bulk when NumPy is installed.
+    """
+    if np is not None and isinstance(process_list, ProcessTable):
+        columns = {name: np.frombuffer(column, dtype=np.int64) for name, column in process_list.columns.items()}
+        arrivals = columns["arrival_time"][arrival_order]
+        bursts = columns["burst_time"][arrival_order]
+        columns["start_time"][arrival_order] = start_times
+        columns["finish_time"][arrival_order] = finish_times
+        columns["turnaround_time"][arrival_order] = finish_times - arrivals
+        columns["waiting_time"][arrival_order] = finish_times - arrivals - bursts
+        columns["response_time"][arrival_order] = start_times - arrivals
+        return
+
+    for process_id, start_time, finish_time in zip(arrival_order, start_times, finish_times):
+        process = process_list[int(process_id)]
+        process.start_time = int(start_time)
+        process.finish_time = int(finish_time)
+        process.turnaround_time = process.finish_time - process.arrival_time
+        process.waiting_time = process.turnaround_time - process.burst_time
+        process.response_time = process.start_time - process.arrival_time
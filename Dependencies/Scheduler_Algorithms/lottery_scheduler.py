@@ -1,74 +1,191 @@
 import random
 
+from Dependencies.event_log import *
+
+# Number of uniform draws taken at once from a NumPy generator
+LOTTERY_DRAW_BATCH = 4096
+
+
+# Ticket index of the Lottery Scheduler Algorithm
+class TicketIndex:
+    """
+    Binary indexed (Fenwick) tree over the tickets held by each process, in process list order.
+    Changing the tickets of a process, the total and drawing a winning process all cost O(log n).
+    """
+
+    def __init__(self, size):
+        """
+        :param size: Number of processes in the index, they all start with no tickets
+        """
+        self.size = size
+        self.tree = [0] * (size + 1)
+        self.tickets = [0] * size
+        self.total = 0
+        self.top_bit = 1 << size.bit_length() if size else 0  # Highest power of two used by the descent
+
+    def set_tickets(self, process_id, tickets):
+        """
+        Sets the number of tickets held by a process.
+
+        :param process_id: Index of the process in the process list
+        :param tickets: The new number of tickets of the process (0 once it finished)
+        """
+        delta = tickets - self.tickets[process_id]
+        if delta == 0:
+            return
+        self.tickets[process_id] = tickets
+        self.total += delta
+        position = process_id + 1
+        tree = self.tree
+        while position <= self.size:
+            tree[position] += delta
+            position += position & -position
+
+    def draw(self, lottery):
+        """
+        Finds the winner of a draw by prefix-sum descent: the first process, in process list
+        order, at which the running ticket count reaches the drawn ticket.
+
+        :param lottery: The drawn ticket, between 1 and the total number of tickets
+        :return: Index of the winning process in the process list
+        """
+        position = 0
+        remaining = lottery
+        step = self.top_bit
+        tree = self.tree
+        while step:
+            next_position = position + step
+            if next_position <= self.size and tree[next_position] < remaining:
+                position = next_position
+                remaining -= tree[next_position]
+            step >>= 1
+        return position
+
+
+# Number of lottery tickets a process holds, processes closer to completion hold more tickets
+def process_tickets(process):
+    return max(1, 10 - process.remaining_burst_time)
+
+
 # Function for the Lottery Scheduler Algorithm
-def lottery_scheduling(processes, time_units):
+def lottery_scheduling(processes, time_units, counters=None):
     """
     Simulates a lottery scheduling algorithm over a specified number of time units.
 
     :param processes: List of Process instances
     :param time_units: Number of time units the scheduler should run
-    :return: List of strings representing the event log of the scheduler
+    :param counters: Optional dictionary, the hot-path counters of the simulation are stored in it
+    :return: EventLog detailing the scheduler events
+    """
+    return EventLog.collect(processes, lottery_events(processes, time_units, counters=counters))
+
+
+# Generator version of the Lottery Scheduler Algorithm
+def lottery_events(processes, time_units, state=None, counters=None, rng=None):
+    """
+    Simulates a lottery scheduling algorithm, yielding the events in time order as they happen.
+
+    The tickets of the arrived, unfinished processes are kept in a TicketIndex, so a time unit
+    costs O(log n) instead of several scans over every process. When no process is runnable the
+    simulation jumps straight to the next arrival.
+
+    :param processes: List of Process instances
+    :param time_units: Number of time units the scheduler should run
+    :param state: Optional scheduler state. The state of a checkpointed simulation is resumed from it when
+                  it is not empty, and the state at the end of the simulation is stored in it
+    :param counters: Optional dictionary, the hot-path counters of the simulation (loop iterations, context
+                     switches, lottery draws, ticket updates, idle and simulated ticks) are stored in it once
+                     the generator is exhausted. They are plain local counts, so leaving them out costs nothing
+    :param rng: Optional NumPy Generator. The draws then come from it, LOTTERY_DRAW_BATCH uniforms at a
+                time, instead of one call to the global 'random' per time unit, so independent seeded
+                simulations can run side by side. Not used with 'state'
+    :return: Generator of (time, kind, process id, value) event records, see EventLog
     """
-    event_log = []
     current_time = 0
-    active_processes = processes[:]  # Keeps only active (not finished) processes
-    last_selected_process = None  # Tracks the last selected process
-    tick_events = {}  # Dictionary to hold events for each tick
-
-    def calculate_total_tickets():
-        # Only active processes are considered for ticket assignment
-        return sum(max(1, 10 - p.remaining_burst_time) for p in active_processes if p.arrival_time <= current_time)
-    
-    while current_time < time_units:
-        total_tickets = calculate_total_tickets()
-        current_process = None
+    ticket_index = TicketIndex(len(processes))  # Tickets of the arrived, active (not finished) processes
+    last_selected_process = None  # Tracks the id of the last selected process
+
+    # Process ids by arrival time, processes arriving together stay in process list order
+    arrival_order = sorted(range(len(processes)), key=lambda i: processes[i].arrival_time)
+    next_arrival = 0
+    total_processes = len(arrival_order)
+
+    if state:
+        current_time = state["current_time"]
+        ticket_index = state["ticket_index"]
+        last_selected_process = state["last_selected_process"]
+        next_arrival = state["next_arrival"]
 
-        # Initialize the list of events for the current tick if not already initialized
-        if current_time not in tick_events:
-            tick_events[current_time] = []
+    # Hot-path counters, the other ones are derived from them at the end
+    start_time, start_arrival = current_time, next_arrival
+    draws = switches = idle_jumps = idle_ticks = 0
+    uniforms = []  # Batch of draws from 'rng', consumed from the end
 
+    # Processes that arrived before the start of the simulation hold tickets from the start
+    while next_arrival < total_processes and processes[arrival_order[next_arrival]].arrival_time < current_time:
+        process_id = arrival_order[next_arrival]
+        ticket_index.set_tickets(process_id, process_tickets(processes[process_id]))
+        next_arrival += 1
+
+    while current_time < time_units:
         # Check and log arrivals at the current time
-        for process in processes:
-            if process.arrival_time == current_time:
-                tick_events[current_time].append(f"Time {current_time} : {process.name} arrived")
-
-        if total_tickets > 0:
-            lottery = random.randint(1, total_tickets)
-            current_ticket = 0
-
-            # Lottery selection process
-            for process in active_processes:
-                if process.arrival_time <= current_time:
-                    current_ticket += max(1, 10 - process.remaining_burst_time)
-                    if current_ticket >= lottery:
-                        current_process = process
-                        break
-
-            # Process execution and logging
-            if current_process:
-                if current_process.remaining_burst_time > 0:
-                    if last_selected_process != current_process:
-                        if current_process.response_time == -1:
-                            current_process.response_time = 0  # Set response time to 0 if it is -1
-                        tick_events[current_time].append(f"Time {current_time} : {current_process.name} selected (burst {max(0, current_process.remaining_burst_time)})")
-                    last_selected_process = current_process
-
-                    current_process.remaining_burst_time -= 1
-
-                    # Log when a process finishes
-                    if current_process.remaining_burst_time == 0:
-                        current_process.set_finish_time(current_time + 1)
-                        tick_events[current_time + 1] = tick_events.get(current_time + 1, []) + [f"Time {current_time + 1} : {current_process.name} finished"]
-                        active_processes.remove(current_process)  # Remove finished process from active list
-                        last_selected_process = None  # Reset last selected process as it has finished
+        while next_arrival < total_processes and processes[arrival_order[next_arrival]].arrival_time == current_time:
+            process_id = arrival_order[next_arrival]
+            ticket_index.set_tickets(process_id, process_tickets(processes[process_id]))
+            yield (current_time, EVENT_ARRIVED, process_id, 0)
+            next_arrival += 1
+
+        if ticket_index.total == 0:
+            # Nothing is runnable, the CPU stays idle until the next arrival
+            if next_arrival < total_processes:
+                idle_until = min(processes[arrival_order[next_arrival]].arrival_time, time_units)
+            else:
+                idle_until = time_units
+            idle_jumps += 1
+            idle_ticks += idle_until - current_time
+            yield (current_time, EVENT_IDLE, -1, idle_until - current_time)
+            current_time = idle_until
+            continue
+
+        # Lottery selection process
+        if rng is None:
+            lottery = random.randint(1, ticket_index.total)
         else:
-            # Log idle without conditionally checking other events
-            tick_events[current_time].append(f"Time {current_time} : Idle")
+            if not uniforms:
+                uniforms = rng.random(LOTTERY_DRAW_BATCH).tolist()
+            lottery = int(uniforms.pop() * ticket_index.total) + 1
+        current_id = ticket_index.draw(lottery)
+        current_process = processes[current_id]
+        draws += 1
+
+        # Process execution and logging
+        if current_process.remaining_burst_time > 0:
+            if last_selected_process != current_id:
+                # The first selection is the start of the process, its response time is measured to it
+                current_process.set_start_time(current_time)
+                switches += 1
+                yield (current_time, EVENT_SELECTED, current_id, max(0, current_process.remaining_burst_time))
+            last_selected_process = current_id
+
+            current_process.remaining_burst_time -= 1
+
+            # Log when a process finishes
+            if current_process.remaining_burst_time == 0:
+                current_process.set_finish_time(current_time + 1)
+                yield (current_time + 1, EVENT_FINISHED, current_id, 0)
+                ticket_index.set_tickets(current_id, 0)  # Finished processes hold no tickets
+                last_selected_process = None  # Reset last selected process as it has finished
+            else:
+                ticket_index.set_tickets(current_id, process_tickets(current_process))
 
         current_time += 1
-    
-    # Compile events from tick_events dictionary into event_log list
-    for time in sorted(tick_events.keys()):
-        event_log.extend(tick_events[time])
 
-    return event_log
\ No newline at end of file
+    if state is not None:
+        state.update(current_time=current_time, ticket_index=ticket_index,
+                     last_selected_process=last_selected_process, next_arrival=next_arrival)
+
+    if counters is not None:
+        # Every arrival and every draw updates the tickets of one process
+        counters.update(loop_iterations=draws + idle_jumps, context_switches=switches, lottery_draws=draws,
+                        ticket_updates=next_arrival - start_arrival + draws, idle_ticks=idle_ticks,
+                        simulated_ticks=current_time - start_time)
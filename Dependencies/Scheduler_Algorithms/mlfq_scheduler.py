@@ -0,0 +1,171 @@
+from array import array
+from collections import deque
+
+from Dependencies.event_log import *
+
+
+# Index of the lowest set bit of a non-zero bitmap, the highest priority level with a ready process
+def find_first_set(bitmap):
+    return (bitmap & -bitmap).bit_length() - 1
+
+
+# Priority boost, moves every queued process back to the highest level and returns the new bitmap
+def boost_levels(ready_queues, quantum_used):
+    for level in range(1, len(ready_queues)):
+        for process_id in ready_queues[level]:
+            quantum_used[process_id] = 0
+        ready_queues[0].extend(ready_queues[level])
+        ready_queues[level].clear()
+    return 1 if ready_queues[0] else 0
+
+
+# Multilevel Feedback Queue Scheduler Algorithm
+def mlfq_scheduler(process_list, run_for, quanta, boost_period=0):
+    """
+    Simulate the Multilevel Feedback Queue (MLFQ) scheduling algorithm.
+
+    Parameters:
+    process_list (list of Process): List of processes to be scheduled.
+    run_for (int): Total time units to run the simulation.
+    quanta (tuple of int): Time slice of each level, highest priority first.
+    boost_period (int): Time units between two priority boosts, 0 for no boost.
+
+    Returns:
+    EventLog: Event log detailing the scheduling process.
+    """
+    return EventLog.collect(process_list, mlfq_events(process_list, run_for, quanta, boost_period))
+
+
+# Generator version of the Multilevel Feedback Queue Scheduler Algorithm
+def mlfq_events(process_list, run_for, quanta, boost_period=0, state=None):
+    """
+    Simulate the Multilevel Feedback Queue (MLFQ) scheduling algorithm, yielding the events as
+    they happen. The process metrics are complete once the generator is exhausted.
+
+    New processes enter the highest priority level. The highest non-empty level runs first and
+    its processes share the CPU in Round-Robin with the quantum of the level. A process that uses
+    up its quantum moves down one level, and a process preempted by a higher priority arrival
+    keeps its level and the rest of its quantum. Every 'boost_period' time units all the
+    processes move back to the highest level, exactly at the boost time: the time slice of a
+    process below the highest level ends at the boost, and a boost due while a process of the
+    highest level runs is applied between the arrivals of that time slice.
+
+    The non-empty levels are kept in a bitmap, so the next level to run is found with a single
+    find-first-set whatever the number of queued processes.
+
+    Parameters:
+    process_list (list of Process): List of processes to be scheduled.
+    run_for (int): Total time units to run the simulation.
+    quanta (tuple of int): Time slice of each level, highest priority first.
+    boost_period (int): Time units between two priority boosts, 0 for no boost.
+    state (dict): Optional scheduler state. The state of a checkpointed simulation is resumed from
+    it when it is not empty, and the state at the end of the simulation is stored in it.
+
+    Yields:
+    tuple: Event record (time, kind, process id, value), see EventLog.
+    """
+    current_time = 0
+    lowest_level = len(quanta) - 1
+    ready_queues = [deque() for _ in quanta]        # Ready queue of process ids of each level
+    ready_levels = 0                                # Bit i is set when the queue of level i is not empty
+    quantum_used = [0] * len(process_list)          # Part of the quantum of its level each process used
+    next_boost = boost_period if boost_period > 0 else None
+
+    # Sort process ids by arrival time, arrivals are consumed through an index cursor
+    arrival_order = sorted(range(len(process_list)), key=lambda i: process_list[i].arrival_time)
+    next_arrival = 0
+    total_processes = len(arrival_order)
+
+    if state:
+        current_time = state["current_time"]
+        for ready_queue, queued in zip(ready_queues, state["ready_queues"]):
+            ready_queue.extend(queued)
+        ready_levels = state["ready_levels"]
+        quantum_used = state["quantum_used"]
+        next_boost = state["next_boost"]
+        next_arrival = state["next_arrival"]
+
+    while current_time < run_for and (next_arrival < total_processes or ready_levels):
+
+        # New processes enter the highest level
+        while next_arrival < total_processes and process_list[arrival_order[next_arrival]].arrival_time <= current_time:
+            process_id = arrival_order[next_arrival]
+            next_arrival += 1
+            ready_queues[0].append(process_id)
+            ready_levels |= 1
+            yield (current_time, EVENT_ARRIVED, process_id, 0)
+
+        # Priority boost, every process goes back to the highest level
+        if next_boost is not None and current_time >= next_boost:
+            ready_levels = boost_levels(ready_queues, quantum_used)
+            next_boost = (current_time // boost_period + 1) * boost_period
+
+        if not ready_levels:
+            # If no process is ready, CPU is idle until the next arrival
+            idle_until = min(process_list[arrival_order[next_arrival]].arrival_time, run_for)
+            yield (current_time, EVENT_IDLE, -1, idle_until - current_time)
+            current_time = idle_until
+            continue
+
+        # Get the next process from the highest non-empty level
+        level = find_first_set(ready_levels)
+        current_id = ready_queues[level].popleft()
+        if not ready_queues[level]:
+            ready_levels &= ~(1 << level)
+        current_process = process_list[current_id]
+
+        # Log process selection
+        current_process.set_start_time(current_time)
+        yield (current_time, EVENT_SELECTED, current_id, current_process.remaining_burst_time)
+
+        # The process runs for the rest of its quantum, unless it finishes first, or a new process
+        # arrives in a higher level or a boost moves it back to the highest level
+        slice_end = current_time + min(quanta[level] - quantum_used[current_id], current_process.remaining_burst_time)
+        if level > 0 and next_arrival < total_processes:
+            slice_end = min(slice_end, process_list[arrival_order[next_arrival]].arrival_time)
+        if level > 0 and next_boost is not None:
+            slice_end = min(slice_end, next_boost)
+        execution_time = slice_end - current_time
+        current_time = slice_end
+        current_process.remaining_burst_time -= execution_time
+        quantum_used[current_id] += execution_time
+
+        # Processes arriving during the time slice are queued at their own arrival time, and the
+        # boosts due during the time slice happen at their own time between them
+        while next_arrival < total_processes and process_list[arrival_order[next_arrival]].arrival_time <= current_time:
+            process_id = arrival_order[next_arrival]
+            arrival_time = process_list[process_id].arrival_time
+            while next_boost is not None and next_boost < arrival_time:
+                ready_levels = boost_levels(ready_queues, quantum_used)
+                next_boost += boost_period
+            next_arrival += 1
+            ready_queues[0].append(process_id)
+            ready_levels |= 1
+            yield (arrival_time, EVENT_ARRIVED, process_id, 0)
+        while next_boost is not None and next_boost < current_time:
+            ready_levels = boost_levels(ready_queues, quantum_used)
+            next_boost += boost_period
+
+        # Log process completion, move the process down a level if it used up its quantum, or
+        # put it back at the front of its level if it was preempted
+        if current_process.remaining_burst_time == 0:
+            current_process.set_finish_time(current_time)
+            yield (current_time, EVENT_FINISHED, current_id, 0)
+            continue
+        if quantum_used[current_id] == quanta[level]:
+            quantum_used[current_id] = 0
+            level = min(level + 1, lowest_level)
+            ready_queues[level].append(current_id)
+        else:
+            ready_queues[level].appendleft(current_id)
+        ready_levels |= 1 << level
+
+    # Fill the remaining time with idle events if simulation time is not exhausted
+    if current_time < run_for:
+        yield (current_time, EVENT_IDLE, -1, run_for - current_time)
+
+    if state is not None:
+        state.update(current_time=max(current_time, run_for),
+                     ready_queues=[array("q", ready_queue) for ready_queue in ready_queues],
+                     ready_levels=ready_levels, quantum_used=quantum_used, next_boost=next_boost,
+                     next_arrival=next_arrival)
@@ -1,5 +1,11 @@
+from array import array
+from collections import deque
+from itertools import islice
+
+from Dependencies.event_log import *
+
 # Round-Robin Scheduler Algorithm
-def round_robin_scheduler(process_list, run_for, quantum):
+def round_robin_scheduler(process_list, run_for, quantum, counters=None):
     """
     Simulate the Round Robin scheduling algorithm.
     
@@ -7,72 +13,164 @@ def round_robin_scheduler(process_list, run_for, quantum):
     process_list (list of Process): List of processes to be scheduled.
     run_for (int): Total time units to run the simulation.
     quantum (int): Time slice for Round Robin scheduling.
+    counters (dict): Optional, the hot-path counters of the simulation are stored in it.
 
     Returns:
-    list of str: Event log detailing the scheduling process.
+    EventLog: Event log detailing the scheduling process.
+    """
+    return EventLog.collect(process_list, round_robin_events(process_list, run_for, quantum, counters=counters))
+
+
+# Generator version of the Round-Robin Scheduler Algorithm
+def round_robin_events(process_list, run_for, quantum, state=None, counters=None):
+    """
+    Simulate the Round Robin scheduling algorithm, yielding the events as they happen.
+    The process metrics are complete once the generator is exhausted.
+    
+    Parameters:
+    process_list (list of Process): List of processes to be scheduled.
+    run_for (int): Total time units to run the simulation.
+    quantum (int): Time slice for Round Robin scheduling.
+    state (dict): Optional scheduler state. The state of a checkpointed simulation is resumed from
+    it when it is not empty, and the state at the end of the simulation is stored in it.
+    counters (dict): Optional, the hot-path counters of the simulation (loop iterations, context
+    switches, queue pushes and pops, idle and simulated ticks) are stored in it once the generator
+    is exhausted. They are plain local counts, so leaving them out costs nothing.
+
+    Yields:
+    tuple: Event record (time, kind, process id, value), see EventLog.
+    """
+    arrivals = iter(sorted(range(len(process_list)), key=lambda i: process_list[i].arrival_time))
+    return round_robin_arrival_events(process_list, arrivals, run_for, quantum, state, counters)
+
+
+# Online version of the Round-Robin Scheduler Algorithm
+def online_round_robin_events(arrivals, run_for, quantum, live):
+    """
+    Simulate the Round Robin scheduling algorithm on a stream of arrivals, yielding the events as
+    they happen. The processes are read from the stream only when the simulation reaches their
+    arrival time, so the stream can be a pipe that is still being written.
+
+    Only the processes that have arrived and not finished are kept. They are stored in 'live'
+    under the id of their event records, and a process leaves it once its finish event has been
+    consumed, so the metrics of a finished process must be read when its finish event is received.
+
+    Parameters:
+    arrivals (iterable of Process): The processes, in arrival order.
+    run_for (int): Total time units to run the simulation, None to run until the stream ends and every process finished.
+    quantum (int): Time slice for Round Robin scheduling.
+    live (dict): Filled with the processes in the system, by process id. Once the generator is
+    exhausted it holds the processes that did not finish, with the next process read from the
+    stream if it never arrived.
+
+    Yields:
+    tuple: Event record (time, kind, process id, value), see EventLog.
+    """
+    return round_robin_arrival_events(live, stream_process_ids(arrivals, live), run_for, quantum,
+                                      forget_finished=True)
+
+
+# Round-Robin engine shared by the batch and the online versions
+def round_robin_arrival_events(process_list, arrivals, run_for, quantum, state=None, counters=None,
+                               forget_finished=False):
+    """
+    Simulate the Round Robin scheduling algorithm on the processes of an arrival iterator. The
+    iterator is read one process ahead of the simulation, so it can be a stream still being written.
+
+    Parameters:
+    process_list (list of Process): The processes by process id (a list, ProcessTable or dict).
+    arrivals (iterator of int): Ids of the processes, in arrival order.
+    run_for (int): Total time units to run the simulation, None to run until the arrivals end and every process finished.
+    quantum (int): Time slice for Round Robin scheduling.
+    state (dict): Optional scheduler state, see round_robin_events. The arrivals restart from the
+    first process, the ones that already arrived are skipped.
+    counters (dict): Optional, the hot-path counters of the simulation, see round_robin_events.
+    forget_finished (bool): Whether a process is removed from process_list once its finish event was consumed.
+
+    Yields:
+    tuple: Event record (time, kind, process id, value), see EventLog.
     """
     current_time = 0                                # Initialize the current time
-    event_log = []                                  # Initialize the event log
-    ready_queue = []                                # Initialize the ready queue
+    ready_queue = deque()                           # Initialize the ready queue of process ids
+    next_arrival = 0                                # Number of processes that arrived
+    end_time = float("inf") if run_for is None else run_for
+
+    if state:
+        current_time = state["current_time"]
+        ready_queue.extend(state["ready_queue"])
+        next_arrival = state["next_arrival"]
+        arrivals = islice(arrivals, next_arrival, None)
+
+    # Next process to arrive, read ahead of its arrival, with its arrival time
+    upcoming = next(arrivals, None)
+    upcoming_time = end_time if upcoming is None else process_list[upcoming].arrival_time
 
-    # Sort processes by arrival time
-    process_queue = sorted(process_list, key=lambda p: p.arrival_time)
+    # Hot-path counters, the other ones are derived from them at the end
+    start_time, start_arrival, start_queued = current_time, next_arrival, len(ready_queue)
+    dispatches = idle_jumps = idle_ticks = 0
 
-    while current_time < run_for and (process_queue or ready_queue):
+    while current_time < end_time and (upcoming is not None or ready_queue):
 
         # Add processes to the ready queue as they arrive
-        while process_queue and process_queue[0].arrival_time <= current_time:
-            process = process_queue.pop(0)
-            ready_queue.append(process)
-            event_log.append(f"Time {current_time} : {process.name} arrived")
+        while upcoming is not None and upcoming_time <= current_time:
+            ready_queue.append(upcoming)
+            yield (current_time, EVENT_ARRIVED, upcoming, 0)
+            next_arrival += 1
+            upcoming = next(arrivals, None)
+            upcoming_time = end_time if upcoming is None else process_list[upcoming].arrival_time
 
         if not ready_queue:
-            # If no process is ready, CPU is idle
-            event_log.append(f"Time {current_time} : Idle")
-            current_time += 1
+            # If no process is ready, CPU is idle until the next arrival
+            idle_until = min(upcoming_time, end_time)
+            idle_jumps += 1
+            idle_ticks += idle_until - current_time
+            yield (current_time, EVENT_IDLE, -1, idle_until - current_time)
+            current_time = idle_until
             continue
 
         # Get the next process from the ready queue
-        current_process = ready_queue.pop(0)
+        current_id = ready_queue.popleft()
+        current_process = process_list[current_id]
+        dispatches += 1
         
         # Log process selection
         if current_process.start_time == -1:
             current_process.set_start_time(current_time)
-        event_log.append(f"Time {current_time} : {current_process.name} selected (burst {current_process.remaining_burst_time})")
+        yield (current_time, EVENT_SELECTED, current_id, current_process.remaining_burst_time)
         
         # Determine the time slice for the current process
         execution_time = min(quantum, current_process.remaining_burst_time)
+        current_time += execution_time
+        current_process.remaining_burst_time -= execution_time
 
-        # Simulate the execution of the process in smaller time increments to check for new arrivals
-        for _ in range(execution_time):
-            current_time += 1
-            current_process.remaining_burst_time -= 1
-
-            # Check for new arrivals during the execution
-            while process_queue and process_queue[0].arrival_time <= current_time:
-                process = process_queue.pop(0)
-                ready_queue.append(process)
-                event_log.append(f"Time {current_time} : {process.name} arrived")
-
-            if current_process.remaining_burst_time == 0:
-                break
+        # Processes arriving during the time slice are queued at their own arrival time
+        while upcoming is not None and upcoming_time <= current_time:
+            ready_queue.append(upcoming)
+            yield (upcoming_time, EVENT_ARRIVED, upcoming, 0)
+            next_arrival += 1
+            upcoming = next(arrivals, None)
+            upcoming_time = end_time if upcoming is None else process_list[upcoming].arrival_time
         
         # Log process completion or re-queue if not finished
         if current_process.remaining_burst_time == 0:
             current_process.set_finish_time(current_time)
-            event_log.append(f"Time {current_time} : {current_process.name} finished")
+            yield (current_time, EVENT_FINISHED, current_id, 0)
+            if forget_finished:
+                del process_list[current_id]
         else:
-            ready_queue.append(current_process)
-        
-        # Check for new arrivals at the end of the time slice
-        while process_queue and process_queue[0].arrival_time <= current_time:
-            process = process_queue.pop(0)
-            ready_queue.append(process)
-            event_log.append(f"Time {current_time} : {process.name} arrived")
+            ready_queue.append(current_id)
 
     # Fill the remaining time with idle events if simulation time is not exhausted
-    while current_time < run_for:
-        event_log.append(f"Time {current_time} : Idle")
-        current_time += 1
+    if run_for is not None and current_time < run_for:
+        idle_ticks += run_for - current_time
+        yield (current_time, EVENT_IDLE, -1, run_for - current_time)
+    simulated_until = current_time if run_for is None else max(current_time, run_for)
+
+    if state is not None:
+        state.update(current_time=simulated_until, ready_queue=array("q", ready_queue), next_arrival=next_arrival)
 
-    return event_log
\ No newline at end of file
+    if counters is not None:
+        # Every dispatch pops the queue once, so the pushes are what is left in the queue plus the pops
+        counters.update(loop_iterations=dispatches + idle_jumps, context_switches=dispatches,
+                        queue_pushes=len(ready_queue) - start_queued + dispatches, queue_pops=dispatches,
+                        idle_ticks=idle_ticks, simulated_ticks=simulated_until - start_time)
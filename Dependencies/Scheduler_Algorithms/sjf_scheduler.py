@@ -1,68 +1,174 @@
 import heapq
+from itertools import islice
 
-# Function for the SJF Scheduler Algorithm  
-def preemptive_sjf_scheduler(process_list, run_for):
+from Dependencies.event_log import *
+
+# Function for the SJF Scheduler Algorithm
+def preemptive_sjf_scheduler(process_list, run_for, counters=None):
     """
     Simulate the Preemptive Shortest Job First (SJF) scheduling algorithm, ensuring proper event order.
-    
+
     Parameters:
     process_list (list of Process): List of processes to be scheduled.
     run_for (int): Total time units to run the simulation.
+    counters (dict): Optional, the hot-path counters of the simulation are stored in it.
 
     Returns:
-    list of str: Event log detailing the scheduling process.
+    EventLog: Event log detailing the scheduling process.
+    """
+    return EventLog.collect(process_list, preemptive_sjf_events(process_list, run_for, counters=counters))
+
+
+# Generator version of the SJF Scheduler Algorithm
+def preemptive_sjf_events(process_list, run_for, state=None, counters=None):
+    """
+    Simulate the Preemptive Shortest Job First (SJF) scheduling algorithm, yielding the events
+    in time order as they happen. The process metrics are complete once the generator is exhausted.
+
+    The simulation is event driven: under SJF a running process can only be preempted when a new
+    process arrives, so the current process runs straight to the next arrival, its completion or
+    the end of the simulation, whichever comes first. The cost grows with the number of events
+    instead of with 'run_for'.
+
+    Parameters:
+    process_list (list of Process): List of processes to be scheduled.
+    run_for (int): Total time units to run the simulation.
+    state (dict): Optional scheduler state. The state of a checkpointed simulation is resumed from
+    it when it is not empty, and the state at the end of the simulation is stored in it.
+    counters (dict): Optional, the hot-path counters of the simulation (loop iterations, context
+    switches, heap pushes, pops and push-pops, idle and simulated ticks) are stored in it once the
+    generator is exhausted. They are plain local counts, so leaving them out costs nothing.
+
+    Yields:
+    tuple: Event record (time, kind, process id, value), see EventLog.
+    """
+    arrivals = iter(sorted(range(len(process_list)), key=lambda i: process_list[i].arrival_time))
+    return preemptive_sjf_arrival_events(process_list, arrivals, run_for, state, counters)
+
+
+# Online version of the SJF Scheduler Algorithm
+def online_preemptive_sjf_events(arrivals, run_for, live):
+    """
+    Simulate the Preemptive Shortest Job First (SJF) scheduling algorithm on a stream of arrivals,
+    yielding the events in time order as they happen. The processes are read from the stream only
+    when the simulation reaches their arrival time, see online_round_robin_events for how the
+    processes in the system are kept in 'live'.
+
+    Parameters:
+    arrivals (iterable of Process): The processes, in arrival order.
+    run_for (int): Total time units to run the simulation, None to run until the stream ends and every process finished.
+    live (dict): Filled with the processes in the system, by process id, see online_round_robin_events.
+
+    Yields:
+    tuple: Event record (time, kind, process id, value), see EventLog.
+    """
+    return preemptive_sjf_arrival_events(live, stream_process_ids(arrivals, live), run_for, forget_finished=True)
+
+
+# SJF engine shared by the batch and the online versions
+def preemptive_sjf_arrival_events(process_list, arrivals, run_for, state=None, counters=None, forget_finished=False):
+    """
+    Simulate the Preemptive Shortest Job First (SJF) scheduling algorithm on the processes of an
+    arrival iterator, see preemptive_sjf_events. The iterator is read one process ahead of the
+    simulation, so it can be a stream still being written.
+
+    Parameters:
+    process_list (list of Process): The processes by process id (a list, ProcessTable or dict).
+    arrivals (iterator of int): Ids of the processes, in arrival order.
+    run_for (int): Total time units to run the simulation, None to run until the arrivals end and every process finished.
+    state (dict): Optional scheduler state, see preemptive_sjf_events. The arrivals restart from
+    the first process, the ones that already arrived are skipped.
+    counters (dict): Optional, the hot-path counters of the simulation, see preemptive_sjf_events.
+    forget_finished (bool): Whether a process is removed from process_list once its finish event was consumed.
+
+    Yields:
+    tuple: Event record (time, kind, process id, value), see EventLog.
     """
     current_time = 0
-    tick_events = {}  # Dictionary to store events by tick
-    ready_queue = []  # Initialize the ready queue as a min-heap
+    ready_queue = []  # Min-heap of (remaining burst, name, process id)
+    current_entry = None  # Heap entry of the process holding the CPU
     last_process = None  # Track the last process that was running
+    next_arrival = 0  # Number of processes that arrived
+    end_time = float("inf") if run_for is None else run_for
 
-    heapq.heapify(ready_queue)
-    process_queue = sorted(process_list, key=lambda p: p.arrival_time)
+    if state:
+        current_time = state["current_time"]
+        ready_queue = state["ready_queue"]
+        current_entry = state["current_entry"]
+        last_process = state["last_process"]
+        next_arrival = state["next_arrival"]
+        arrivals = islice(arrivals, next_arrival, None)
 
-    while current_time < run_for:
-        if current_time not in tick_events:
-            tick_events[current_time] = []
+    # Next process to arrive, read ahead of its arrival, with its arrival time
+    upcoming = next(arrivals, None)
+    upcoming_time = end_time if upcoming is None else process_list[upcoming].arrival_time
 
-        # Check and handle arrivals first to ensure they are logged before finishes
-        while process_queue and process_queue[0].arrival_time <= current_time:
-            process = process_queue.pop(0)
-            heapq.heappush(ready_queue, (process.remaining_burst_time, process))
-            tick_events[current_time].append(f"Time {current_time} : {process.name} arrived")
+    # Hot-path counters, the other ones are derived from them at the end
+    start_time, start_arrival = current_time, next_arrival
+    iterations = switches = heap_pops = heap_pushpops = idle_ticks = 0
 
-        if not ready_queue:
-            tick_events[current_time].append(f"Time {current_time} : Idle")
-            current_time += 1
-            continue
+    # Without a 'runfor' the simulation ends once the arrivals ended and every process finished
+    while current_time < end_time and (run_for is not None or upcoming is not None or ready_queue
+                                       or current_entry is not None):
+        iterations += 1
+
+        # Check and handle arrivals at the current time
+        while upcoming is not None and upcoming_time <= current_time:
+            process = process_list[upcoming]
+            heapq.heappush(ready_queue, (process.remaining_burst_time, process.name, upcoming))
+            yield (current_time, EVENT_ARRIVED, upcoming, 0)
+            next_arrival += 1
+            upcoming = next(arrivals, None)
+            upcoming_time = end_time if upcoming is None else process_list[upcoming].arrival_time
 
-        # Process the queue and handle execution
-        _, current_process = heapq.heappop(ready_queue)
+        # Time of the next event that may change the scheduling decision
+        next_event_time = min(upcoming_time, end_time)
+
+        # Let the running process compete with the ready queue, keeping the shortest one
+        if current_entry is not None:
+            if ready_queue and ready_queue[0] < current_entry:
+                current_entry = heapq.heappushpop(ready_queue, current_entry)
+                heap_pushpops += 1
+        elif ready_queue:
+            current_entry = heapq.heappop(ready_queue)
+            heap_pops += 1
+        else:
+            # Nothing to run until the next arrival, the CPU stays idle
+            idle_ticks += next_event_time - current_time
+            yield (current_time, EVENT_IDLE, -1, next_event_time - current_time)
+            current_time = next_event_time
+            continue
 
-        if last_process != current_process:
+        current_id = current_entry[2]
+        current_process = process_list[current_id]
+        if last_process != current_id:
             if current_process.start_time == -1:
                 current_process.start_time = current_time
             current_process.response_time = max(current_process.response_time, current_time - current_process.arrival_time)
-            tick_events[current_time].append(f"Time {current_time} : {current_process.name} selected (burst {current_process.remaining_burst_time})")
-        last_process = current_process
+            switches += 1
+            yield (current_time, EVENT_SELECTED, current_id, current_process.remaining_burst_time)
+        last_process = current_id
 
-        # Simulate execution for 1 time unit
-        current_time += 1
-        if current_time not in tick_events:
-            tick_events[current_time] = []
-        current_process.remaining_burst_time -= 1
+        # Run the process until it finishes or the next event happens
+        execution_time = min(current_process.remaining_burst_time, next_event_time - current_time)
+        current_time += execution_time
+        current_process.remaining_burst_time -= execution_time
 
-        # Check for completion within the same tick
         if current_process.remaining_burst_time == 0:
             current_process.set_finish_time(current_time)
-            tick_events[current_time].append(f"Time {current_time} : {current_process.name} finished")
+            yield (current_time, EVENT_FINISHED, current_id, 0)
+            if forget_finished:
+                del process_list[current_id]
+            current_entry = None
             last_process = None
         else:
-            # Re-add the process to the ready queue
-            heapq.heappush(ready_queue, (current_process.remaining_burst_time, current_process))
+            current_entry = (current_process.remaining_burst_time, current_process.name, current_id)
 
-    # Compile the final event log from the tick_events dictionary
-    event_log = []
-    for time in sorted(tick_events.keys()):
-        event_log.extend(tick_events[time])
+    if state is not None:
+        state.update(current_time=current_time, ready_queue=ready_queue, current_entry=current_entry,
+                     last_process=last_process, next_arrival=next_arrival)
 
-    return event_log
\ No newline at end of file
+    if counters is not None:
+        counters.update(loop_iterations=iterations, context_switches=switches,
+                        heap_pushes=next_arrival - start_arrival, heap_pops=heap_pops, heap_pushpops=heap_pushpops,
+                        idle_ticks=idle_ticks, simulated_ticks=current_time - start_time)
@@ -0,0 +1,220 @@
+import heapq
+from collections import deque
+
+from Dependencies.event_log import *
+
+# Algorithms that can be simulated on several CPUs
+SMP_ALGORITHMS = ("fcfs", "sjf", "rr")
+
+
+# Simulated CPU of the multiprocessor scheduler
+class CPU:
+    __slots__ = ("cpu_id", "run_queue", "current", "slice_start", "slice_end", "busy_time", "dispatches", "steals")
+
+    def __init__(self, cpu_id):
+        """
+        Initializes an idle CPU with an empty run queue. The statistics are filled in by the
+        scheduler while it runs, like the metrics of the processes.
+
+        :param cpu_id: Index of the CPU, starting at 0
+        """
+        self.cpu_id = cpu_id
+        self.run_queue = None                       # Run queue of the CPU, its type depends on the algorithm
+        self.current = -1                           # Id of the process running on the CPU, -1 when idle
+        self.slice_start = 0                        # Time at which the running process was dispatched
+        self.slice_end = 0                          # Time at which the running process gives up the CPU
+        self.busy_time = 0                          # Total time spent running processes
+        self.dispatches = 0                         # Number of processes dispatched on the CPU
+        self.steals = 0                             # Number of processes stolen from other run queues
+
+    def load(self):
+        """
+        :return: Number of processes queued on or running on the CPU
+        """
+        return len(self.run_queue) + (self.current != -1)
+
+    def utilization(self, run_for):
+        """
+        :param run_for: Total time units the simulation ran
+        :return: Fraction of the simulation the CPU spent running processes
+        """
+        return self.busy_time / run_for if run_for > 0 else 0.0
+
+
+# Multiprocessor version of the FCFS, SJF and Round-Robin Scheduler Algorithms
+def smp_scheduler(process_list, run_for, algorithm, quantum, cpus, work_stealing=True):
+    """
+    Simulate a scheduling algorithm on several CPUs.
+
+    Parameters:
+    process_list (list of Process): List of processes to be scheduled.
+    run_for (int): Total time units to run the simulation.
+    algorithm (str): One of SMP_ALGORITHMS.
+    quantum (int): Time slice for Round Robin scheduling (if applicable).
+    cpus (list of CPU): The simulated CPUs, their statistics are filled in.
+    work_stealing (bool): Whether idle CPUs steal processes from the other run queues.
+
+    Returns:
+    list of tuple: Event records (time, kind, process id, value, cpu id), see smp_events.
+    """
+    return list(smp_events(process_list, run_for, algorithm, quantum, cpus, work_stealing))
+
+
+# Generator version of the multiprocessor scheduler
+def smp_events(process_list, run_for, algorithm, quantum, cpus, work_stealing=True):
+    """
+    Simulate a scheduling algorithm on several CPUs, yielding the events in time order as they
+    happen. The process metrics and the CPU statistics are complete once the generator is exhausted.
+
+    Every CPU has its own run queue (a FIFO queue for fcfs and rr, a min-heap on the remaining
+    burst for sjf). An arriving process is placed on the least loaded CPU and stays there, except
+    when an idle CPU with an empty run queue steals the next process of the longest run queue.
+    Under sjf an arrival preempts the process running on its CPU if it is shorter. The simulation
+    is event driven, it only stops at arrivals and at the end of the time slices.
+
+    Parameters:
+    process_list (list of Process): List of processes to be scheduled.
+    run_for (int): Total time units to run the simulation.
+    algorithm (str): One of SMP_ALGORITHMS.
+    quantum (int): Time slice for Round Robin scheduling (if applicable).
+    cpus (list of CPU): The simulated CPUs, their statistics are filled in.
+    work_stealing (bool): Whether idle CPUs steal processes from the other run queues.
+
+    Yields:
+    tuple: Event record (time, kind, process id, value, cpu id). The kinds and values are the
+    ones of EventLog, the CPU of an arrival is the CPU it was placed on. Idle time is not
+    logged, it is reported as the utilization of each CPU.
+    """
+    shortest_job_first = algorithm == 'sjf'
+    round_robin = algorithm == 'rr'
+
+    # Run queue operations of the algorithm
+    if shortest_job_first:
+        def enqueue(cpu, process_id):
+            process = process_list[process_id]
+            heapq.heappush(cpu.run_queue, (process.remaining_burst_time, process.name, process_id))
+
+        def dequeue(cpu):
+            return heapq.heappop(cpu.run_queue)[2]
+    else:
+        def enqueue(cpu, process_id):
+            cpu.run_queue.append(process_id)
+
+        def dequeue(cpu):
+            return cpu.run_queue.popleft()
+
+    for cpu in cpus:
+        cpu.run_queue = [] if shortest_job_first else deque()
+
+    idle_cpus = set(range(len(cpus)))  # Ids of the CPUs running no process
+    slice_ends = []  # Min-heap of (end of the time slice, cpu id, process id), stale entries are skipped
+    queued = 0  # Number of processes waiting in all the run queues
+
+    # Stops the process running on a CPU, which finishes or is added to the list of expired processes
+    def stop_process(cpu, time, expired):
+        process_id = cpu.current
+        process = process_list[process_id]
+        process.remaining_burst_time -= time - cpu.slice_start
+        cpu.busy_time += time - cpu.slice_start
+        cpu.current = -1
+        idle_cpus.add(cpu.cpu_id)
+        if process.remaining_burst_time == 0:
+            process.set_finish_time(time)
+            yield (time, EVENT_FINISHED, process_id, 0, cpu.cpu_id)
+        else:
+            expired.append((cpu, process_id))
+
+    current_time = 0
+    arrival_order = sorted(range(len(process_list)), key=lambda i: process_list[i].arrival_time)
+    next_arrival = 0
+    total_processes = len(arrival_order)
+
+    while True:
+        # Time slices ending now. As on a single CPU, the expired processes go back to their run
+        # queue after the processes arriving at the same time
+        expired = []
+        while slice_ends and slice_ends[0][0] == current_time:
+            _, cpu_id, process_id = heapq.heappop(slice_ends)
+            cpu = cpus[cpu_id]
+            if cpu.current == process_id and cpu.slice_end == current_time:
+                yield from stop_process(cpu, current_time, expired)
+
+        if current_time >= run_for:
+            break
+
+        # Arrivals are placed on the least loaded CPU
+        while next_arrival < total_processes and process_list[arrival_order[next_arrival]].arrival_time <= current_time:
+            process_id = arrival_order[next_arrival]
+            next_arrival += 1
+            target = min(cpus, key=CPU.load)
+            enqueue(target, process_id)
+            queued += 1
+            yield (current_time, EVENT_ARRIVED, process_id, 0, target.cpu_id)
+
+            # A shorter arrival preempts the process running on its CPU
+            if shortest_job_first and target.current != -1:
+                process = process_list[process_id]
+                running = process_list[target.current]
+                running_remaining = running.remaining_burst_time - (current_time - target.slice_start)
+                if (process.remaining_burst_time, process.name) < (running_remaining, running.name):
+                    yield from stop_process(target, current_time, expired)
+
+        for cpu, process_id in expired:
+            enqueue(cpu, process_id)
+        queued += len(expired)
+
+        # Idle CPUs take the next process of their run queue, or steal one when it is empty
+        if queued and idle_cpus:
+            for cpu_id in sorted(idle_cpus):
+                cpu = cpus[cpu_id]
+                if cpu.run_queue:
+                    process_id = dequeue(cpu)
+                elif work_stealing:
+                    victim = max(cpus, key=lambda other: len(other.run_queue))
+                    process_id = dequeue(victim)
+                    cpu.steals += 1
+                else:
+                    continue
+
+                process = process_list[process_id]
+                process.set_start_time(current_time)
+                idle_cpus.discard(cpu_id)
+                queued -= 1
+                cpu.current = process_id
+                cpu.slice_start = current_time
+                cpu.dispatches += 1
+                if round_robin:
+                    cpu.slice_end = current_time + min(quantum, process.remaining_burst_time)
+                else:
+                    cpu.slice_end = current_time + process.remaining_burst_time
+                heapq.heappush(slice_ends, (cpu.slice_end, cpu_id, process_id))
+                yield (current_time, EVENT_SELECTED, process_id, process.remaining_burst_time, cpu_id)
+                if not queued:
+                    break
+
+        # Jump to the next arrival or the end of the next time slice
+        next_time = run_for
+        if next_arrival < total_processes:
+            next_time = min(next_time, process_list[arrival_order[next_arrival]].arrival_time)
+        while slice_ends and (cpus[slice_ends[0][1]].current != slice_ends[0][2]
+                              or cpus[slice_ends[0][1]].slice_end != slice_ends[0][0]):
+            heapq.heappop(slice_ends)  # Slice of a preempted process
+        if slice_ends and slice_ends[0][0] < next_time:
+            next_time = slice_ends[0][0]
+        current_time = next_time
+
+    # As on a single CPU, a time slice that started before the end of the simulation runs to its
+    # end under fcfs and rr, while sjf stops the running processes at 'run_for'. Only the busy time
+    # before 'run_for' counts towards the utilization
+    running_cpus = sorted((cpu for cpu in cpus if cpu.current != -1), key=lambda cpu: (cpu.slice_end, cpu.cpu_id))
+    for cpu in running_cpus:
+        process = process_list[cpu.current]
+        cpu.busy_time += run_for - cpu.slice_start
+        if shortest_job_first:
+            process.remaining_burst_time -= run_for - cpu.slice_start
+        else:
+            process.remaining_burst_time -= cpu.slice_end - cpu.slice_start
+            if process.remaining_burst_time == 0:
+                process.set_finish_time(cpu.slice_end)
+                yield (cpu.slice_end, EVENT_FINISHED, cpu.current, 0, cpu.cpu_id)
+        cpu.current = -1
@@ -0,0 +1,180 @@
+import argparse
+import contextlib
+import csv
+import glob
+import io
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+
+from Dependencies.main import run_input_file, run_smp_input_file
+from Dependencies.result_cache import DEFAULT_CACHE_SIZE, ResultCache
+from Dependencies.workload_file import WORKLOAD_EXTENSION
+
+"""
+This file contains the batch mode of the program. It runs many input files on a pool of worker
+processes, writes the usual '.out' file and HTML report for each of them and a consolidated
+summary of all the runs.
+
+Usage:
+    python3 -m Dependencies.batch <directory | glob | manifest | input file> ... [--workers N] [--summary file.csv]
+                                  [--no-output] [--no-html] [--cpus N] [--cache DIR] [--cache-size MB] [--seed N]
+
+A manifest is a text file listing one input file per line, relative to the manifest. Empty lines
+and lines starting with '#' are ignored.
+"""
+
+WORKLOAD_EXTENSIONS = (".in", WORKLOAD_EXTENSION)
+SUMMARY_FIELDS = ["input_file", "status", "algorithm", "processes", "finished",
+                  "average_wait", "average_turnaround", "average_response", "seconds"]
+
+
+def collect_input_files(sources):
+    """
+    Expands the sources given on the command line into a list of input files.
+
+    :param sources: Directories, glob patterns, manifests or input files
+    :return: Sorted list of input file paths, without duplicates
+    """
+    input_files = set()
+    for source in sources:
+        if os.path.isdir(source):
+            for extension in WORKLOAD_EXTENSIONS:
+                input_files.update(glob.glob(os.path.join(source, "*" + extension)))
+        elif os.path.isfile(source) and source.endswith(WORKLOAD_EXTENSIONS):
+            input_files.add(source)
+        elif os.path.isfile(source):
+            manifest_directory = os.path.dirname(source)
+            with open(source, 'r') as manifest:
+                for line in manifest:
+                    line = line.strip()
+                    if line and not line.startswith("#"):
+                        input_files.add(os.path.join(manifest_directory, line))
+        else:
+            input_files.update(path for path in glob.glob(source) if path.endswith(WORKLOAD_EXTENSIONS))
+    return sorted(input_files)
+
+
+def run_batch_item(input_file, write_output=True, write_html=True, cpu_count=1, cache_directory=None,
+                   cache_size=DEFAULT_CACHE_SIZE, seed=None):
+    """
+    Runs one input file in a worker process and summarizes the result of each of its algorithms.
+    Errors are reported in the summary instead of stopping the batch.
+
+    :param input_file: Path to the input file
+    :param write_output: Whether to write the '.out' file
+    :param write_html: Whether to write the HTML report
+    :param cpu_count: Number of simulated CPUs, runs on several CPUs write no HTML report
+    :param cache_directory: Directory of a result cache shared by the workers, None for no cache
+    :param cache_size: Size limit of the result cache, in bytes
+    :param seed: Seed of the random generator of every run
+    :return: List of dictionaries with the SUMMARY_FIELDS, one per algorithm of the input file
+    """
+    summary = dict.fromkeys(SUMMARY_FIELDS, "")
+    summary["input_file"] = input_file
+    start = time.perf_counter()
+    messages = io.StringIO()
+    try:
+        with contextlib.redirect_stdout(messages):
+            if cpu_count > 1:
+                results = [run_smp_input_file(input_file, cpu_count, write_output=write_output)[:4]]
+            else:
+                result_cache = ResultCache(cache_directory, cache_size) if cache_directory else None
+                results = run_input_file(input_file, write_output, write_html, result_cache=result_cache, seed=seed)
+    except SystemExit:
+        summary["status"] = messages.getvalue().strip() or "failed"
+    except Exception as error:
+        summary["status"] = f"Error: {error}"
+    else:
+        # The runs of an input file share its time, they all come from a single parse
+        summaries = []
+        for process_list, run_for, algorithm, quantum in results:
+            finished = [process for process in process_list if process.finish_time != -1]
+            summary = dict(summary, status="ok", algorithm=algorithm, processes=len(process_list),
+                           finished=len(finished))
+            if finished:
+                summary["average_wait"] = round(sum(p.waiting_time for p in finished) / len(finished), 3)
+                summary["average_turnaround"] = round(sum(p.turnaround_time for p in finished) / len(finished), 3)
+                summary["average_response"] = round(sum(p.response_time for p in finished) / len(finished), 3)
+            summaries.append(summary)
+        seconds = round(time.perf_counter() - start, 6)
+        return [dict(summary, seconds=seconds) for summary in summaries]
+    summary["seconds"] = round(time.perf_counter() - start, 6)
+    return [summary]
+
+
+def run_batch(input_files, workers=None, write_output=True, write_html=True, cpu_count=1, cache_directory=None,
+              cache_size=DEFAULT_CACHE_SIZE, seed=None):
+    """
+    Runs all the input files on a pool of worker processes.
+
+    :param input_files: List of input file paths
+    :param workers: Number of worker processes, defaults to the number of CPUs
+    :param write_output: Whether to write the '.out' files
+    :param write_html: Whether to write the HTML reports
+    :param cpu_count: Number of simulated CPUs of every run
+    :param cache_directory: Directory of a result cache shared by the workers, None for no cache
+    :param cache_size: Size limit of the result cache, in bytes
+    :param seed: Seed of the random generator of every run
+    :return: List of summaries, in the order of input_files and of the algorithms of each input file
+    """
+    workers = workers or os.cpu_count() or 1
+    # Small files are handed out in chunks so the pool overhead stays low with thousands of files
+    chunk_size = max(1, len(input_files) // (workers * 4))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        run_item = partial(run_batch_item, write_output=write_output, write_html=write_html, cpu_count=cpu_count,
+                           cache_directory=cache_directory, cache_size=cache_size, seed=seed)
+        return [summary for summaries in executor.map(run_item, input_files, chunksize=chunk_size)
+                for summary in summaries]
+
+
+def write_summary_file(summary_file, summaries):
+    """
+    Writes the summaries of a batch to a CSV file.
+
+    :param summary_file: Path of the CSV file
+    :param summaries: List of summaries returned by run_batch
+    """
+    with open(summary_file, 'w', newline='') as file:
+        writer = csv.DictWriter(file, fieldnames=SUMMARY_FIELDS)
+        writer.writeheader()
+        writer.writerows(summaries)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run many scheduler input files in parallel")
+    parser.add_argument("sources", nargs="+", help="directories, glob patterns, manifests or input files")
+    parser.add_argument("--workers", type=int, default=None, help="number of worker processes (default: number of CPUs)")
+    parser.add_argument("--summary", default="batch_summary.csv", help="consolidated summary file (CSV)")
+    parser.add_argument("--no-output", action="store_true", help="do not write the '.out' files")
+    parser.add_argument("--no-html", action="store_true", help="do not write the HTML reports")
+    parser.add_argument("--cpus", type=int, default=1, help="number of simulated CPUs (fcfs, sjf and rr only)")
+    parser.add_argument("--cache", help="directory of a result cache, identical workloads reuse its results")
+    parser.add_argument("--cache-size", type=int, default=DEFAULT_CACHE_SIZE >> 20, help="size limit of the result cache, in MiB")
+    parser.add_argument("--seed", type=int, help="seed of the random generator of every run (lottery)")
+    args = parser.parse_args()
+
+    input_files = collect_input_files(args.sources)
+    if not input_files:
+        print("Error: No input files found.")
+        sys.exit(1)
+
+    summaries = run_batch(input_files, args.workers, not args.no_output, not args.no_html, args.cpus,
+                          args.cache, args.cache_size << 20, args.seed)
+    write_summary_file(args.summary, summaries)
+
+    failed = [summary for summary in summaries if summary["status"] != "ok"]
+    print(f"{len(summaries) - len(failed)} of {len(summaries)} runs succeeded, summary written to {args.summary}")
+    if args.cache:
+        statistics = ResultCache(args.cache).statistics()
+        print(f"Result cache: {statistics['hits']} hits, {statistics['misses']} misses, {statistics['evictions']} evictions")
+    for summary in failed:
+        print(f"\t- {summary['input_file']}: {summary['status']}")
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+import os
+import pickle
+import random
+import sys
+from array import array
+
+from Dependencies.data_structure import *
+from Dependencies.write_output_file import *
+
+"""
+This file contains the checkpoints of the simulations. A checkpoint holds everything needed to
+carry a simulation on past its 'runfor': the processes with their metrics, the state of the
+scheduler (ready queues, current process, next arrival...), the state of the random generator
+and the output file the trace was written to. Resuming a checkpoint with a larger 'runfor'
+continues the simulation where it stopped and appends the new events to that output file.
+
+Checkpoints are pickle files, only resume checkpoints that you wrote yourself.
+"""
+
+CHECKPOINT_VERSION = 1
+
+
+def snapshot_processes(process_list):
+    """
+    Copies the processes and their metrics into a ProcessTable that owns all its columns, so it
+    can be stored even when the processes are views on a memory-mapped workload file.
+
+    :param process_list: List of Process (or ProcessTable) to copy
+    :return: The new ProcessTable
+    """
+    table = ProcessTable()
+    if isinstance(process_list, ProcessTable):
+        table.name_data = bytearray(process_list.name_data)
+        table.name_offsets = array("q")
+        table.name_offsets.frombytes(memoryview(process_list.name_offsets).cast("B"))
+        for column in PROCESS_TABLE_COLUMNS:
+            table.columns[column] = array("q")
+            table.columns[column].frombytes(memoryview(process_list.columns[column]).cast("B"))
+        return table
+
+    for process in process_list:
+        index = table.add_process(process.name, process.arrival_time, process.burst_time)
+        for column in PROCESS_TABLE_COLUMNS:
+            table.columns[column][index] = getattr(process, column)
+    return table
+
+
+def save_checkpoint(checkpoint_file, process_list, run_for, algorithm, quantum, state, output_file=None):
+    """
+    Writes the checkpoint of a simulation that ran until 'run_for'. The file is replaced
+    atomically, so an interrupted save never leaves a broken checkpoint behind.
+
+    :param checkpoint_file: Path of the checkpoint file to write
+    :param process_list: The processes of the simulation, with their metrics
+    :param run_for: Time units the simulation ran
+    :param algorithm: The scheduling algorithm used
+    :param quantum: Parameters of the algorithm, as returned by parse_input_file
+    :param state: Scheduler state filled in by the scheduler event generator
+    :param output_file: Output file holding the trace of the simulation, None if none was written
+    """
+    checkpoint = {
+        "version": CHECKPOINT_VERSION,
+        "processes": snapshot_processes(process_list),
+        "run_for": run_for,
+        "algorithm": algorithm,
+        "quantum": quantum,
+        "state": state,
+        "random_state": random.getstate(),
+        "output_file": None if output_file is None else os.path.abspath(output_file),
+    }
+    temporary_file = checkpoint_file + ".tmp"
+    with open(temporary_file, 'wb') as file:
+        pickle.dump(checkpoint, file, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(temporary_file, checkpoint_file)
+
+
+def load_checkpoint(checkpoint_file):
+    """
+    Reads a checkpoint file.
+
+    :param checkpoint_file: Path of the checkpoint file
+    :return: Dictionary with the processes, run_for, algorithm, quantum, state, random_state and output_file
+    """
+    try:
+        with open(checkpoint_file, 'rb') as file:
+            checkpoint = pickle.load(file)
+    except FileNotFoundError:
+        print("Error: Checkpoint file not found.")
+        sys.exit(1)
+    except (pickle.UnpicklingError, EOFError, AttributeError, ImportError):
+        print("Error: Invalid checkpoint file.")
+        sys.exit(1)
+
+    if not isinstance(checkpoint, dict) or checkpoint.get("version") != CHECKPOINT_VERSION:
+        print("Error: Invalid checkpoint file.")
+        sys.exit(1)
+    return checkpoint
+
+
+def truncate_output_footer(output_file, process_list, run_for):
+    """
+    Removes the end of an output file (end time and process summary) so that new events can be
+    appended to its trace. The end of the file must be the one the checkpoint would write.
+
+    :param output_file: Output file of the checkpointed simulation
+    :param process_list: The processes of the checkpoint
+    :param run_for: Time units the checkpointed simulation ran
+    """
+    footer = "".join(line + "\n" for line in output_footer_lines(process_list, run_for)).encode()
+    try:
+        file = open(output_file, 'rb+')
+    except FileNotFoundError:
+        print("Error: Output file of the checkpoint not found.")
+        sys.exit(1)
+
+    with file:
+        size = file.seek(0, os.SEEK_END)
+        file.seek(max(0, size - len(footer)))
+        if file.read() != footer:
+            print("Error: The output file does not match the checkpoint.")
+            sys.exit(1)
+        file.truncate(size - len(footer))
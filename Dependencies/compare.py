@@ -0,0 +1,242 @@
+import argparse
+import csv
+import os
+import random
+import sys
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+from Dependencies.data_structure import Workload
+from Dependencies.input_file_parsing import MLFQParameters, DEFAULT_FAIR_PARAMETERS
+from Dependencies.main import load_input_runs, scheduler_events
+from Dependencies.write_output_file import nearest_rank
+
+"""
+This file contains the compare mode of the program. It runs several algorithms (and Round Robin
+at several quanta) on the same workload at the same time, one worker process per run, and merges
+their metrics into a single comparison table.
+
+The input file is parsed once. The frozen workload is copied into a shared memory segment that
+the workers map, so no worker parses the file again or receives a pickled copy of the processes.
+Each run is a ProcessTable built over the shared columns, with only its per-run columns allocated.
+
+Usage:
+    python3 -m Dependencies.compare <input_file> [--algorithms fcfs,sjf,rr,lottery] [--quanta 2,4,8]
+                                    [--seed N] [--workers N] [--csv file.csv]
+"""
+
+COMPARE_ALGORITHMS = ('fcfs', 'sjf', 'rr', 'lottery', 'mlfq', 'fair')
+TABLE_FIELDS = ["run", "finished", "average_wait", "average_turnaround", "average_response",
+                "p95_wait", "max_wait", "seconds"]
+
+# Shared memory segment of the workload, attached once in each worker
+_shared_workload = None
+
+
+def share_workload(workload):
+    """
+    Copies a workload into a new shared memory segment. The arrival times, burst times and name
+    offsets are stored as 64-bit columns one after the other, followed by the UTF-8 names.
+
+    :param workload: The Workload to share
+    :return: Tuple (segment, layout) where layout is (process count, size of the names) and is
+             all a worker needs, with the name of the segment, to map the workload
+    """
+    process_count = len(workload)
+    name_size = len(workload.name_data)
+    column_size = 8 * process_count
+    segment = shared_memory.SharedMemory(create=True, size=max(1, 3 * column_size + 8 + name_size))
+
+    position = 0
+    for column in (workload.arrival_times, workload.burst_times, workload.name_offsets):
+        data = column.cast("B")
+        segment.buf[position:position + len(data)] = data
+        position += len(data)
+    segment.buf[position:position + name_size] = workload.name_data
+    return segment, (process_count, name_size)
+
+
+def map_workload(buffer, process_count, name_size):
+    """
+    Builds a Workload on the columns of a shared memory segment, without copying them.
+
+    :param buffer: Buffer of the segment written by share_workload
+    :param process_count: Number of processes of the workload
+    :param name_size: Size of the names of the workload, in bytes
+    :return: The Workload
+    """
+    view = memoryview(buffer)
+    column_size = 8 * process_count
+    arrival_times = view[0:column_size]
+    burst_times = view[column_size:2 * column_size]
+    name_offsets = view[2 * column_size:3 * column_size + 8]
+    name_data = view[3 * column_size + 8:3 * column_size + 8 + name_size]
+    return Workload(name_data, name_offsets, arrival_times, burst_times)
+
+
+def attach_workload(segment_name):
+    """
+    Initializer of the worker processes, maps the shared memory segment of the workload.
+
+    :param segment_name: Name of the segment created by share_workload
+    """
+    global _shared_workload
+    _shared_workload = shared_memory.SharedMemory(name=segment_name)
+
+
+def shared_workload(layout):
+    """
+    :param layout: Layout of the shared workload, see share_workload
+    :return: Workload mapped on the segment attached by attach_workload
+    """
+    return map_workload(_shared_workload.buf, *layout)
+
+
+def run_compare_item(item, layout, run_for, seed=None):
+    """
+    Runs one algorithm on the shared workload in a worker process.
+
+    :param item: Tuple (label, algorithm, quantum) of the run
+    :param layout: Layout of the shared workload, see share_workload
+    :param run_for: Total time units to run the simulation
+    :param seed: Seed of the random generator, for lottery
+    :return: Dictionary with the TABLE_FIELDS of the run
+    """
+    label, algorithm, quantum = item
+    if seed is not None:
+        random.seed(seed)
+
+    start = time.perf_counter()
+    process_list = shared_workload(layout).new_run(columnar=True)
+    deque(scheduler_events(process_list, run_for, algorithm, quantum), maxlen=0)
+    seconds = time.perf_counter() - start
+    return run_summary(label, process_list, seconds)
+
+
+def run_summary(label, process_list, seconds):
+    """
+    Summarizes the metrics of one run.
+
+    :param label: Name of the run in the comparison table
+    :param process_list: The processes of the run, with their metrics
+    :param seconds: Time the run took
+    :return: Dictionary with the TABLE_FIELDS of the run
+    """
+    finished = [process for process in process_list if process.finish_time != -1]
+    summary = dict.fromkeys(TABLE_FIELDS, "")
+    summary.update(run=label, finished=f"{len(finished)}/{len(process_list)}", seconds=round(seconds, 6))
+    if finished:
+        waits = sorted(process.waiting_time for process in finished)
+        summary["average_wait"] = round(sum(waits) / len(finished), 3)
+        summary["average_turnaround"] = round(sum(p.turnaround_time for p in finished) / len(finished), 3)
+        summary["average_response"] = round(sum(p.response_time for p in finished) / len(finished), 3)
+        summary["p95_wait"] = nearest_rank(waits, 95)
+        summary["max_wait"] = waits[-1]
+    return summary
+
+
+def compare_items(algorithms, quanta):
+    """
+    Lists the runs of a comparison, Round Robin and MLFQ once per quantum.
+
+    :param algorithms: Algorithms to compare, from COMPARE_ALGORITHMS
+    :param quanta: Quanta of the Round Robin runs, also the quanta of the MLFQ levels
+    :return: List of (label, algorithm, quantum)
+    """
+    items = []
+    for algorithm in algorithms:
+        if algorithm == 'rr':
+            items.extend((f"rr q={quantum}", algorithm, quantum) for quantum in quanta)
+        elif algorithm == 'mlfq':
+            items.append((f"mlfq q={','.join(map(str, quanta))}", algorithm, MLFQParameters(tuple(quanta), 0)))
+        elif algorithm == 'fair':
+            items.append((algorithm, algorithm, DEFAULT_FAIR_PARAMETERS))
+        else:
+            items.append((algorithm, algorithm, None))
+    return items
+
+
+def run_compare(input_file, algorithms=('fcfs', 'sjf', 'rr', 'lottery'), quanta=(2, 4, 8), seed=None, workers=None):
+    """
+    Runs every algorithm on the workload of an input file at the same time, one worker process
+    per run, with the workload shared through shared memory.
+
+    :param input_file: Path to the input (or binary workload) file, its 'use' line is optional and ignored
+    :param algorithms: Algorithms to compare, from COMPARE_ALGORITHMS
+    :param quanta: Quanta of the Round Robin runs
+    :param seed: Seed of the random generator of every run
+    :param workers: Number of worker processes, defaults to one per run
+    :return: List of summaries, in the order of the runs
+    """
+    process_table, run_for, _ = load_input_runs(input_file, columnar=True, with_runs=False)
+    segment, layout = share_workload(Workload.from_processes(process_table))
+    del process_table
+    items = compare_items(algorithms, quanta)
+
+    try:
+        with ProcessPoolExecutor(max_workers=workers or len(items), initializer=attach_workload,
+                                 initargs=(segment.name,)) as executor:
+            futures = [executor.submit(run_compare_item, item, layout, run_for, seed) for item in items]
+            return [future.result() for future in futures]
+    finally:
+        segment.close()
+        segment.unlink()
+
+
+# Function that renders the comparison table
+def comparison_table_lines(summaries):
+    """
+    Renders the summaries as an aligned text table, one line at a time.
+
+    :param summaries: List of summaries returned by run_compare
+    """
+    widths = {field: max(len(field), *(len(str(summary[field])) for summary in summaries)) for field in TABLE_FIELDS}
+    yield "  ".join(field.ljust(widths[field]) for field in TABLE_FIELDS)
+    for summary in summaries:
+        yield "  ".join(str(summary[field]).ljust(widths[field]) for field in TABLE_FIELDS)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare scheduling algorithms on the same workload in parallel")
+    parser.add_argument("input_file", help="input file (.in) or binary workload file (.wl)")
+    parser.add_argument("--algorithms", default="fcfs,sjf,rr,lottery",
+                        help=f"comma separated algorithms to compare, from {','.join(COMPARE_ALGORITHMS)}")
+    parser.add_argument("--quanta", default="2,4,8", help="comma separated quanta of the Round Robin runs")
+    parser.add_argument("--seed", type=int, help="seed of the random generator of every run (lottery)")
+    parser.add_argument("--workers", type=int, default=None, help="number of worker processes (default: one per run)")
+    parser.add_argument("--csv", help="also write the comparison table to this CSV file")
+    args = parser.parse_args()
+
+    algorithms = [algorithm.strip().lower() for algorithm in args.algorithms.split(",") if algorithm.strip()]
+    if not algorithms or any(algorithm not in COMPARE_ALGORITHMS for algorithm in algorithms):
+        print("Error: Invalid scheduling algorithm.")
+        sys.exit(1)
+    try:
+        quanta = [int(quantum) for quantum in args.quanta.split(",")]
+    except ValueError:
+        quanta = []
+    if not quanta or min(quanta) < 1:
+        print("Error: Invalid quanta.")
+        sys.exit(1)
+    if not os.path.isfile(args.input_file):
+        print("Error: Input file not found.")
+        sys.exit(1)
+
+    start = time.perf_counter()
+    summaries = run_compare(args.input_file, algorithms, quanta, args.seed, args.workers)
+    seconds = time.perf_counter() - start
+
+    for line in comparison_table_lines(summaries):
+        print(line)
+    print(f"{len(summaries)} runs in {seconds:.3f} s, {sum(summary['seconds'] for summary in summaries):.3f} s of simulation")
+    if args.csv:
+        with open(args.csv, 'w', newline='') as file:
+            writer = csv.DictWriter(file, fieldnames=TABLE_FIELDS)
+            writer.writeheader()
+            writer.writerows(summaries)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,11 @@
+from array import array
+
 # Data Structure of the processes. Used throughout the program to represent each process
 class Process:
+    # Slots instead of a per-instance __dict__ keep each process small in large workloads
+    __slots__ = ("name", "arrival_time", "burst_time", "remaining_burst_time", "start_time",
+                 "finish_time", "waiting_time", "turnaround_time", "response_time")
+
     def __init__(self, name, arrival_time, burst_time):
         """
         Initializes a new process with the given parameters. Some parameters are initialized 
@@ -47,4 +53,219 @@ class Process:
         :param finish_time: The time when the process finishes execution
         """
         self.finish_time = finish_time
-        self.update_metrics(finish_time)
\ No newline at end of file
+        self.update_metrics(finish_time)
+
+# Columns of the process table and their initial values. Every column is a typed array of 64-bit integers
+PROCESS_TABLE_COLUMNS = {
+    "arrival_time": None,
+    "burst_time": None,
+    "remaining_burst_time": None,
+    "start_time": -1,
+    "finish_time": -1,
+    "waiting_time": 0,
+    "turnaround_time": 0,
+    "response_time": -1,
+}
+
+
+class ProcessTable:
+    """
+    Struct-of-arrays storage for large workloads. Every process attribute is kept in its own typed
+    array column and the names are packed one after the other in a single name table, so a process
+    costs under a hundred bytes instead of a full Python object.
+
+    Indexing or iterating the table gives ProcessView objects that behave like Process instances,
+    so the schedulers and write_output_file work on a table exactly as they do on a list.
+    """
+
+    def __init__(self):
+        self.name_data = bytearray()          # UTF-8 names of all the processes, back to back
+        self.name_offsets = array("q", [0])   # Process i has its name in name_data[offsets[i]:offsets[i + 1]]
+        self.columns = {column: array("q") for column in PROCESS_TABLE_COLUMNS}
+
+    @classmethod
+    def from_columns(cls, arrival_times, burst_times, name_offsets, name_data):
+        """
+        Builds a table around existing columns without copying them, for example memoryviews on
+        a memory-mapped workload file. Only the per-run columns (remaining burst, start, finish
+        and metrics) are allocated. Processes cannot be added to a table built this way when the
+        given buffers are read-only.
+
+        :param arrival_times: Buffer of 64-bit arrival times
+        :param burst_times: Buffer of 64-bit burst times
+        :param name_offsets: Buffer of len(arrival_times) + 1 64-bit offsets into name_data
+        :param name_data: Buffer holding the UTF-8 names back to back
+        :return: The new ProcessTable
+        """
+        table = cls()
+        table.name_data = name_data
+        table.name_offsets = name_offsets
+        process_count = len(arrival_times)
+        for column, initial_value in PROCESS_TABLE_COLUMNS.items():
+            if column == "arrival_time":
+                table.columns[column] = arrival_times
+            elif column == "burst_time":
+                table.columns[column] = burst_times
+            elif column == "remaining_burst_time":
+                table.columns[column] = array("q")
+                table.columns[column].frombytes(memoryview(burst_times).cast("B"))
+            else:
+                table.columns[column] = array("q", [initial_value]) * process_count
+        return table
+
+    def add_process(self, name, arrival_time, burst_time):
+        """
+        Appends a new process to the table, initialized like a new Process instance.
+
+        :param name: The name of the process (string)
+        :param arrival_time: The time at which the process arrives in the ready queue (int)
+        :param burst_time: The total CPU burst time required by the process (int)
+        :return: The index of the new process in the table
+        """
+        self.name_data += name.encode()
+        self.name_offsets.append(len(self.name_data))
+        columns = self.columns
+        columns["arrival_time"].append(arrival_time)
+        columns["burst_time"].append(burst_time)
+        columns["remaining_burst_time"].append(burst_time)
+        columns["start_time"].append(-1)
+        columns["finish_time"].append(-1)
+        columns["waiting_time"].append(0)
+        columns["turnaround_time"].append(0)
+        columns["response_time"].append(-1)
+        return len(self) - 1
+
+    def name_of(self, index):
+        """
+        Returns the name of the process stored at the given index.
+
+        :param index: Index of the process in the table
+        """
+        return str(self.name_data[self.name_offsets[index]:self.name_offsets[index + 1]], "utf-8")
+
+    def __len__(self):
+        return len(self.name_offsets) - 1
+
+    def __getitem__(self, index):
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("process table index out of range")
+        return ProcessView(self, index)
+
+    def __iter__(self):
+        for index in range(len(self)):
+            yield ProcessView(self, index)
+
+
+def _column_property(column):
+    """
+    Builds a property reading and writing one column of the process table for a ProcessView.
+
+    :param column: Name of the column in ProcessTable.columns
+    """
+    def getter(self):
+        return self.table.columns[column][self.index]
+
+    def setter(self, value):
+        self.table.columns[column][self.index] = value
+
+    return property(getter, setter)
+
+
+class ProcessView:
+    """
+    Process-compatible view on one row of a ProcessTable. It holds no data of its own, every
+    attribute is read from and written to the columns of the table.
+    """
+    __slots__ = ("table", "index")
+
+    def __init__(self, table, index):
+        self.table = table
+        self.index = index
+
+    @property
+    def name(self):
+        return self.table.name_of(self.index)
+
+    arrival_time = _column_property("arrival_time")
+    burst_time = _column_property("burst_time")
+    remaining_burst_time = _column_property("remaining_burst_time")
+    start_time = _column_property("start_time")
+    finish_time = _column_property("finish_time")
+    waiting_time = _column_property("waiting_time")
+    turnaround_time = _column_property("turnaround_time")
+    response_time = _column_property("response_time")
+
+    # Metric updates are shared with Process, they only go through the attributes above
+    update_metrics = Process.update_metrics
+    set_start_time = Process.set_start_time
+    set_finish_time = Process.set_finish_time
+
+    def __eq__(self, other):
+        return isinstance(other, ProcessView) and self.table is other.table and self.index == other.index
+
+    def __hash__(self):
+        return hash((id(self.table), self.index))
+
+
+class Workload:
+    """
+    Frozen, shareable description of the processes of a workload: their names, arrival and burst
+    times, held in read-only columns. The schedulers never see it directly. Each run gets its own
+    per-run state from new_run(), so one parse can feed any number of scheduler runs without
+    re-parsing or deep-copying, and a run can never change what the next one sees.
+    """
+    __slots__ = ("name_data", "name_offsets", "arrival_times", "burst_times")
+
+    def __init__(self, name_data, name_offsets, arrival_times, burst_times):
+        """
+        :param name_data: Buffer holding the UTF-8 names back to back
+        :param name_offsets: Buffer of process count + 1 64-bit offsets into name_data
+        :param arrival_times: Buffer of 64-bit arrival times
+        :param burst_times: Buffer of 64-bit burst times
+        """
+        for slot, buffer in zip(self.__slots__, (name_data, name_offsets, arrival_times, burst_times)):
+            view = memoryview(buffer)
+            object.__setattr__(self, slot, (view if slot == "name_data" else view.cast("B").cast("q")).toreadonly())
+
+    def __setattr__(self, name, value):
+        raise AttributeError("Workload is immutable")
+
+    @classmethod
+    def from_processes(cls, process_list):
+        """
+        Freezes the processes of a list or ProcessTable. The columns of a table are shared, not
+        copied, the table must then not be changed by simulations.
+
+        :param process_list: List of Process (or ProcessTable)
+        :return: The new Workload
+        """
+        if isinstance(process_list, ProcessTable):
+            columns = process_list.columns
+            return cls(process_list.name_data, process_list.name_offsets, columns["arrival_time"], columns["burst_time"])
+
+        table = ProcessTable()
+        for process in process_list:
+            table.add_process(process.name, process.arrival_time, process.burst_time)
+        return cls.from_processes(table)
+
+    def __len__(self):
+        return len(self.arrival_times)
+
+    def new_run(self, columnar=False):
+        """
+        Creates the per-run state of a simulation, processes with their remaining burst, start,
+        finish and metrics reset.
+
+        :param columnar: If True, a ProcessTable sharing the frozen columns is returned (only the
+                         per-run columns are allocated), otherwise a list of Process
+        :return: List of Process (or ProcessTable) for one scheduler run
+        """
+        if columnar:
+            return ProcessTable.from_columns(self.arrival_times, self.burst_times, self.name_offsets, self.name_data)
+
+        name_data = bytes(self.name_data)
+        offsets = self.name_offsets
+        return [Process(name_data[offsets[index]:offsets[index + 1]].decode(), arrival_time, burst_time)
+                for index, (arrival_time, burst_time) in enumerate(zip(self.arrival_times, self.burst_times))]
@@ -0,0 +1,148 @@
+from array import array
+
+# Kinds of scheduling events recorded by the schedulers
+EVENT_ARRIVED = 0
+EVENT_SELECTED = 1
+EVENT_FINISHED = 2
+EVENT_IDLE = 3
+
+
+# Compact event log shared by all the scheduler algorithms
+class EventLog:
+    """
+    Stores the scheduling events as typed records (time, kind, process id, value) packed into
+    arrays instead of formatted strings. The process id is the index of the process in the
+    process list given to the scheduler. The value is the remaining burst for a 'selected'
+    event and the number of consecutive idle time units for an 'idle' event.
+
+    The text of the output file is only built when the log is rendered with lines().
+    """
+
+    def __init__(self, process_list):
+        """
+        :param process_list: The list (or ProcessTable) of processes the events refer to
+        """
+        self.process_list = process_list
+        self.times = array("q")
+        self.kinds = array("b")
+        self.process_ids = array("q")
+        self.values = array("q")
+
+    @classmethod
+    def collect(cls, process_list, events):
+        """
+        Builds an event log from a stream of event records, such as the ones produced by the
+        scheduler event generators.
+
+        :param process_list: The list (or ProcessTable) of processes the events refer to
+        :param events: Iterable of (time, kind, process id, value) records
+        :return: The filled EventLog
+        """
+        event_log = cls(process_list)
+        append = event_log.append
+        for time, kind, process_id, value in events:
+            append(time, kind, process_id, value)
+        return event_log
+
+    def append(self, time, kind, process_id=-1, value=0):
+        """
+        Appends one event record to the log. Idle time that directly follows a previous idle
+        record extends that record instead of adding a new one.
+
+        :param time: The time of the event
+        :param kind: One of the EVENT_* constants
+        :param process_id: Index of the process in the process list, -1 for idle time
+        :param value: Remaining burst for a selection, number of time units for idle time
+        """
+        if kind == EVENT_IDLE:
+            if value <= 0:
+                return
+            if self.kinds and self.kinds[-1] == EVENT_IDLE and self.times[-1] + self.values[-1] == time:
+                self.values[-1] += value
+                return
+        self.times.append(time)
+        self.kinds.append(kind)
+        self.process_ids.append(process_id)
+        self.values.append(value)
+
+    def __len__(self):
+        return len(self.times)
+
+    def __iter__(self):
+        """
+        Iterates over the records as tuples (time, kind, process id, value).
+        """
+        return zip(self.times, self.kinds, self.process_ids, self.values)
+
+    def lines(self):
+        """
+        Renders the events in the text format of the output file, one line at a time.
+        """
+        return format_events(self.process_list, self)
+
+
+def format_events(process_list, events):
+    """
+    Renders event records in the text format of the output file. Works lazily on any iterable
+    of records, so events can be streamed straight from a scheduler to the output file.
+
+    :param process_list: The list (or ProcessTable) of processes the events refer to
+    :param events: Iterable of (time, kind, process id, value) records
+    :return: Generator of output lines, without the trailing newline
+    """
+    for time, kind, process_id, value in events:
+        if kind == EVENT_IDLE:
+            for idle_time in range(time, time + value):
+                yield f"Time {idle_time} : Idle"
+        else:
+            yield f"Time {time} : {event_text(process_list, kind, process_id, value)}"
+
+
+def format_smp_events(process_list, events):
+    """
+    Renders the event records of the multiprocessor scheduler, which carry the CPU of each event.
+    Selections and completions are prefixed with their CPU, arrivals name the CPU they were placed on.
+
+    :param process_list: The list (or ProcessTable) of processes the events refer to
+    :param events: Iterable of (time, kind, process id, value, cpu id) records
+    :return: Generator of output lines, without the trailing newline
+    """
+    for time, kind, process_id, value, cpu_id in events:
+        if kind == EVENT_ARRIVED:
+            yield f"Time {time} : {process_list[process_id].name} arrived (CPU {cpu_id})"
+        else:
+            yield f"Time {time} : CPU {cpu_id} : {event_text(process_list, kind, process_id, value)}"
+
+
+def event_text(process_list, kind, process_id, value):
+    """
+    Renders what happened in one event, the part of its output line after the time.
+
+    :param process_list: The list (or ProcessTable) of processes the events refer to
+    :param kind: One of the EVENT_* constants
+    :param process_id: Index of the process in the process list, -1 for idle time
+    :param value: Remaining burst for a selection, number of time units for idle time
+    """
+    if kind == EVENT_ARRIVED:
+        return f"{process_list[process_id].name} arrived"
+    if kind == EVENT_SELECTED:
+        return f"{process_list[process_id].name} selected (burst {value})"
+    if kind == EVENT_FINISHED:
+        return f"{process_list[process_id].name} finished"
+    return "Idle"
+
+
+# Generator that gives the processes of a stream their process ids
+def stream_process_ids(arrivals, live):
+    """
+    Numbers the processes of a stream in arrival order, for the schedulers that read their
+    arrivals from an iterator of process ids. Each process is stored in 'live' under its id as
+    it is read, so the dict can be given to the scheduler as its process list.
+
+    :param arrivals: Iterable of Process, in arrival order
+    :param live: Dict the processes are stored in, by process id
+    :return: Generator of the process ids
+    """
+    for process_id, process in enumerate(arrivals):
+        live[process_id] = process
+        yield process_id
@@ -1,67 +1,99 @@
 import random
 
+from Dependencies.event_log import *
+from Dependencies.input_file_parsing import input_file_lines
+from Dependencies.write_output_file import output_file_lines
+
+# Colors given to the processes in the report
+PREDEFINED_COLORS = [
+    "#FF6347", "#4682B4", "#32CD32", "#FFD700", "#8A2BE2", "#FF1493",
+    "#00CED1", "#FF8C00", "#ADFF2F", "#4B0082", "#FF4500", "#7CFC00"
+]
+
+# Function that builds the run-length segments of the Gantt chart
+def build_gantt_segments(process_list, event_log, end_time):
+    """
+    Builds the Gantt chart as run-length segments in a single pass over the event records.
+    A process holds the CPU from the time it is selected until it finishes or another process
+    is selected, and consecutive runs of the same process are merged. The gaps are idle time.
+
+    Parameters:
+    process_list (list of Process): List of processes the events refer to.
+    event_log (EventLog): Events detailing the scheduling process, in time order.
+    end_time (int): Time at which the chart ends.
+
+    Returns:
+    list of (str, int, int): Segments (process name or "Idle", start time, end time).
+    """
+    segments = []
+    last_end = 0
+    current_process = None
+    current_start = 0
+
+    def add_segment(process, start, end):
+        nonlocal last_end
+        end = min(end, end_time)
+        if start > last_end:
+            segments.append(("Idle", last_end, start))
+        if end > start:
+            if segments and segments[-1][0] == process and segments[-1][2] == start:
+                segments[-1] = (process, segments[-1][1], end)  # Same process selected again
+            else:
+                segments.append((process, start, end))
+        last_end = max(last_end, end)
+
+    for time, kind, process_id, _ in event_log:
+        if kind == EVENT_SELECTED:
+            if current_process is not None:
+                add_segment(current_process, current_start, time)
+            current_process = process_list[process_id].name
+            current_start = time
+        elif kind == EVENT_FINISHED:
+            if current_process is not None:
+                add_segment(current_process, current_start, time)
+            current_process = None
+
+    if current_process is not None:
+        add_segment(current_process, current_start, end_time)
+    if last_end < end_time:
+        segments.append(("Idle", last_end, end_time))
+    return segments
+
+
 # Function that generates the HTML file for visualizing the output
-def generate_html_file(output_file, input_file, html_file):
+def generate_html_file(html_file, process_list, algorithm, quantum, event_log, run_for):
     """
     Generate an HTML file to display the input, output, and a Gantt chart of the scheduling process.
+    The report is built from the simulation results in memory, nothing is read back from disk.
+    The Gantt chart has one cell per run-length segment rather than one per time unit, and the
+    page is assembled from a list of parts joined once.
 
     Parameters:
-    output_file (str): The name of the output file.
-    input_file (str): The name of the input file.
     html_file (str): The name of the HTML file to be generated.
+    process_list (list of Process): List of processes that were scheduled.
+    algorithm (str): The scheduling algorithm used.
+    quantum (int): Time slice for Round Robin scheduling (if applicable).
+    event_log (EventLog): Event log detailing the scheduling process.
+    run_for (int): Total time units the simulation ran.
     """
-    # Read the input file content
-    with open(input_file, 'r') as file:
-        input_content = file.read()
-
-    # Read the output file content
-    with open(output_file, 'r') as file:
-        output_content = file.readlines()
-
-    # Extract process names and events for the Gantt chart
-    events = []
-    max_time = 0
-    for line in output_content:
-        if line.startswith("Time"):
-            time, event = line.split(" : ")
-            time = int(time.strip().split()[1])
-            event = event.strip()
-            events.append((time, event))
-            if "finished" in event:
-                max_time = max(max_time, time)
-
-    # Create a dictionary to hold the Gantt chart data
-    gantt_data = {}
-    process_colors = {}
-    predefined_colors = [
-        "#FF6347", "#4682B4", "#32CD32", "#FFD700", "#8A2BE2", "#FF1493",
-        "#00CED1", "#FF8C00", "#ADFF2F", "#4B0082", "#FF4500", "#7CFC00"
-    ]
-    current_process = None
+    input_content = "\n".join(input_file_lines(process_list, run_for, algorithm, quantum)) + "\n"
+    output_content = "\n".join(output_file_lines(process_list, algorithm, quantum, event_log, run_for)) + "\n"
+
+    # The chart ends at the end of the simulation, or at the last event if a time slice went past it
+    end_time = max(run_for, event_log.times[-1] if len(event_log) else 0)
+    segments = build_gantt_segments(process_list, event_log, end_time)
 
-    for i in range(max_time + 1):
-        gantt_data[i] = "Idle"
-        for time, event in events:
-            if time == i:
-                if "arrived" in event:
-                    pass
-                elif "selected" in event:
-                    current_process = event.split()[0]
-                    gantt_data[i] = current_process
-                elif "finished" in event:
-                    gantt_data[i] = current_process
-                    current_process = None
-            elif current_process:
-                gantt_data[i] = current_process
-
-    # Assign colors to processes
-    unique_processes = set(gantt_data.values()) - {"Idle"}
-    random.shuffle(predefined_colors)
-    for idx, process in enumerate(unique_processes):
-        process_colors[process] = predefined_colors[idx % len(predefined_colors)]
+    # Assign colors to processes. The shuffle has its own generator, so rendering a report does not
+    # move the simulation generator (a checkpoint saves its state after the report is written)
+    process_colors = {}
+    predefined_colors = PREDEFINED_COLORS[:]
+    random.Random().shuffle(predefined_colors)
+    for process, _, _ in segments:
+        if process != "Idle" and process not in process_colors:
+            process_colors[process] = predefined_colors[len(process_colors) % len(predefined_colors)]
 
     # Initialize the HTML content
-    html_content = f"""
+    html_parts = ["""
     <!DOCTYPE html>
     <html lang="en">
     <head>
@@ -69,22 +101,22 @@ def generate_html_file(output_file, input_file, html_file):
         <meta name="viewport" content="width=device-width, initial-scale=1.0">
         <title>Scheduling Simulation Results</title>
         <style>
-            body {{{{ font-family: Arial, sans-serif; }}}}
-            h1 {{{{ text-align: center; }}}}
-            h2 {{{{ margin-top: 50px; }}}}
-            pre {{{{ background-color: #f4f4f4; padding: 15px; border: 1px solid #ccc; }}}}
-            table {{{{ width: 100%; border-collapse: collapse; margin-top: 20px; }}}}
-            th, td {{{{ padding: 10px; border: 1px solid #ccc; text-align: center; }}}}
-            .idle {{{{ background-color: #f0f0f0; }}}}
-            .chart-table {{{{ border: 1px solid black; border-collapse: collapse; width: 100%; }}}}
-            .chart-table td {{{{ border: 1px solid black; text-align: center; padding: 5px; }}}}
-    """
+            body { font-family: Arial, sans-serif; }
+            h1 { text-align: center; }
+            h2 { margin-top: 50px; }
+            pre { background-color: #f4f4f4; padding: 15px; border: 1px solid #ccc; }
+            table { width: 100%; border-collapse: collapse; margin-top: 20px; }
+            th, td { padding: 10px; border: 1px solid #ccc; text-align: center; }
+            .idle { background-color: #f0f0f0; }
+            .chart-table { border: 1px solid black; border-collapse: collapse; width: 100%; table-layout: fixed; }
+            .chart-table td { border: 1px solid black; text-align: center; padding: 5px; overflow: hidden; }
+    """]
 
     # Add styles for each process
     for process, color in process_colors.items():
-        html_content += f".{process} {{{{ background-color: {color}; }}}}\n"
+        html_parts.append(f".{process} {{ background-color: {color}; }}\n")
 
-    html_content += """
+    html_parts.append(f"""
         </style>
     </head>
     <body>
@@ -99,49 +131,58 @@ def generate_html_file(output_file, input_file, html_file):
                 <th>Time</th>
                 <th>Event</th>
             </tr>
-    """
-
-    # Process the output content to extract events and visualize them
-    for line in output_content:
-        if line.startswith("Time"):
-            time, event = line.split(" : ")
-            time = time.strip()
-            event = event.strip()
-            css_class = "idle" if event == "Idle" else gantt_data[int(time.split()[1])]
-            html_content += f"""
+    """)
+
+    # Rows of the events, colored with the process holding the CPU at that time. Events and
+    # segments are both in time order, so the matching segment is found by moving forward. A run
+    # of idle time gets a single row, like its segment of the Gantt chart
+    segment_index = 0
+    for time, kind, process_id, value in event_log:
+        if kind == EVENT_IDLE:
+            css_class = "idle"
+            time_text = f"Time {time}" if value == 1 else f"Time {time}-{time + value - 1}"
+        else:
+            while segment_index < len(segments) and segments[segment_index][2] <= time:
+                segment_index += 1
+            if segment_index == len(segments) or segments[segment_index][0] == "Idle":
+                css_class = "idle"
+            else:
+                css_class = segments[segment_index][0]
+            time_text = f"Time {time}"
+        html_parts.append(f"""
             <tr class="{css_class}">
-                <td>{time}</td>
-                <td>{event}</td>
+                <td>{time_text}</td>
+                <td>{event_text(process_list, kind, process_id, value)}</td>
             </tr>
-            """
+            """)
 
-    # Add the Gantt chart
-    html_content += """
+    # Add the Gantt chart, one cell per segment with a width proportional to its length
+    html_parts.append("""
         </table>
         <h2>Gantt Chart</h2>
         <table class="chart-table">
             <tr>
-    """
+    """)
 
-    # Add time labels to the Gantt chart
-    for i in range(max_time + 1):
-        html_content += f"<td>{i}</td>"
-    html_content += "</tr><tr>"
+    # Add the start time of each segment. A simulation that runs for no time has an empty chart
+    chart_length = end_time or 1
+    for _, start, end in segments:
+        html_parts.append(f"<td style='width: {100 * (end - start) / chart_length:.4f}%'>{start}</td>")
+    html_parts.append("</tr><tr>")
 
     # Add process labels to the Gantt chart
-    for i in range(max_time + 1):
-        process = gantt_data[i]
+    for process, start, end in segments:
         css_class = "idle" if process == "Idle" else process
-        html_content += f"<td class='{css_class}'>{process}</td>"
+        html_parts.append(f"<td class='{css_class}' title='{process} {start}-{end}'>{process}</td>")
 
     # Close the HTML tags
-    html_content += """
+    html_parts.append("""
             </tr>
         </table>
     </body>
     </html>
-    """
+    """)
 
     # Write the HTML content to the file
     with open(html_file, 'w') as file:
-        file.write(html_content.format(input_content=input_content, output_content=''.join(output_content)))
+        file.write("".join(html_parts))
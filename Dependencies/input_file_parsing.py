@@ -1,4 +1,7 @@
 import sys
+from array import array
+from collections import namedtuple
+
 from Dependencies.data_structure import *
 
 """
@@ -6,54 +9,157 @@ This file contain the file parsing function and is dependent of the file 'Proces
 the data structure of the Processes
 """
 
+# Parameters of the Multilevel Feedback Queue algorithm, given in place of the quantum. The quanta
+# are the time slices of the levels, highest priority first. Every 'boost_period' time units all
+# the processes go back to the highest level, 0 means never
+MLFQParameters = namedtuple("MLFQParameters", ["quanta", "boost_period"])
+
+# Parameters of the fair (CFS) algorithm, given in place of the quantum. The runnable processes
+# share each 'target_latency' time units, and no time slice is shorter than 'min_granularity'
+FairParameters = namedtuple("FairParameters", ["target_latency", "min_granularity"])
+DEFAULT_FAIR_PARAMETERS = FairParameters(24, 3)
+
+# Scheduling algorithms of the 'use' line, 'use all' runs all of them in this order
+ALGORITHMS = ('fcfs', 'sjf', 'rr', 'lottery', 'mlfq', 'fair')
+
 # Function that takes in the input file and parse in the data of the file
-def parse_input_file(file_path):
+def parse_input_file(file_path, columnar=False):
     """
     Parses the input file to extract process details and scheduling parameters.
 
     :param file_path: Path to the input file
+    :param columnar: If True, the processes are stored in a compact ProcessTable instead of a list of Process
     :return: Tuple (process_list, run_for, algorithm, quantum) if parsing is successful, otherwise prints an error and exits.
+             For 'mlfq' the quantum is an MLFQParameters, for 'fair' a FairParameters.
     """
-    process_list = []
-    process_count = None
-    run_for = None
-    algorithm = None
-    quantum = None
+    process_list, run_for, runs = parse_input_runs(file_path, columnar)
+    if len(runs) > 1:
+        print("Error: Only one scheduling algorithm can be used here.")
+        sys.exit(1)
+    algorithm, quantum = runs[0]
+    return process_list, run_for, algorithm, quantum
+
+
+# Function that parses an input file whose 'use' line may give several algorithms
+def parse_input_runs(file_path, columnar=False, counts=None, with_runs=True):
+    """
+    Parses the input file like parse_input_file, except that the 'use' line may list several
+    algorithms (separated by spaces or commas) or be 'use all'. The processes are parsed once
+    for all of them.
 
+    :param file_path: Path to the input file
+    :param columnar: If True, the processes are stored in a compact ProcessTable instead of a list of Process
+    :param counts: Optional dict, the number of lines read is stored in it under "lines"
+    :param with_runs: If False, the 'use' line is optional and ignored and runs is empty, for the modes
+                      that choose the algorithms themselves
+    :return: Tuple (process_list, run_for, runs) where runs is a list of (algorithm, quantum), one per
+             algorithm in the order of the 'use' line
+    """
     try:
-        with open(file_path, 'r') as file:
-            lines = file.readlines()
+        file = open(file_path, 'r')
     except FileNotFoundError:
         print("Error: Input file not found.")
         sys.exit(1)
 
-    for line in lines:
+    # The file is read line by line instead of being loaded whole
+    with file:
+        return parse_input_lines(file, columnar, counts, with_runs)
+
+
+# Function that parses the lines of an input file, wherever they come from
+def parse_input_lines(lines, columnar=False, counts=None, with_runs=True):
+    """
+    Parses the lines of an input file, see parse_input_runs.
+
+    :param lines: Iterable of the lines of the input file (an open file, a list of strings...)
+    :param columnar: If True, the processes are stored in a compact ProcessTable instead of a list of Process
+    :param counts: Optional dict, the number of lines read (up to the 'end' line) is stored in it under "lines"
+    :param with_runs: If False, the 'use' line is optional and ignored, see parse_input_runs
+    :return: Tuple (process_list, run_for, runs), see parse_input_runs
+    """
+    process_count = None
+    run_for = None
+    algorithms = None
+    quantum = None
+    levels = None
+    boost_period = 0
+    target_latency, min_granularity = DEFAULT_FAIR_PARAMETERS
+
+    # Process lines make up almost all of a large file, so they are added through a prebound
+    # function. A table is filled column by column and only built once the file is read
+    if columnar:
+        arrival_times = array("q")
+        burst_times = array("q")
+        name_data = bytearray()
+        name_offsets = array("q", [0])
+        append_arrival = arrival_times.append
+        append_burst = burst_times.append
+        extend_names = name_data.extend
+        append_offset = name_offsets.append
+
+        def add_process(name, arrival, burst):
+            append_arrival(arrival)
+            append_burst(burst)
+            extend_names(name.encode())
+            append_offset(len(name_data))
+    else:
+        process_list = []
+        append_process = process_list.append
+        add_process = lambda name, arrival, burst: append_process(Process(name, arrival, burst))
+
+    line_number = 0
+    for line_number, line in enumerate(lines, 1):
+        # Fast path for the process lines: a line with the fixed layout
+        # 'process name <name> arrival <time> burst <time>' is unpacked in one step, without going
+        # through the keyword dispatch below
+        if line.startswith("process name "):
+            try:
+                _, _, name, arrival_keyword, arrival, burst_keyword, burst = line.split()
+            except ValueError:
+                pass  # A trailing comment or a missing field, left to the general path
+            else:
+                if arrival_keyword == "arrival" and burst_keyword == "burst":
+                    add_process(name, int(arrival), int(burst))
+                    continue
+
         parts = line.split()
         if not parts:
             continue
 
-        if parts[0] == "processcount":
+        keyword = parts[0]
+        if keyword == "process":
+            if len(parts) < 7 or parts[1] != "name" or parts[3] != "arrival" or parts[5] != "burst":
+                print("Error: Invalid process specification.")
+                sys.exit(1)
+            add_process(parts[2], int(parts[4]), int(parts[6]))
+        elif keyword == "processcount":
             process_count = int(parts[1])
-        elif parts[0] == "runfor":
+        elif keyword == "runfor":
             run_for = int(parts[1])
-        elif parts[0] == "use":
-            algorithm = parts[1].lower()
-            if algorithm not in ['fcfs', 'sjf', 'rr']:
+        elif keyword == "use" and with_runs:
+            algorithms = " ".join(values(parts)).lower().replace(",", " ").split()
+            if algorithms == ['all']:
+                algorithms = list(ALGORITHMS)
+            if not algorithms or any(name not in ALGORITHMS for name in algorithms):
                 print("Error: Invalid scheduling algorithm.")
                 sys.exit(1)
-        elif parts[0] == "quantum":
-            if algorithm == 'rr':
-                quantum = int(parts[1])
-        elif parts[0] == "process":
-            if parts[1] != "name" or parts[3] != "arrival" or parts[5] != "burst":
-                print("Error: Invalid process specification.")
-                sys.exit(1)
-            name = parts[2]
-            arrival = int(parts[4])
-            burst = int(parts[6])
-            process_list.append(Process(name, arrival, burst))
-        elif parts[0] == "end":
+            algorithms = list(dict.fromkeys(algorithms))  # Drops repeated algorithms
+        elif keyword == "quantum":
+            # The first value is the Round Robin quantum, all of them are the MLFQ quanta
+            if algorithms and ('rr' in algorithms or 'mlfq' in algorithms):
+                quantum = [int(part) for part in values(parts)]
+        elif keyword == "levels":
+            levels = int(parts[1])
+        elif keyword == "boost":
+            boost_period = int(parts[1])
+        elif keyword == "latency":
+            target_latency = int(parts[1])
+        elif keyword == "granularity":
+            min_granularity = int(parts[1])
+        elif keyword == "end":
             break
+    if counts is not None:
+        counts["lines"] = line_number
 
     # Check for missing required parameters
     if process_count is None:
@@ -62,14 +168,80 @@ def parse_input_file(file_path):
     if run_for is None:
         print("Error: Missing parameter for 'runfor'.")
         sys.exit(1)
-    if algorithm is None:
+    if algorithms is None and with_runs:
         print("Error: Missing parameter for 'use'.")
         sys.exit(1)
-    if algorithm == 'rr' and quantum is None:
-        print("Error: Missing 'quantum' parameter when use is 'rr'.")
-        sys.exit(1)
+
+    runs = []
+    for algorithm in algorithms or ():
+        if algorithm == 'rr':
+            if not quantum:
+                print("Error: Missing 'quantum' parameter when use is 'rr'.")
+                sys.exit(1)
+            runs.append((algorithm, quantum[0]))
+        elif algorithm == 'mlfq':
+            if not quantum:
+                print("Error: Missing 'quantum' parameter when use is 'mlfq'.")
+                sys.exit(1)
+            quanta = list(quantum)
+            if levels is not None:
+                if levels < len(quanta):
+                    print("Error: More quanta than 'levels'.")
+                    sys.exit(1)
+                # Levels without a quantum of their own double the quantum of the level above
+                while len(quanta) < levels:
+                    quanta.append(2 * quanta[-1])
+            if min(quanta) < 1 or boost_period < 0:
+                print("Error: Invalid 'mlfq' parameters.")
+                sys.exit(1)
+            runs.append((algorithm, MLFQParameters(tuple(quanta), boost_period)))
+        elif algorithm == 'fair':
+            if min_granularity < 1 or target_latency < min_granularity:
+                print("Error: Invalid 'fair' parameters.")
+                sys.exit(1)
+            runs.append((algorithm, FairParameters(target_latency, min_granularity)))
+        else:
+            runs.append((algorithm, None))
+    if columnar:
+        process_list = ProcessTable.from_columns(arrival_times, burst_times, name_offsets, name_data)
     if len(process_list) != process_count:
         print("Error: Number of processes does not match 'processcount'.")
         sys.exit(1)
 
-    return process_list, run_for, algorithm, quantum
\ No newline at end of file
+    return process_list, run_for, runs
+
+
+# Values of a keyword line, up to a trailing comment
+def values(parts):
+    for index in range(1, len(parts)):
+        if parts[index].startswith("#"):
+            return parts[1:index]
+    return parts[1:]
+
+
+# Function that renders a workload in the input file format
+def input_file_lines(process_list, run_for, algorithm, quantum):
+    """
+    Renders a workload in the input file format, one line at a time (without the trailing newline).
+
+    :param process_list: List of Process (or ProcessTable) of the workload
+    :param run_for: Total time units to run the simulation
+    :param algorithm: The scheduling algorithm to use
+    :param quantum: Time slice for Round Robin scheduling (None if not applicable), MLFQParameters for 'mlfq'
+                    and FairParameters for 'fair'
+    """
+    yield f"processcount {len(process_list)}"
+    yield f"runfor {run_for}"
+    yield f"use {algorithm}"
+    if isinstance(quantum, MLFQParameters):
+        yield f"quantum {' '.join(map(str, quantum.quanta))}"
+        if quantum.boost_period:
+            yield f"boost {quantum.boost_period}"
+    elif isinstance(quantum, FairParameters):
+        yield f"latency {quantum.target_latency}"
+        yield f"granularity {quantum.min_granularity}"
+    elif quantum is not None:
+        yield f"quantum {quantum}"
+    for process in process_list:
+        yield f"process name {process.name} arrival {process.arrival_time} burst {process.burst_time}"
+    yield "end"
@@ -0,0 +1,203 @@
+import argparse
+import csv
+import os
+import sys
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+from Dependencies.compare import attach_workload, share_workload, shared_workload
+from Dependencies.data_structure import Workload
+from Dependencies.main import load_input_runs
+from Dependencies.Scheduler_Algorithms.lottery_scheduler import lottery_events
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional for the rest of the program, the trials need its generators
+    np = None
+
+"""
+This file contains the Monte Carlo mode of the lottery scheduler. It runs many independent
+lottery simulations of the same workload on a pool of worker processes and reports the mean and
+the percentiles of the wait, turnaround and response time of every process, with a 95% confidence
+interval of the average of each metric.
+
+Every trial has its own NumPy Generator, spawned from a single seed with SeedSequence, so the
+trials are independent and the whole run is reproducible. The draws of a trial are taken from its
+generator in batches. As in the compare mode, the workload is parsed once and shared with the
+workers through shared memory.
+
+Usage:
+    python3 -m Dependencies.lottery_trials <input_file> [--trials K] [--seed N] [--workers N]
+                                           [--percentiles 5,50,95] [--csv file.csv]
+"""
+
+METRICS = ("wait", "turnaround", "response")
+Z_95 = 1.959964     # Two-sided 95% quantile of the normal distribution
+
+
+def run_trials(seed_sequences, layout, run_for):
+    """
+    Runs lottery trials on the shared workload in a worker process.
+
+    :param seed_sequences: One NumPy SeedSequence per trial
+    :param layout: Layout of the shared workload, see share_workload
+    :param run_for: Total time units to run each simulation
+    :return: Array of shape (trials, len(METRICS), processes), NaN for the processes that did not finish
+    """
+    workload = shared_workload(layout)
+    results = np.full((len(seed_sequences), len(METRICS), len(workload)), np.nan)
+    for trial, seed_sequence in enumerate(seed_sequences):
+        process_list = workload.new_run(columnar=True)
+        deque(lottery_events(process_list, run_for, rng=np.random.default_rng(seed_sequence)), maxlen=0)
+        for index, process in enumerate(process_list):
+            if process.finish_time != -1:
+                results[trial, :, index] = (process.waiting_time, process.turnaround_time, process.response_time)
+    return results
+
+
+def run_lottery_trials(input_file, trials, seed=None, workers=None):
+    """
+    Runs independent seeded lottery simulations of the workload of an input file in parallel.
+
+    :param input_file: Path to the input (or binary workload) file, its 'use' line is optional and ignored
+    :param trials: Number of simulations
+    :param seed: Seed of the whole run, None for a fresh one
+    :param workers: Number of worker processes, defaults to the number of CPUs
+    :return: Tuple (names of the processes, array of shape (trials, len(METRICS), processes), seed of the
+             run, which reproduces it when seed was None)
+    """
+    process_table, run_for, _ = load_input_runs(input_file, columnar=True, with_runs=False)
+    names = [process_table.name_of(index) for index in range(len(process_table))]
+    segment, layout = share_workload(Workload.from_processes(process_table))
+    del process_table
+
+    # Each worker gets several chunks of trials, so a slow chunk does not hold the others back
+    workers = min(workers or os.cpu_count() or 1, trials)
+    root_sequence = np.random.SeedSequence(seed)
+    seed_sequences = root_sequence.spawn(trials)
+    chunk_size = max(1, trials // (workers * 4))
+    chunks = [seed_sequences[start:start + chunk_size] for start in range(0, trials, chunk_size)]
+    try:
+        with ProcessPoolExecutor(max_workers=workers, initializer=attach_workload,
+                                 initargs=(segment.name,)) as executor:
+            results = list(executor.map(run_trials, chunks, [layout] * len(chunks), [run_for] * len(chunks)))
+    finally:
+        segment.close()
+        segment.unlink()
+    return names, np.concatenate(results), root_sequence.entropy
+
+
+def trial_statistics(results, percentiles):
+    """
+    Summarizes the trials of every process and of the averages over the processes.
+
+    :param results: Array returned by run_lottery_trials
+    :param percentiles: Percentiles to report
+    :return: Tuple (statistics of each process, statistics of the averages). The statistics of a
+             process map each metric to its mean and percentiles over the trials it finished in, and
+             'finished' to the fraction of those trials. The statistics of the averages map each
+             metric to the mean over the trials of its average and the 95% confidence interval of that mean
+    """
+    finished = ~np.isnan(results[:, 0, :])
+    with np.errstate(all="ignore"):
+        means = np.nanmean(results, axis=0)
+        quantiles = np.nanpercentile(results, percentiles, axis=0)
+        process_statistics = [{"finished": float(finished[:, index].mean())} for index in range(results.shape[2])]
+        for metric_index, metric in enumerate(METRICS):
+            for index, statistics in enumerate(process_statistics):
+                statistics[metric] = [means[metric_index, index]] + list(quantiles[:, metric_index, index])
+
+        averages = {}
+        trial_averages = np.nanmean(results, axis=2)  # Average of each metric over the finished processes of a trial
+        for metric_index, metric in enumerate(METRICS):
+            values = trial_averages[:, metric_index]
+            values = values[~np.isnan(values)]
+            mean = values.mean() if len(values) else np.nan
+            half_width = Z_95 * values.std(ddof=1) / np.sqrt(len(values)) if len(values) > 1 else np.nan
+            averages[metric] = (mean, mean - half_width, mean + half_width)
+    return process_statistics, averages
+
+
+# Function that renders the statistics of the trials
+def trial_statistics_lines(names, process_statistics, averages, percentiles, trials, seed):
+    """
+    Renders the statistics of the trials, one line at a time.
+
+    :param names: Names of the processes
+    :param process_statistics: Statistics of each process, see trial_statistics
+    :param averages: Statistics of the averages, see trial_statistics
+    :param percentiles: Percentiles of the statistics
+    :param trials: Number of trials
+    :param seed: Seed of the run
+    """
+    yield f"{trials} lottery trials, {len(names)} processes, seed {seed}"
+    for metric in METRICS:
+        mean, low, high = averages[metric]
+        yield f"Average {metric} {mean:.3f} (95% CI {low:.3f} - {high:.3f})"
+    yield ""
+
+    columns = ["mean"] + [f"p{percentile:g}" for percentile in percentiles]
+    yield "process finished " + " ".join(f"{metric}_{column}" for metric in METRICS for column in columns)
+    for name, statistics in zip(names, process_statistics):
+        values = " ".join(f"{value:.2f}" for metric in METRICS for value in statistics[metric])
+        yield f"{name} {100 * statistics['finished']:.1f}% {values}"
+
+
+def write_trials_csv(csv_file, names, process_statistics, percentiles):
+    """
+    Writes the statistics of each process to a CSV file.
+
+    :param csv_file: Path of the CSV file
+    :param names: Names of the processes
+    :param process_statistics: Statistics of each process, see trial_statistics
+    :param percentiles: Percentiles of the statistics
+    """
+    columns = ["mean"] + [f"p{percentile:g}" for percentile in percentiles]
+    with open(csv_file, 'w', newline='') as file:
+        writer = csv.writer(file)
+        writer.writerow(["process", "finished"] + [f"{metric}_{column}" for metric in METRICS for column in columns])
+        for name, statistics in zip(names, process_statistics):
+            writer.writerow([name, round(statistics["finished"], 6)]
+                            + [round(float(value), 6) for metric in METRICS for value in statistics[metric]])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run many seeded lottery simulations of a workload in parallel")
+    parser.add_argument("input_file", help="input file (.in) or binary workload file (.wl)")
+    parser.add_argument("--trials", type=int, default=1000, help="number of independent simulations")
+    parser.add_argument("--seed", type=int, help="seed of the whole run (default: a fresh one)")
+    parser.add_argument("--workers", type=int, default=None, help="number of worker processes (default: number of CPUs)")
+    parser.add_argument("--percentiles", default="5,50,95", help="comma separated percentiles to report")
+    parser.add_argument("--csv", help="also write the statistics of each process to this CSV file")
+    args = parser.parse_args()
+
+    if np is None:
+        print("Error: The lottery trials need NumPy.")
+        sys.exit(1)
+    if args.trials < 1:
+        print("Error: The number of trials must be at least 1.")
+        sys.exit(1)
+    try:
+        percentiles = [float(percentile) for percentile in args.percentiles.split(",")]
+    except ValueError:
+        percentiles = [-1.0]
+    if not all(0 <= percentile <= 100 for percentile in percentiles):
+        print("Error: Invalid percentiles.")
+        sys.exit(1)
+    if not os.path.isfile(args.input_file):
+        print("Error: Input file not found.")
+        sys.exit(1)
+
+    start = time.perf_counter()
+    names, results, seed = run_lottery_trials(args.input_file, args.trials, args.seed, args.workers)
+    process_statistics, averages = trial_statistics(results, percentiles)
+    for line in trial_statistics_lines(names, process_statistics, averages, percentiles, args.trials, seed):
+        print(line)
+    print(f"\nDone in {time.perf_counter() - start:.3f} s")
+    if args.csv:
+        write_trials_csv(args.csv, names, process_statistics, percentiles)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,45 +1,383 @@
+import argparse
+import os
+import random
 import sys
+from collections import deque
 
 from Dependencies.data_structure import *
+from Dependencies.event_log import *
 from Dependencies.write_output_file import *
 from Dependencies.input_file_parsing import *
+from Dependencies.workload_file import *
 from Dependencies.generate_html_file import *
+from Dependencies.checkpoint import *
+from Dependencies.result_cache import *
+from Dependencies.profiling import *
+from Dependencies.metrics_sketch import *
 
 from Dependencies.Scheduler_Algorithms.sjf_scheduler import *
 from Dependencies.Scheduler_Algorithms.fifo_scheduler import *
 from Dependencies.Scheduler_Algorithms.lottery_scheduler import *
 from Dependencies.Scheduler_Algorithms.round_robin_scheduler import *
+from Dependencies.Scheduler_Algorithms.mlfq_scheduler import *
+from Dependencies.Scheduler_Algorithms.fair_scheduler import *
+from Dependencies.Scheduler_Algorithms.smp_scheduler import *
 
 
 
 
-# Main function that sets the flow of the program
-def main():
-    if len(sys.argv) != 2:
-        print("Usage: scheduler-get.py <input file>")
-        sys.exit(1)
+# Function that loads the workload of an input file
+def load_input_file(input_file):
+    """
+    Gets the algorithm, its parameters and the processes from an input file. Binary workload
+    files are memory-mapped instead of parsed.
+
+    :param input_file: Path to the input (or binary workload) file
+    :return: Tuple (process_list, run_for, algorithm, quantum)
+    """
+    if input_file.endswith(WORKLOAD_EXTENSION):
+        return load_workload_file(input_file)
+    return parse_input_file(input_file)
+
+
+# Function that loads the workload of an input file that may ask for several algorithms
+def load_input_runs(input_file, columnar=False, counts=None, with_runs=True):
+    """
+    :param input_file: Path to the input (or binary workload) file
+    :param columnar: If True, an input file is parsed into a ProcessTable, binary workload files always are
+    :param counts: Optional dict, the number of lines of an input file is stored in it under "lines"
+    :param with_runs: If False, the 'use' line of an input file is optional and ignored, see parse_input_runs
+    :return: Tuple (process_list, run_for, runs) where runs is a list of (algorithm, quantum), see parse_input_runs
+    """
+    if input_file.endswith(WORKLOAD_EXTENSION):
+        process_list, run_for, algorithm, quantum = load_workload_file(input_file)
+        return process_list, run_for, [(algorithm, quantum)]
+    return parse_input_runs(input_file, columnar, counts, with_runs)
+
 
-    input_file = sys.argv[1]
+# Function that names the files written next to an input file
+def result_file_name(input_file, suffix):
+    """
+    :param input_file: Path to the input (or binary workload) file
+    :param suffix: Replaces the extension of the input file, such as ".out" or "_out.html"
+    :return: Path of the result file
+    """
+    input_extension = WORKLOAD_EXTENSION if input_file.endswith(WORKLOAD_EXTENSION) else ".in"
+    return input_file.replace(input_extension, suffix)
 
-    # Getting algoritm, its parameters, and the processes from the input file
-    process_list, run_for, algorithm, quantum = parse_input_file(input_file)
 
-    event_log = []  # Array of lines to print in the output file
+# Function that returns the event generator of a scheduling algorithm
+def scheduler_events(process_list, run_for, algorithm, quantum, state=None, counters=None):
+    """
+    :param process_list: The processes to schedule
+    :param run_for: Total time units to run the simulation
+    :param algorithm: The scheduling algorithm to use
+    :param quantum: Parameters of the algorithm, as returned by parse_input_file
+    :param state: Optional scheduler state, see the scheduler event generators
+    :param counters: Optional dictionary for the hot-path counters of fcfs, sjf, rr and lottery
+    :return: Generator of (time, kind, process id, value) event records
+    """
+    events = []
 
     if algorithm == 'rr':
-        event_log = round_robin_scheduler(process_list, run_for, quantum)
+        events = round_robin_events(process_list, run_for, quantum, state, counters)
     elif algorithm == 'lottery':
-        event_log = lottery_scheduling(process_list, run_for)
+        events = lottery_events(process_list, run_for, state, counters)
     elif algorithm == 'sjf':
-        event_log = preemptive_sjf_scheduler(process_list, run_for)
+        events = preemptive_sjf_events(process_list, run_for, state, counters)
     elif algorithm == 'fcfs':
-        event_log = fifo_scheduler(process_list, run_for)    
-        
-    output_file = input_file.replace(".in", ".out")
-    write_output_file(output_file, process_list, algorithm, quantum, event_log, run_for)
-    
-    html_file = input_file.replace(".in", "_out.html")
-    generate_html_file(output_file, input_file, html_file)
+        events = fifo_events(process_list, run_for, state, counters)
+    elif algorithm == 'mlfq':
+        events = mlfq_events(process_list, run_for, quantum.quanta, quantum.boost_period, state)
+    elif algorithm == 'fair':
+        events = fair_events(process_list, run_for, quantum.target_latency, quantum.min_granularity, state)
+
+    return events
+
+
+# Function that runs the whole flow of the program for one input file
+def run_input_file(input_file, write_output=True, write_html=True, checkpoint_file=None, result_cache=None, seed=None,
+                   profiler=None, aggregate=False):
+    """
+    Parses an input (or binary workload) file, runs the scheduler it asks for and writes the
+    output file and the HTML report next to it. Both are rendered from the simulation results
+    in memory, and either can be skipped for metrics-only runs.
+
+    An input file may ask for several algorithms ('use all' or a list). The file is then parsed
+    once into a frozen Workload and every algorithm runs on its own per-run copy of the
+    processes, with the results written to '<name>-<algorithm>.out' and '<name>-<algorithm>_out.html'.
+
+    :param input_file: Path to the input file
+    :param write_output: Whether to write the '.out' file
+    :param write_html: Whether to write the HTML report
+    :param checkpoint_file: If given, a checkpoint of the simulation is written to this file
+    :param result_cache: Optional ResultCache, a cached result is reused instead of simulating
+    :param seed: Seed of the random generator, lottery results are only cached when it is given
+    :param profiler: Optional PhaseProfiler, each phase of the run is profiled on its own
+    :param aggregate: Whether the output file summarizes the metrics in aggregate instead of one line per process
+    :return: List of tuples (process_list, run_for, algorithm, quantum) with the metrics of the processes
+             filled in, one per algorithm in the order of the input file
+    """
+    # Without a profiler the phases are no-op context managers and their counts are skipped
+    phases = profiler or NullProfiler()
+
+    # The lines are counted by the parser, the file is not read a second time
+    parse_counts = {} if profiler else None
+    with phases.phase("parse") as phase:
+        process_list, run_for, runs = load_input_runs(input_file, counts=parse_counts)
+    if profiler:
+        phase.count(processes=len(process_list), **parse_counts)
+
+    if len(runs) == 1:
+        algorithm, quantum = runs[0]
+        output_file = result_file_name(input_file, ".out") if write_output else None
+        html_file = result_file_name(input_file, "_out.html") if write_html else None
+        run_simulation(process_list, run_for, algorithm, quantum, output_file, html_file, checkpoint_file,
+                       result_cache, seed, profiler, aggregate)
+        return [(process_list, run_for, algorithm, quantum)]
+
+    if checkpoint_file:
+        print("Error: Checkpoints are not supported with several algorithms.")
+        sys.exit(1)
+
+    workload = Workload.from_processes(process_list)
+    results = []
+    for algorithm, quantum in runs:
+        process_list = workload.new_run()
+        output_file = result_file_name(input_file, f"-{algorithm}.out") if write_output else None
+        html_file = result_file_name(input_file, f"-{algorithm}_out.html") if write_html else None
+        run_simulation(process_list, run_for, algorithm, quantum, output_file, html_file, None,
+                       result_cache, seed, profiler, aggregate)
+        results.append((process_list, run_for, algorithm, quantum))
+    return results
+
+
+# Function that runs one algorithm on the processes of a workload and writes its results
+def run_simulation(process_list, run_for, algorithm, quantum, output_file=None, html_file=None, checkpoint_file=None,
+                   result_cache=None, seed=None, profiler=None, aggregate=False):
+    """
+    :param process_list: The processes to schedule, their metrics are filled in
+    :param run_for: Total time units to run the simulation
+    :param algorithm: The scheduling algorithm to use
+    :param quantum: Parameters of the algorithm, as returned by parse_input_file
+    :param output_file: Path of the '.out' file to write, None to skip it
+    :param html_file: Path of the HTML report to write, None to skip it
+    :param checkpoint_file: If given, a checkpoint of the simulation is written to this file
+    :param result_cache: Optional ResultCache, a cached result is reused instead of simulating
+    :param seed: Seed of the random generator, lottery results are only cached when it is given
+    :param profiler: Optional PhaseProfiler, each phase of the run is profiled on its own
+    :param aggregate: Whether the output file summarizes the metrics in aggregate instead of one line per process
+    """
+    phases = profiler or NullProfiler()
+
+    # Every run starts from the seed, so it does not depend on the runs before it
+    if seed is not None:
+        random.seed(seed)
+
+    # Identical workloads reuse the stored result. A checkpoint needs the scheduler state, so it is always simulated
+    cache_key = None
+    if result_cache is not None and not checkpoint_file:
+        with phases.phase("cache", algorithm) as phase:
+            cache_key = result_cache.key(process_list, run_for, algorithm, quantum, seed, aggregate)
+            hit = bool(cache_key) and result_cache.restore(cache_key, process_list, output_file, html_file)
+        if profiler:
+            phase.count(hits=int(hit))
+        if hit:
+            return
+
+    # Metrics-only FCFS runs need no events, the closed form engine computes the metrics directly
+    if algorithm == 'fcfs' and not output_file and not html_file and not checkpoint_file:
+        with phases.phase("schedule", algorithm):
+            vectorized_fifo_scheduler(process_list, run_for)
+        if cache_key:
+            with phases.phase("cache", algorithm):
+                result_cache.store(cache_key, process_list)
+        return
+
+    # Scheduling events are generated lazily and streamed into the output file. The report needs
+    # the events a second time, and a profiled run times the scheduler apart from the writing,
+    # so the events are then kept in a compact event log
+    state = {} if checkpoint_file else None
+    counters = {} if profiler else None
+    events = scheduler_events(process_list, run_for, algorithm, quantum, state, counters)
+    if html_file or profiler:
+        with phases.phase("schedule", algorithm) as phase:
+            events = EventLog.collect(process_list, events)
+        if profiler:
+            phase.count(events=len(events), **counters)
+    elif not output_file:
+        # Metrics only, the events are consumed without being kept
+        with phases.phase("schedule", algorithm):
+            deque(events, maxlen=0)
+
+    if output_file:
+        with phases.phase("write", algorithm) as phase:
+            write_output_file(output_file, process_list, algorithm, quantum, events, run_for, aggregate)
+        if profiler:
+            phase.count(bytes=os.path.getsize(output_file))
+
+    if html_file:
+        with phases.phase("render", algorithm) as phase:
+            generate_html_file(html_file, process_list, algorithm, quantum, events, run_for)
+        if profiler:
+            phase.count(bytes=os.path.getsize(html_file))
+
+    if checkpoint_file:
+        with phases.phase("checkpoint", algorithm) as phase:
+            save_checkpoint(checkpoint_file, process_list, run_for, algorithm, quantum, state, output_file)
+        if profiler:
+            phase.count(bytes=os.path.getsize(checkpoint_file))
+    if cache_key:
+        with phases.phase("cache", algorithm):
+            result_cache.store(cache_key, process_list, output_file, html_file)
+
+
+# Function that resumes a checkpointed simulation with a larger 'runfor'
+def resume_checkpoint(checkpoint_file, run_for, write_output=True, new_checkpoint_file=None):
+    """
+    Carries a checkpointed simulation on until a larger 'runfor'. The simulation continues where
+    it stopped, the new events are appended to the trace of its output file and the checkpoint
+    is updated, so it can be extended again. The HTML report is not updated.
+
+    :param checkpoint_file: Path to the checkpoint file
+    :param run_for: New total time units to run the simulation, larger than the one of the checkpoint
+    :param write_output: Whether to extend the output file of the checkpoint
+    :param new_checkpoint_file: Where to write the new checkpoint, defaults to checkpoint_file
+    :return: Tuple (process_list, run_for, algorithm, quantum) with the metrics of the processes filled in
+    """
+    checkpoint = load_checkpoint(checkpoint_file)
+    process_list = checkpoint["processes"]
+    algorithm = checkpoint["algorithm"]
+    quantum = checkpoint["quantum"]
+    state = checkpoint["state"]
+    if run_for <= checkpoint["run_for"]:
+        print(f"Error: 'runfor' must be larger than {checkpoint['run_for']} to resume the checkpoint.")
+        sys.exit(1)
+
+    output_file = checkpoint["output_file"] if write_output else None
+    if output_file:
+        truncate_output_footer(output_file, process_list, checkpoint["run_for"])
+
+    random.setstate(checkpoint["random_state"])
+    events = scheduler_events(process_list, run_for, algorithm, quantum, state)
+    if output_file:
+        append_output_file(output_file, process_list, events, run_for)
+    else:
+        deque(events, maxlen=0)
+
+    save_checkpoint(new_checkpoint_file or checkpoint_file, process_list, run_for, algorithm, quantum, state, output_file)
+    return process_list, run_for, algorithm, quantum
+
+
+# Function that runs one input file on several simulated CPUs
+def run_smp_input_file(input_file, cpu_count, work_stealing=True, write_output=True):
+    """
+    Parses an input (or binary workload) file and runs its algorithm on several CPUs with the
+    multiprocessor scheduler. The output file carries the CPU of each event and the utilization
+    of each CPU. No HTML report is written, its Gantt chart has a single CPU row.
+
+    :param input_file: Path to the input file
+    :param cpu_count: Number of simulated CPUs
+    :param work_stealing: Whether idle CPUs steal processes from the other run queues
+    :param write_output: Whether to write the '.out' file
+    :return: Tuple (process_list, run_for, algorithm, quantum, cpus) with the metrics filled in
+    """
+    process_list, run_for, algorithm, quantum = load_input_file(input_file)
+    if algorithm not in SMP_ALGORITHMS:
+        print(f"Error: Multiple CPUs are only supported for {', '.join(SMP_ALGORITHMS)}.")
+        sys.exit(1)
+
+    cpus = [CPU(cpu_id) for cpu_id in range(cpu_count)]
+    events = smp_events(process_list, run_for, algorithm, quantum, cpus, work_stealing)
+    if write_output:
+        output_file = result_file_name(input_file, ".out")
+        write_smp_output_file(output_file, process_list, algorithm, quantum, cpus, events, run_for)
+    else:
+        deque(events, maxlen=0)
+
+    return process_list, run_for, algorithm, quantum, cpus
+
+
+# Main function that sets the flow of the program
+def main():
+    parser = argparse.ArgumentParser(description="Simulate a process scheduling algorithm")
+    parser.add_argument("input_file", nargs="?", help="input file (.in) or binary workload file (.wl)")
+    parser.add_argument("--no-output", action="store_true", help="do not write the '.out' file, print the metrics instead")
+    parser.add_argument("--no-html", action="store_true", help="do not write the HTML report")
+    parser.add_argument("--cpus", type=int, default=1, help="number of simulated CPUs (fcfs, sjf and rr only)")
+    parser.add_argument("--no-stealing", action="store_true", help="idle CPUs do not steal processes from other run queues")
+    parser.add_argument("--checkpoint", help="write a checkpoint of the simulation to this file")
+    parser.add_argument("--resume", help="resume the simulation of a checkpoint file instead of running an input file")
+    parser.add_argument("--runfor", type=int, help="new 'runfor' of a resumed simulation")
+    parser.add_argument("--seed", type=int, help="seed of the random generator (lottery)")
+    parser.add_argument("--cache", help="directory of a result cache, identical workloads reuse its results")
+    parser.add_argument("--cache-size", type=int, default=DEFAULT_CACHE_SIZE >> 20, help="size limit of the result cache, in MiB")
+    parser.add_argument("--aggregate", action="store_true",
+                        help="summarize the metrics (count, mean, percentiles, largest values) instead of one line per process")
+    parser.add_argument("--profile", metavar="FILE", help="write the wall time, CPU time, memory and counts of each phase as JSON ('-' for stdout)")
+    parser.add_argument("--cprofile", metavar="PHASE", action="append", default=[], choices=PROFILE_PHASES,
+                        help="run a phase under cProfile in the profile (repeatable)")
+    parser.add_argument("--tracemalloc", metavar="PHASE", action="append", default=[], choices=PROFILE_PHASES,
+                        help="run a phase under tracemalloc in the profile (repeatable)")
+    args = parser.parse_args()
+    if (args.input_file is None) == (args.resume is None) or (args.resume is not None) != (args.runfor is not None):
+        parser.print_usage()
+        sys.exit(1)
+    if args.cpus < 1:
+        print("Error: The number of CPUs must be at least 1.")
+        sys.exit(1)
+    if args.cpus > 1 and (args.checkpoint or args.resume):
+        print("Error: Checkpoints are not supported with multiple CPUs.")
+        sys.exit(1)
+    if args.aggregate and (args.cpus > 1 or args.checkpoint or args.resume):
+        print("Error: Aggregate metrics are not supported with multiple CPUs or checkpoints.")
+        sys.exit(1)
+    if (args.cprofile or args.tracemalloc) and not args.profile:
+        print("Error: --cprofile and --tracemalloc need --profile.")
+        sys.exit(1)
+    if args.profile and (args.cpus > 1 or args.resume):
+        print("Error: Profiling is not supported with multiple CPUs or resumed checkpoints.")
+        sys.exit(1)
+
+    write_output = not args.no_output
+    if args.resume:
+        process_list, run_for, algorithm, quantum = resume_checkpoint(args.resume, args.runfor, write_output,
+                                                                      args.checkpoint)
+    elif args.cpus > 1:
+        process_list, run_for, algorithm, quantum, cpus = run_smp_input_file(args.input_file, args.cpus,
+                                                                             not args.no_stealing, write_output)
+    else:
+        result_cache = ResultCache(args.cache, args.cache_size << 20) if args.cache else None
+        profiler = PhaseProfiler(args.cprofile, args.tracemalloc) if args.profile else None
+        results = run_input_file(args.input_file, write_output, not args.no_html, args.checkpoint, result_cache,
+                                 args.seed, profiler, args.aggregate)
+        if profiler:
+            process_list, run_for = results[0][:2]
+            profiler.write(args.profile, input_file=args.input_file,
+                           algorithm=",".join(algorithm for _, _, algorithm, _ in results),
+                           processes=len(process_list), run_for=run_for)
+
+        # Without an output file the process metrics are printed instead, under the name of each
+        # algorithm when the input file asks for several
+        if not write_output:
+            for index, (process_list, run_for, algorithm, quantum) in enumerate(results):
+                if len(results) > 1:
+                    print(("\n" if index else "") + f"{algorithm}:")
+                if args.aggregate:
+                    lines = aggregate_summary_lines(MetricsAggregate.from_processes(process_list))
+                else:
+                    lines = process_summary_lines(process_list)
+                for line in lines:
+                    print(line)
+        return
+
+    # Without an output file the process metrics are printed instead
+    if not write_output:
+        for line in process_summary_lines(process_list):
+            print(line)
+        if args.cpus > 1:
+            for line in smp_summary_lines(process_list, cpus, run_for):
+                print(line)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
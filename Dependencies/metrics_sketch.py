@@ -0,0 +1,184 @@
+import heapq
+import math
+
+"""
+This file contains the aggregate metrics of a run, for workloads too large to read (or keep) one
+summary line per process. Each metric (wait, turnaround and response time) keeps its count, sum,
+minimum and maximum, a quantile sketch and its largest values with the names of their processes,
+all in a memory that does not grow with the number of processes.
+
+The sketch follows DDSketch: a value v is counted in the bucket ceil(log(v) / log(gamma)) with
+gamma = (1 + alpha) / (1 - alpha), so every quantile it returns is within a relative error alpha
+of the true one. The buckets only grow with the logarithm of the range of the values, and the
+lowest ones are merged if they ever pass a fixed limit.
+"""
+
+DEFAULT_RELATIVE_ACCURACY = 0.01
+DEFAULT_MAX_BUCKETS = 2048
+DEFAULT_OUTLIERS = 10
+AGGREGATE_QUANTILES = (50, 90, 99, 99.9)
+
+# Metrics of the aggregate and the attribute of the process each one is read from
+AGGREGATE_METRICS = {"wait": "waiting_time", "turnaround": "turnaround_time", "response": "response_time"}
+
+
+class QuantileSketch:
+    """
+    Streaming quantile sketch with a relative error guarantee (DDSketch) for non-negative values.
+    """
+
+    def __init__(self, relative_accuracy=DEFAULT_RELATIVE_ACCURACY, max_buckets=DEFAULT_MAX_BUCKETS):
+        """
+        :param relative_accuracy: Relative error of the quantiles, between 0 and 1
+        :param max_buckets: Largest number of buckets, the lowest ones are merged past it
+        """
+        self.gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self.log_gamma = math.log(self.gamma)
+        self.max_buckets = max_buckets
+        self.buckets = {}       # Count of the values of each bucket, by bucket index
+        self.zero_count = 0     # Values too small to have a bucket, zero included
+        self.count = 0
+
+    def add(self, value):
+        """
+        Counts one value.
+
+        :param value: The value, non-negative
+        """
+        self.count += 1
+        if value <= 0:
+            self.zero_count += 1
+            return
+
+        index = math.ceil(math.log(value) / self.log_gamma)
+        buckets = self.buckets
+        buckets[index] = buckets.get(index, 0) + 1
+        if len(buckets) > self.max_buckets:
+            # The lowest quantiles lose their accuracy first, the high ones are the ones read
+            lowest, second = sorted(buckets)[:2]
+            buckets[second] += buckets.pop(lowest)
+
+    def quantile(self, percent):
+        """
+        :param percent: The quantile, as a percentage between 0 and 100
+        :return: Estimate of the nearest-rank quantile (see nearest_rank), None if no value was counted
+        """
+        if not self.count:
+            return None
+        rank = max(math.ceil(round(percent * self.count / 100, 9)), 1)  # Rounded, 2.2% of 1500 is not 34
+        if rank <= self.zero_count:
+            return 0.0
+
+        cumulative = self.zero_count
+        for index in sorted(self.buckets):
+            cumulative += self.buckets[index]
+            if cumulative >= rank:
+                break
+        # Middle of the bucket, in relative terms, so the error is at most alpha either way
+        return 2 * self.gamma ** index / (self.gamma + 1)
+
+
+class MetricsAggregate:
+    """
+    Aggregate of the metrics of the processes of a run, see the top of this file.
+    """
+
+    def __init__(self, outliers=DEFAULT_OUTLIERS, relative_accuracy=DEFAULT_RELATIVE_ACCURACY):
+        """
+        :param outliers: Number of largest values kept for each metric
+        :param relative_accuracy: Relative error of the quantiles
+        """
+        self.outliers = outliers
+        self.processes = 0
+        self.finished = 0
+        self.sums = dict.fromkeys(AGGREGATE_METRICS, 0)
+        self.minimums = dict.fromkeys(AGGREGATE_METRICS)
+        self.maximums = dict.fromkeys(AGGREGATE_METRICS)
+        self.sketches = {metric: QuantileSketch(relative_accuracy) for metric in AGGREGATE_METRICS}
+        # Min-heaps of (value, -process number, name), the smallest of the kept values is replaced first
+        self.largest = {metric: [] for metric in AGGREGATE_METRICS}
+
+    @classmethod
+    def from_processes(cls, process_list, outliers=DEFAULT_OUTLIERS):
+        """
+        :param process_list: List of Process (or ProcessTable) of a run
+        :param outliers: Number of largest values kept for each metric
+        :return: The aggregate of the metrics of the processes
+        """
+        aggregate = cls(outliers)
+        for process in process_list:
+            aggregate.add(process)
+        return aggregate
+
+    def add(self, process):
+        """
+        Adds the metrics of one process, which only counts as unfinished if it did not finish.
+
+        :param process: The Process
+        """
+        self.processes += 1
+        if process.finish_time == -1:
+            return
+        self.finished += 1
+
+        for metric, attribute in AGGREGATE_METRICS.items():
+            value = getattr(process, attribute)
+            self.sums[metric] += value
+            if self.minimums[metric] is None or value < self.minimums[metric]:
+                self.minimums[metric] = value
+            if self.maximums[metric] is None or value > self.maximums[metric]:
+                self.maximums[metric] = value
+            self.sketches[metric].add(value)
+
+            largest = self.largest[metric]
+            if len(largest) < self.outliers:
+                heapq.heappush(largest, (value, -self.processes, process.name))
+            elif largest and value > largest[0][0]:
+                heapq.heapreplace(largest, (value, -self.processes, process.name))
+
+    def mean(self, metric):
+        """
+        :param metric: One of AGGREGATE_METRICS
+        :return: Mean of the metric over the finished processes, None if none finished
+        """
+        return self.sums[metric] / self.finished if self.finished else None
+
+    def quantile(self, metric, percent):
+        """
+        :param metric: One of AGGREGATE_METRICS
+        :param percent: The quantile, as a percentage between 0 and 100
+        :return: Estimate of the quantile of the metric, within its exact extremes, None if no process finished
+        """
+        estimate = self.sketches[metric].quantile(percent)
+        if estimate is None:
+            return None
+        return min(max(estimate, self.minimums[metric]), self.maximums[metric])
+
+    def outliers_of(self, metric):
+        """
+        :param metric: One of AGGREGATE_METRICS
+        :return: List of (name, value) of the largest values of the metric, largest first
+        """
+        return [(name, value) for value, _, name in sorted(self.largest[metric], reverse=True)]
+
+
+# Function that renders an aggregate of the metrics
+def aggregate_summary_lines(aggregate):
+    """
+    Renders the count, mean, extremes and quantiles of each metric, then the processes with the
+    largest values of each metric, one line at a time.
+
+    :param aggregate: The MetricsAggregate
+    """
+    yield f"{aggregate.finished} of {aggregate.processes} processes finished"
+    if not aggregate.finished:
+        return
+
+    for metric in AGGREGATE_METRICS:
+        quantiles = " ".join(f"p{percent:g} {aggregate.quantile(metric, percent):.1f}" for percent in AGGREGATE_QUANTILES)
+        yield (f"{metric} mean {aggregate.mean(metric):.3f} min {aggregate.minimums[metric]} {quantiles} "
+               f"max {aggregate.maximums[metric]}")
+    for metric in AGGREGATE_METRICS:
+        outliers = ", ".join(f"{name} {value}" for name, value in aggregate.outliers_of(metric))
+        if outliers:
+            yield f"Largest {metric}: {outliers}"
@@ -0,0 +1,191 @@
+import argparse
+import sys
+from itertools import chain, islice
+
+from Dependencies.data_structure import Process
+from Dependencies.event_log import EVENT_FINISHED, EVENT_IDLE, format_events
+from Dependencies.input_file_parsing import values
+from Dependencies.metrics_sketch import MetricsAggregate, aggregate_summary_lines
+from Dependencies.write_output_file import OUTPUT_BUFFER_SIZE, output_header_lines
+from Dependencies.Scheduler_Algorithms.round_robin_scheduler import online_round_robin_events
+from Dependencies.Scheduler_Algorithms.sjf_scheduler import online_preemptive_sjf_events
+
+"""
+This file contains the online mode of the program, which schedules an unbounded stream of
+arrivals read from the standard input (or a pipe) instead of an input file loaded up front, to
+replay long job logs with Round Robin or Preemptive Shortest Job First.
+
+The stream uses the input file format. The 'use' line (and 'quantum' for rr) must come before the
+first process, 'runfor' is optional (without it the simulation runs until the stream ends and
+every process finished) and 'processcount' is ignored. The processes must be in arrival order.
+A process is read when the simulation reaches its arrival time and dropped once it finished, so
+the memory used grows with the number of processes in the system, not with the length of the stream.
+
+The metrics of each process are written and flushed as soon as it finishes in the simulation, so
+the summary is in completion order. The processes that did not finish are listed at the end,
+followed by the end time and the number of processes. The events are only written when --events
+is given.
+
+With --aggregate no line is written per process. The metrics are summarized at the end by their
+count, mean, percentiles and largest values, in a memory that does not grow with the stream.
+
+Usage:
+    <job log> | python3 -m Dependencies.online [--output FILE] [--events FILE | -] [--aggregate]
+"""
+
+ONLINE_ALGORITHMS = ('rr', 'sjf')
+
+
+# Function that reads the parameters of a stream and returns its arrivals
+def read_online_stream(lines):
+    """
+    Reads the parameters at the start of a stream in the input file format, up to its first process.
+
+    :param lines: Iterator of the lines of the stream
+    :return: Tuple (run_for, algorithm, quantum, arrivals) where run_for is None if the stream has no
+             'runfor' and arrivals is a generator of the Process of the stream, read lazily
+    """
+    run_for = None
+    algorithm = None
+    quantum = None
+    first_process = None
+
+    for line in lines:
+        parts = line.split()
+        if not parts:
+            continue
+        keyword = parts[0]
+        if keyword == "process":
+            first_process = parts
+            break
+        elif keyword == "runfor":
+            run_for = int(parts[1])
+        elif keyword == "use":
+            algorithm = " ".join(values(parts)).lower()
+            if algorithm not in ONLINE_ALGORITHMS:
+                print(f"Error: The online mode only supports {', '.join(ONLINE_ALGORITHMS)}.")
+                sys.exit(1)
+        elif keyword == "quantum":
+            quantum = int(parts[1])
+        elif keyword == "end":
+            break
+
+    if algorithm is None:
+        print("Error: Missing parameter for 'use'.")
+        sys.exit(1)
+    if algorithm == 'rr' and not quantum:
+        print("Error: Missing 'quantum' parameter when use is 'rr'.")
+        sys.exit(1)
+    return run_for, algorithm, quantum, stream_arrivals(first_process, lines)
+
+
+# Generator of the processes of a stream
+def stream_arrivals(first_process, lines):
+    """
+    :param first_process: Split line of the first process, None if the stream has no process
+    :param lines: Iterator of the lines of the stream after the first process
+    :return: Generator of the Process of the stream, up to its 'end' line or its end
+    """
+    if first_process is None:
+        return
+
+    last_arrival = 0
+    for parts in chain([first_process], (line.split() for line in lines)):
+        if not parts or parts[0] != "process":
+            if parts and parts[0] == "end":
+                return
+            continue
+        if len(parts) < 7 or parts[1] != "name" or parts[3] != "arrival" or parts[5] != "burst":
+            print("Error: Invalid process specification.")
+            sys.exit(1)
+        process = Process(parts[2], int(parts[4]), int(parts[6]))
+        if process.arrival_time < last_arrival:
+            print(f"Error: {process.name} arrives before the process above it, the stream must be in arrival order.")
+            sys.exit(1)
+        last_arrival = process.arrival_time
+        yield process
+
+
+# Function that runs the simulation of a stream
+def run_online(lines, output, events_output=None, aggregate=False):
+    """
+    Schedules the arrivals of a stream as they are read, writing the metrics of each process
+    to the output as soon as it finishes.
+
+    :param lines: Iterable of the lines of the stream
+    :param output: Text stream the summary is written to
+    :param events_output: Text stream the events are written to, None to skip them
+    :param aggregate: Whether to summarize the metrics in aggregate at the end instead of one line per process
+    :return: Tuple (number of processes, number of finished processes)
+    """
+    run_for, algorithm, quantum, arrivals = read_online_stream(iter(lines))
+    live = {}
+    if algorithm == 'rr':
+        events = online_round_robin_events(arrivals, run_for, quantum, live)
+    else:
+        events = online_preemptive_sjf_events(arrivals, run_for, live)
+
+    # The process count is only known at the end of the stream, it closes the summary instead
+    for line in islice(output_header_lines((), algorithm, quantum), 1, None):
+        output.write(line + "\n")
+    output.flush()
+
+    metrics = MetricsAggregate() if aggregate else None
+    finished = end_time = 0
+    for record in events:
+        time, kind, process_id, value = record
+        if events_output is not None:
+            events_output.writelines(line + "\n" for line in format_events(live, (record,)))
+        if kind == EVENT_FINISHED:
+            process = live[process_id]
+            if metrics is not None:
+                metrics.add(process)
+            else:
+                output.write(f"{process.name} wait {process.waiting_time} turnaround {process.turnaround_time} "
+                             f"response {process.response_time}\n")
+                output.flush()
+            finished += 1
+            end_time = time
+        elif kind == EVENT_IDLE:
+            end_time = time + value
+
+    # The processes still in the system, then the ones the simulation never reached
+    processes = finished
+    for process in chain(live.values(), arrivals):
+        if metrics is not None:
+            metrics.add(process)
+        else:
+            output.write(f"{process.name} did not finish\n")
+        processes += 1
+    if metrics is not None:
+        output.writelines(line + "\n" for line in aggregate_summary_lines(metrics))
+    output.write(f"Finished at time {end_time if run_for is None else run_for}\n")
+    output.write(f"{processes} processes\n")
+    output.flush()
+    return processes, finished
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Schedule a stream of arrivals read from the standard input")
+    parser.add_argument("--output", help="write the summary to this file instead of the standard output")
+    parser.add_argument("--events", metavar="FILE", help="also write the events to this file ('-' for the standard output)")
+    parser.add_argument("--aggregate", action="store_true",
+                        help="summarize the metrics (count, mean, percentiles, largest values) instead of one line per process")
+    args = parser.parse_args()
+
+    output = open(args.output, 'w') if args.output else sys.stdout
+    events_output = None
+    if args.events == "-":
+        events_output = sys.stdout
+    elif args.events:
+        events_output = open(args.events, 'w', buffering=OUTPUT_BUFFER_SIZE)
+    try:
+        run_online(sys.stdin, output, events_output, args.aggregate)
+    finally:
+        for stream in (output, events_output):
+            if stream is not None and stream is not sys.stdout:
+                stream.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,166 @@
+import contextlib
+import cProfile
+import json
+import pstats
+import sys
+import time
+import tracemalloc
+
+try:
+    import resource
+except ImportError:  # resource is Unix only, the peak RSS is then not reported
+    resource = None
+
+"""
+This file contains the per-phase profiling of a run. Each phase of a run (parse, schedule,
+write, render...) records its wall time, CPU time, the growth of the peak RSS of the process and
+its own counts (lines parsed, events emitted, bytes written), and the whole profile is written
+as JSON. Any phase can also be run under cProfile, for its most expensive functions, or under
+tracemalloc, for its peak traced memory and its largest allocation sites.
+"""
+
+PROFILE_PHASES = ("parse", "cache", "schedule", "write", "render", "checkpoint")
+TOP_ENTRIES = 20        # Number of functions and allocation sites reported per phase
+
+
+# Function that gets the peak RSS of the process so far
+def peak_rss_kb():
+    """
+    :return: Peak resident set size of the process in KiB, None where it is not available
+    """
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak // 1024 if sys.platform == "darwin" else peak  # macOS reports bytes
+
+
+class PhaseProfiler:
+    """
+    Collects the profiles of the phases of a run, in the order they ran.
+    """
+
+    def __init__(self, cprofile_phases=(), tracemalloc_phases=()):
+        """
+        :param cprofile_phases: Names of the phases to run under cProfile
+        :param tracemalloc_phases: Names of the phases to run under tracemalloc
+        """
+        self.cprofile_phases = set(cprofile_phases)
+        self.tracemalloc_phases = set(tracemalloc_phases)
+        self.phases = []
+        self.start = time.perf_counter()
+
+    def phase(self, name, algorithm=None):
+        """
+        :param name: Name of the phase, one of PROFILE_PHASES
+        :param algorithm: Algorithm the phase runs for, when an input file runs several
+        :return: Context manager timing the phase, its counts are added with count()
+        """
+        return ProfiledPhase(self, name, algorithm)
+
+    def report(self, **run):
+        """
+        :param run: Description of the run (input file, algorithm, process count...)
+        :return: Dictionary with the run, its phases and its total wall time
+        """
+        return dict(run, phases=[phase.record for phase in self.phases],
+                    total_wall_seconds=round(time.perf_counter() - self.start, 6))
+
+    def write(self, profile_file, **run):
+        """
+        Writes the report as JSON, to the standard output if profile_file is '-'.
+
+        :param profile_file: Path of the JSON file
+        :param run: Description of the run, see report()
+        """
+        report = json.dumps(self.report(**run), indent=2)
+        if profile_file == "-":
+            print(report)
+        else:
+            with open(profile_file, 'w') as file:
+                file.write(report + "\n")
+
+
+class NullProfiler:
+    """
+    Stands in for a PhaseProfiler when a run is not profiled. Its phases are no-op context
+    managers, nothing is measured or kept.
+    """
+
+    def phase(self, name, algorithm=None):
+        """
+        :param name: Name of the phase, one of PROFILE_PHASES
+        :param algorithm: Algorithm the phase runs for, when an input file runs several
+        :return: contextlib.nullcontext, it gives no phase to add counts to
+        """
+        return contextlib.nullcontext()
+
+
+class ProfiledPhase:
+    """
+    One phase of a profiled run.
+    """
+
+    def __init__(self, profiler, name, algorithm=None):
+        self.profiler = profiler
+        self.record = {"phase": name, "counts": {}}
+        if algorithm:
+            self.record["algorithm"] = algorithm
+        self.cprofile = cProfile.Profile() if name in profiler.cprofile_phases else None
+        self.tracemalloc = name in profiler.tracemalloc_phases
+        self.was_tracing = False
+
+    def count(self, **counts):
+        """
+        Adds counts to the phase, such as count(lines=..., bytes=...).
+        """
+        self.record["counts"].update(counts)
+
+    def __enter__(self):
+        if self.tracemalloc:
+            self.was_tracing = tracemalloc.is_tracing()
+            if self.was_tracing:
+                tracemalloc.reset_peak()
+            else:
+                tracemalloc.start()
+        self.start_rss = peak_rss_kb()
+        self.start_cpu = time.process_time()
+        self.start_wall = time.perf_counter()
+        if self.cprofile:
+            self.cprofile.enable()
+        return self
+
+    def __exit__(self, *exc_info):
+        if self.cprofile:
+            self.cprofile.disable()
+        wall_seconds = time.perf_counter() - self.start_wall
+        cpu_seconds = time.process_time() - self.start_cpu
+        end_rss = peak_rss_kb()
+
+        record = self.record
+        record["wall_seconds"] = round(wall_seconds, 6)
+        record["cpu_seconds"] = round(cpu_seconds, 6)
+        record["peak_rss_kb"] = end_rss
+        # The peak RSS never goes down, the phase that raised it is the one to blame
+        record["peak_rss_growth_kb"] = None if end_rss is None else end_rss - self.start_rss
+
+        if self.tracemalloc:
+            _, peak = tracemalloc.get_traced_memory()
+            statistics = tracemalloc.take_snapshot().statistics("lineno")[:TOP_ENTRIES]
+            if not self.was_tracing:
+                tracemalloc.stop()
+            record["tracemalloc"] = {
+                "peak_bytes": peak,
+                "top_allocations": [{"location": f"{stat.traceback[0].filename}:{stat.traceback[0].lineno}",
+                                     "bytes": stat.size, "blocks": stat.count} for stat in statistics],
+            }
+
+        if self.cprofile:
+            stats = pstats.Stats(self.cprofile).stats
+            functions = sorted(stats.items(), key=lambda item: item[1][3], reverse=True)[:TOP_ENTRIES]
+            record["cprofile"] = [{"function": f"{file}:{line}({function})", "calls": calls,
+                                   "total_seconds": round(total, 6), "cumulative_seconds": round(cumulative, 6)}
+                                  for (file, line, function), (_, calls, total, cumulative, _) in functions]
+
+        self.profiler.phases.append(self)
+        return False
+
@@ -0,0 +1,304 @@
+import hashlib
+import json
+import os
+import shutil
+import sys
+import tempfile
+from array import array
+
+from Dependencies.data_structure import *
+from Dependencies.input_file_parsing import *
+
+try:
+    import fcntl
+except ImportError:  # fcntl is Unix only, the cache then works without locking
+    fcntl = None
+
+"""
+This file contains the content-addressed result cache. A result is stored under a hash of the
+normalized parsed workload (processes, runfor, algorithm, its parameters and the random seed for
+lottery) and of the engine version, so two input files describing the same workload share their
+result whatever their formatting, comments or file name. A hit copies the stored output file
+and HTML report and restores the process metrics without simulating.
+
+Entries are directories under '<cache>/entries'. The least recently used entries are evicted
+once the cache grows past its size limit, and the hit, miss and eviction counts are kept in
+'<cache>/statistics.json'. Updates are serialized with a lock file, so the workers of a batch
+can share a cache.
+
+Usage:
+    python3 -m Dependencies.result_cache <cache directory> [--clear]
+"""
+
+# Version of the scheduling engines. It is part of every key, bump it whenever a change to a
+# scheduler or to the output format changes the results, so stale entries are never hit
+ENGINE_VERSION = "4"
+
+DEFAULT_CACHE_SIZE = 1 << 30    # 1 GiB
+
+# Per-run columns stored with each entry, the arrival and burst times are part of the key
+METRIC_COLUMNS = [column for column in PROCESS_TABLE_COLUMNS if column not in ("arrival_time", "burst_time")]
+
+OUTPUT_NAME = "output.out"
+HTML_NAME = "report.html"
+METRICS_NAME = "metrics.bin"
+
+
+class ResultCache:
+    """
+    On-disk cache of simulation results with a size limit and least recently used eviction.
+    """
+
+    def __init__(self, directory, max_bytes=DEFAULT_CACHE_SIZE):
+        """
+        :param directory: Directory of the cache, created if needed
+        :param max_bytes: Size limit of the stored entries, in bytes
+        """
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.entries_directory = os.path.join(directory, "entries")
+        self.statistics_file = os.path.join(directory, "statistics.json")
+        self.lock_file = os.path.join(directory, "lock")
+        os.makedirs(self.entries_directory, exist_ok=True)
+
+    def key(self, process_list, run_for, algorithm, quantum, seed=None, aggregate=False):
+        """
+        Hashes a normalized workload. The processes are hashed as the raw 64-bit columns of a
+        ProcessTable, so a list and a table of the same processes have the same key.
+
+        :param process_list: List of Process (or ProcessTable) of the workload
+        :param run_for: Total time units to run the simulation
+        :param algorithm: The scheduling algorithm to use
+        :param quantum: Parameters of the algorithm, as returned by parse_input_file
+        :param seed: Seed of the random generator, only used by lottery
+        :param aggregate: Whether the output file has aggregate metrics instead of one line per process
+        :return: Hexadecimal key, or None when the result is not deterministic (lottery without a seed)
+        """
+        if algorithm == 'lottery' and seed is None:
+            return None
+
+        digest = hashlib.sha256()
+        parameters = [ENGINE_VERSION, run_for, algorithm, quantum, seed if algorithm == 'lottery' else None]
+        if aggregate:
+            parameters.append("aggregate")  # Keeps the keys of the other results unchanged
+        digest.update(repr(parameters).encode())
+
+        if isinstance(process_list, ProcessTable):
+            columns = (process_list.columns["arrival_time"], process_list.columns["burst_time"],
+                       process_list.name_offsets)
+            name_data = process_list.name_data
+        else:
+            columns = (array("q", [process.arrival_time for process in process_list]),
+                       array("q", [process.burst_time for process in process_list]),
+                       array("q", [0]))
+            names = [process.name.encode() for process in process_list]
+            for name in names:
+                columns[2].append(columns[2][-1] + len(name))
+            name_data = b"".join(names)
+        for column in columns:
+            digest.update(memoryview(column).cast("B"))
+        digest.update(name_data)
+        return digest.hexdigest()
+
+    def restore(self, key, process_list, output_file=None, html_file=None):
+        """
+        Looks a result up. On a hit the stored files are copied and the metrics of the processes
+        are restored. An entry without one of the requested files counts as a miss.
+
+        :param key: Key of the workload
+        :param process_list: The processes of the workload, their metrics are filled in on a hit
+        :param output_file: Where to copy the output file, None if it is not needed
+        :param html_file: Where to copy the HTML report, None if it is not needed
+        :return: True on a hit, False on a miss
+        """
+        entry = os.path.join(self.entries_directory, key)
+        needed = [METRICS_NAME] + [name for name, path in ((OUTPUT_NAME, output_file), (HTML_NAME, html_file)) if path]
+        try:
+            with open(os.path.join(entry, METRICS_NAME), 'rb') as file:
+                metrics = file.read()
+            if not all(os.path.exists(os.path.join(entry, name)) for name in needed):
+                raise FileNotFoundError
+            if output_file:
+                shutil.copyfile(os.path.join(entry, OUTPUT_NAME), output_file)
+            if html_file:
+                shutil.copyfile(os.path.join(entry, HTML_NAME), html_file)
+            os.utime(entry)  # Marks the entry as recently used
+        except FileNotFoundError:
+            # Missing, partial or just evicted entry
+            self.update_statistics(misses=1)
+            return False
+
+        load_metrics(process_list, metrics)
+        self.update_statistics(hits=1)
+        return True
+
+    def store(self, key, process_list, output_file=None, html_file=None):
+        """
+        Stores a result, replacing the entry of the key if there is one, then evicts the least
+        recently used entries if the cache is over its size limit.
+
+        :param key: Key of the workload
+        :param process_list: The processes of the workload, with their metrics
+        :param output_file: Output file of the run, None if none was written
+        :param html_file: HTML report of the run, None if none was written
+        """
+        # The entry is built aside and moved in place, so a reader never sees a partial entry
+        staging = tempfile.mkdtemp(dir=self.directory, prefix="staging-")
+        with open(os.path.join(staging, METRICS_NAME), 'wb') as file:
+            file.write(dump_metrics(process_list))
+        if output_file:
+            shutil.copyfile(output_file, os.path.join(staging, OUTPUT_NAME))
+        if html_file:
+            shutil.copyfile(html_file, os.path.join(staging, HTML_NAME))
+
+        entry = os.path.join(self.entries_directory, key)
+        with self.locked():
+            if os.path.isdir(entry):
+                shutil.rmtree(entry)
+            os.rename(staging, entry)
+            self.evict()
+
+    def evict(self):
+        """
+        Removes the least recently used entries until the cache is under its size limit.
+        Must be called with the lock held.
+        """
+        entries = []
+        total_size = 0
+        for key in os.listdir(self.entries_directory):
+            entry = os.path.join(self.entries_directory, key)
+            size = sum(os.path.getsize(os.path.join(entry, name)) for name in os.listdir(entry))
+            entries.append((os.path.getmtime(entry), size, entry))
+            total_size += size
+
+        evictions = 0
+        entries.sort()
+        for _, size, entry in entries:
+            if total_size <= self.max_bytes:
+                break
+            shutil.rmtree(entry, ignore_errors=True)
+            total_size -= size
+            evictions += 1
+        if evictions:
+            self.update_statistics(evictions=evictions, locked=True)
+
+    def statistics(self):
+        """
+        :return: Dictionary with the hits, misses and evictions so far, and the current number of entries and size in bytes
+        """
+        statistics = self.read_statistics()
+        entries = os.listdir(self.entries_directory)
+        statistics["entries"] = len(entries)
+        statistics["bytes"] = sum(os.path.getsize(os.path.join(self.entries_directory, key, name))
+                                  for key in entries for name in os.listdir(os.path.join(self.entries_directory, key)))
+        return statistics
+
+    def read_statistics(self):
+        try:
+            with open(self.statistics_file, 'r') as file:
+                return json.load(file)
+        except (FileNotFoundError, ValueError):
+            return {"hits": 0, "misses": 0, "evictions": 0}
+
+    def update_statistics(self, hits=0, misses=0, evictions=0, locked=False):
+        """
+        Adds to the hit, miss and eviction counts.
+
+        :param locked: Whether the caller already holds the lock
+        """
+        if not locked:
+            with self.locked():
+                return self.update_statistics(hits, misses, evictions, locked=True)
+
+        statistics = self.read_statistics()
+        statistics["hits"] += hits
+        statistics["misses"] += misses
+        statistics["evictions"] += evictions
+        temporary_file = self.statistics_file + ".tmp"
+        with open(temporary_file, 'w') as file:
+            json.dump(statistics, file)
+        os.replace(temporary_file, self.statistics_file)
+
+    def clear(self):
+        """
+        Removes every entry and resets the statistics.
+        """
+        with self.locked():
+            shutil.rmtree(self.entries_directory, ignore_errors=True)
+            os.makedirs(self.entries_directory, exist_ok=True)
+            if os.path.exists(self.statistics_file):
+                os.remove(self.statistics_file)
+
+    def locked(self):
+        """
+        :return: Context manager holding the lock of the cache
+        """
+        return CacheLock(self.lock_file)
+
+
+class CacheLock:
+    """
+    Exclusive lock on the lock file of a cache, shared by the processes using the cache.
+    """
+
+    def __init__(self, lock_file):
+        self.lock_file = lock_file
+        self.file = None
+
+    def __enter__(self):
+        self.file = open(self.lock_file, 'a')
+        if fcntl is not None:
+            fcntl.flock(self.file, fcntl.LOCK_EX)
+        return self
+
+    def __exit__(self, *exc_info):
+        if fcntl is not None:
+            fcntl.flock(self.file, fcntl.LOCK_UN)
+        self.file.close()
+
+
+def dump_metrics(process_list):
+    """
+    Packs the per-run columns (remaining burst, start, finish and metrics) of the processes.
+
+    :param process_list: List of Process (or ProcessTable)
+    :return: The packed columns, one after the other
+    """
+    if isinstance(process_list, ProcessTable):
+        return b"".join(bytes(memoryview(process_list.columns[column]).cast("B")) for column in METRIC_COLUMNS)
+    return b"".join(array("q", [getattr(process, column) for process in process_list]).tobytes()
+                    for column in METRIC_COLUMNS)
+
+
+def load_metrics(process_list, metrics):
+    """
+    Restores the per-run columns packed by dump_metrics.
+
+    :param process_list: List of Process (or ProcessTable) to restore the metrics of
+    :param metrics: The packed columns
+    """
+    process_count = len(process_list)
+    for position, column in enumerate(METRIC_COLUMNS):
+        values = array("q")
+        values.frombytes(metrics[position * process_count * 8:(position + 1) * process_count * 8])
+        if isinstance(process_list, ProcessTable):
+            process_list.columns[column] = values
+        else:
+            for process, value in zip(process_list, values):
+                setattr(process, column, value)
+
+
+if __name__ == "__main__":
+    if len(sys.argv) not in (2, 3) or (len(sys.argv) == 3 and sys.argv[2] != "--clear"):
+        print("Usage: python3 -m Dependencies.result_cache <cache directory> [--clear]")
+        sys.exit(1)
+
+    result_cache = ResultCache(sys.argv[1])
+    if len(sys.argv) == 3:
+        result_cache.clear()
+    statistics = result_cache.statistics()
+    lookups = statistics["hits"] + statistics["misses"]
+    hit_rate = 100 * statistics["hits"] / lookups if lookups else 0.0
+    print(f"{statistics['entries']} entries, {statistics['bytes']} bytes")
+    print(f"{statistics['hits']} hits, {statistics['misses']} misses ({hit_rate:.1f}% hit rate), "
+          f"{statistics['evictions']} evictions")
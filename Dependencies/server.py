@@ -0,0 +1,454 @@
+import argparse
+import asyncio
+import contextlib
+import functools
+import io
+import itertools
+import multiprocessing
+import os
+import queue
+import signal
+import sys
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+from Dependencies.data_structure import Workload
+from Dependencies.input_file_parsing import parse_input_lines
+from Dependencies.main import scheduler_events
+from Dependencies.write_output_file import output_file_lines
+
+"""
+This file contains the server mode of the program, a long-lived asyncio service for the many
+small simulations of dashboards and test harnesses, which would otherwise pay for a fresh Python
+process each.
+
+A client connects to a Unix socket or a localhost TCP port and sends a workload in the input file
+format, up to its 'end' line (or until it closes its side of the connection). The server streams
+the output file of the simulation back as the scheduler produces the events, then closes the
+connection. A workload with several algorithms ('use all') gets their outputs one after the other,
+separated by an empty line. Errors are sent back as the usual "Error: ..." line.
+
+The simulations run on a pool of worker processes, so the event loop never runs a scheduler. The
+workers send the output in chunks through a queue shared by the pool, and a dispatcher hands each
+chunk to the connection it belongs to without ever waiting for it. A worker keeps at most
+STREAM_QUEUE_SIZE chunks of its request unwritten, so a client that reads slowly pauses its own
+simulation instead of filling the memory of the server or holding the other requests back (and
+one that stops reading for SLOW_CLIENT_TIMEOUT seconds is dropped). A client that goes away
+cancels its simulation. A pool broken by a worker that died is replaced, with a queue and a
+dispatcher of its own, and its requests end with an error.
+
+Usage:
+    python3 -m Dependencies.server (--socket PATH | --port N) [--workers N]
+    python3 -m Dependencies.server (--socket PATH | --port N) --submit <input_file.in>
+"""
+
+STREAM_CHUNK_SIZE = 1 << 16         # Bytes of output gathered by a worker before they are sent
+MAX_REQUEST_BYTES = 64 << 20        # Largest workload a client may send
+CHUNK_QUEUE_SIZE = 64               # Chunks in flight between the workers and the dispatcher
+STREAM_QUEUE_SIZE = 16              # Chunks of a request sent but not yet written to its client
+SLOW_CLIENT_TIMEOUT = 60            # Seconds a client may leave a chunk unread before it is dropped
+REQUEST_SLOTS = 1024                # Slots of the shared arrays of the running requests
+CANCEL_CHECK_LINES = 1024           # Output lines produced between two checks of the cancel flag
+PAUSE_INTERVAL = 0.005              # Seconds a paused worker sleeps before it checks its client again
+
+# Queue of (request id, chunk) shared by the workers of the pool, a None chunk ends a request
+_chunk_queue = None
+# Shared array, slot 'request id % REQUEST_SLOTS' holds the id of a cancelled request
+_cancelled = None
+# Shared array, slot 'request id % REQUEST_SLOTS' holds the number of chunks written to the client
+_written = None
+
+
+class RequestCancelled(Exception):
+    """
+    Raised in a worker when the client of its request went away.
+    """
+
+
+def init_worker(chunk_queue, cancelled, written):
+    """
+    Initializer of the worker processes.
+
+    :param chunk_queue: Queue the output chunks are sent to
+    :param cancelled: Shared array of the cancelled requests
+    :param written: Shared array of the chunks written to the clients
+    """
+    global _chunk_queue, _cancelled, _written
+    _chunk_queue = chunk_queue
+    _cancelled = cancelled
+    _written = written
+    signal.signal(signal.SIGINT, signal.SIG_IGN)  # The server shuts the pool down itself
+
+
+def check_cancelled(request_id):
+    """
+    :param request_id: Id of the request
+    :raises RequestCancelled: If the request was cancelled
+    """
+    if _cancelled[request_id % REQUEST_SLOTS] == request_id:
+        raise RequestCancelled()
+
+
+def send_chunk(request_id, sent, chunk):
+    """
+    Sends a chunk once the client has room for it, pausing the worker while STREAM_QUEUE_SIZE
+    chunks of the request are still unwritten.
+
+    :param request_id: Id of the request
+    :param sent: Number of chunks of the request already sent
+    :param chunk: List of lines of the chunk
+    :raises RequestCancelled: If the request is cancelled while the worker is paused
+    """
+    while sent - _written[request_id % REQUEST_SLOTS] >= STREAM_QUEUE_SIZE:
+        check_cancelled(request_id)
+        time.sleep(PAUSE_INTERVAL)
+    _chunk_queue.put((request_id, "\n".join(chunk) + "\n"))
+
+
+def simulate_request(request_id, text):
+    """
+    Runs the simulations of a workload in a worker process and sends their output, in chunks of
+    about STREAM_CHUNK_SIZE bytes, as the events are produced. A cancelled request stops within
+    CANCEL_CHECK_LINES lines of output, or as soon as it is cancelled while paused.
+
+    :param request_id: Id of the request, sent with every chunk
+    :param text: The workload, in the input file format
+    """
+    chunk = []
+    chunk_size = 0
+    sent = 0
+    messages = io.StringIO()
+    try:
+        with contextlib.redirect_stdout(messages):
+            process_list, run_for, runs = parse_input_lines(text.splitlines())
+        if len(runs) > 1:
+            workload = Workload.from_processes(process_list)
+
+        for index, (algorithm, quantum) in enumerate(runs):
+            if index:
+                process_list = workload.new_run()
+            events = scheduler_events(process_list, run_for, algorithm, quantum)
+            lines = output_file_lines(process_list, algorithm, quantum, events, run_for)
+            for line_number, line in enumerate(itertools.chain([""] if index else [], lines)):
+                if line_number % CANCEL_CHECK_LINES == 0:
+                    check_cancelled(request_id)
+                chunk.append(line)
+                chunk_size += len(line) + 1
+                if chunk_size >= STREAM_CHUNK_SIZE:
+                    send_chunk(request_id, sent, chunk)
+                    sent += 1
+                    chunk = []
+                    chunk_size = 0
+    except RequestCancelled:
+        chunk = []  # The client went away, only the end of the request is sent
+    except SystemExit:
+        chunk.append(messages.getvalue().strip() or "Error: Invalid workload.")
+    except Exception as error:
+        chunk.append(f"Error: {error}")
+
+    if chunk:
+        _chunk_queue.put((request_id, "\n".join(chunk) + "\n"))
+    _chunk_queue.put((request_id, None))
+
+
+class SimulationServer:
+    """
+    Accepts workloads from clients and streams the output of their simulations back.
+    """
+
+    def __init__(self, workers=None):
+        """
+        :param workers: Number of worker processes, defaults to the number of CPUs
+        """
+        # Forking a worker while the dispatcher thread waits on the queue would copy its held locks
+        start_method = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else None
+        self.context = multiprocessing.get_context(start_method)
+        self.workers = workers
+        self.cancelled = self.context.RawArray("q", REQUEST_SLOTS)
+        self.written = self.context.RawArray("q", REQUEST_SLOTS)
+        self.loop = None                    # Event loop of the server, set by start
+        self.pool = None                    # Pool of worker processes, set by start
+        self.chunk_queue = None             # Queue the workers of the pool send their chunks to
+        self.streams = {}                   # asyncio.Queue of the chunks of each running request
+        self.writers = {}                   # Connection of each running request
+        self.request_ids = itertools.count(1)   # 0 is the value of the unused cancel slots
+
+    def start(self):
+        """
+        Starts the pool and its dispatcher, from the event loop the clients are served on.
+        """
+        self.loop = asyncio.get_running_loop()
+        self.new_pool()
+
+    async def stop(self):
+        """
+        Drops the connections of the running requests, which cancels their simulations, then
+        shuts the pool and its dispatcher down.
+        """
+        for writer in list(self.writers.values()):
+            writer.transport.abort()
+        await self.loop.run_in_executor(None, functools.partial(self.pool.shutdown, cancel_futures=True))
+        self.chunk_queue.put((None, None))
+
+    def new_pool(self):
+        """
+        Starts a new pool of worker processes, with a chunk queue and a dispatcher of its own. A
+        worker killed while it writes to the queue leaves the queue locked or a chunk half
+        written, so the queue of a pool is never reused by the next one.
+        """
+        self.chunk_queue = self.context.Queue(CHUNK_QUEUE_SIZE)
+        self.pool = ProcessPoolExecutor(max_workers=self.workers, mp_context=self.context, initializer=init_worker,
+                                        initargs=(self.chunk_queue, self.cancelled, self.written))
+        threading.Thread(target=self.dispatch_chunks, args=(self.chunk_queue,), daemon=True).start()
+
+    def replace_pool(self, pool):
+        """
+        Replaces a broken pool, unless it was already replaced. The dispatcher of the broken pool
+        hands over the chunks already sent and stops, unless the queue was left unreadable, in
+        which case its thread stays blocked on it.
+
+        :param pool: The broken pool
+        """
+        if self.pool is pool:
+            chunk_queue = self.chunk_queue
+            self.new_pool()
+            pool.shutdown(wait=False, cancel_futures=True)
+            chunk_queue.cancel_join_thread()    # The queue may be locked, exiting must not wait for it
+            with contextlib.suppress(queue.Full):
+                chunk_queue.put_nowait((None, None))
+
+    def submit_simulation(self, request_id, text):
+        """
+        Submits a workload to the pool, replacing the pool if it is broken.
+
+        :param request_id: Id of the request
+        :param text: The workload, in the input file format
+        :return: Future of the simulation
+        """
+        pool = self.pool
+        try:
+            simulation = self.loop.run_in_executor(pool, simulate_request, request_id, text)
+        except BrokenProcessPool:
+            self.replace_pool(pool)
+            pool = self.pool
+            simulation = self.loop.run_in_executor(pool, simulate_request, request_id, text)
+        simulation.add_done_callback(functools.partial(self.end_simulation, request_id, pool))
+        return simulation
+
+    def end_simulation(self, request_id, pool, simulation):
+        """
+        Done callback of a simulation. The worker ends the stream of a simulation that ran, even
+        a cancelled one, itself after its last chunk. The stream of a simulation that never
+        started or failed is ended here, with the error of a failed one, and the chunks it may
+        still have in the queue are dropped.
+
+        :param request_id: Id of the request
+        :param pool: Pool the simulation ran on
+        :param simulation: Future of the simulation
+        """
+        if simulation.cancelled():
+            messages = [None]
+        elif simulation.exception() is not None:
+            error = simulation.exception()
+            if isinstance(error, BrokenProcessPool):
+                self.replace_pool(pool)
+                error = "The simulation worker stopped unexpectedly."
+            messages = [f"Error: {error}\n", None]
+        else:
+            return
+
+        for message in messages:
+            self.hand_over(request_id, message)
+        self.streams.pop(request_id, None)
+
+    def cancel_simulation(self, request_id, simulation):
+        """
+        Cancels a simulation: a queued one never starts and a running one stops within
+        CANCEL_CHECK_LINES lines of output.
+
+        :param request_id: Id of the request
+        :param simulation: Future of the simulation
+        """
+        if not simulation.done():
+            self.cancelled[request_id % REQUEST_SLOTS] = request_id
+            simulation.cancel()
+
+    async def cancel_on_close(self, writer, request_id, simulation):
+        """
+        Cancels a simulation once the connection of its client is closed.
+        """
+        with contextlib.suppress(ConnectionError):
+            # The wait is shielded, cancelling the watcher must not cancel the close of the connection
+            await asyncio.shield(writer.wait_closed())
+        self.cancel_simulation(request_id, simulation)
+
+    def dispatch_chunks(self, chunk_queue):
+        """
+        Hands the chunks sent by the workers of a pool to the requests they belong to, until a
+        None request id. The blocking queue is read in a thread of its own, so the event loop
+        keeps running. The thread never waits for a client, the workers pause themselves when
+        their client falls behind, so one request cannot hold the others back.
+
+        :param chunk_queue: Chunk queue of the pool
+        """
+        while True:
+            request_id, chunk = chunk_queue.get()
+            if request_id is None:
+                return
+            try:
+                self.loop.call_soon_threadsafe(self.hand_over, request_id, chunk)
+            except RuntimeError:
+                return  # The event loop is closed
+
+    def hand_over(self, request_id, chunk):
+        """
+        Puts a chunk in the stream of its request, without waiting. The workers keep a stream
+        below its size, a full one means the request is broken and it is dropped.
+
+        :param request_id: Id of the request
+        :param chunk: The chunk, None for the end of the request
+        """
+        stream = self.streams.get(request_id)
+        if stream is None:
+            return  # The request already ended
+        try:
+            stream.put_nowait(chunk)
+        except asyncio.QueueFull:
+            writer = self.writers.get(request_id)
+            if writer is not None:
+                writer.transport.abort()
+
+    async def handle_client(self, reader, writer):
+        """
+        Reads a workload from a client, submits it to the pool and streams the output back. The
+        simulation is cancelled if the connection closes before its end.
+        """
+        try:
+            lines = []
+            size = 0
+            while size <= MAX_REQUEST_BYTES:
+                line = await reader.readline()
+                if not line:
+                    break
+                lines.append(line.decode())
+                size += len(line)
+                if line.split()[:1] == [b"end"]:
+                    break
+            if size > MAX_REQUEST_BYTES:
+                writer.write(b"Error: Workload too large.\n")
+                return
+
+            request_id = next(self.request_ids)
+            # Room for the unwritten chunks, the last one and the end of the request
+            stream = self.streams[request_id] = asyncio.Queue(STREAM_QUEUE_SIZE + 2)
+            self.writers[request_id] = writer
+            self.written[request_id % REQUEST_SLOTS] = 0
+            simulation = self.submit_simulation(request_id, "".join(lines))
+            # A connection lost while the simulation runs silently is only seen by the transport
+            watcher = asyncio.ensure_future(self.cancel_on_close(writer, request_id, simulation))
+            try:
+                while True:
+                    chunk = await stream.get()
+                    if chunk is None:
+                        break
+                    writer.write(chunk.encode())
+                    try:
+                        await asyncio.wait_for(writer.drain(), SLOW_CLIENT_TIMEOUT)
+                    except asyncio.TimeoutError:
+                        writer.transport.abort()    # The client stopped reading, only its request is dropped
+                        break
+                    self.written[request_id % REQUEST_SLOTS] += 1
+            finally:
+                self.streams.pop(request_id, None)
+                del self.writers[request_id]
+                self.cancel_simulation(request_id, simulation)
+                watcher.cancel()
+        except (ConnectionError, UnicodeDecodeError, ValueError):
+            pass  # The client went away or sent something that is not text, only its own request ends
+        finally:
+            writer.close()
+            with contextlib.suppress(ConnectionError):
+                await writer.wait_closed()
+
+    async def serve(self, socket_path=None, host="127.0.0.1", port=None):
+        """
+        Serves clients until the process is interrupted.
+
+        :param socket_path: Path of the Unix socket to listen on
+        :param host: Host to listen on when a TCP port is given
+        :param port: TCP port to listen on when no Unix socket is given
+        """
+        self.start()
+        if socket_path:
+            server = await asyncio.start_unix_server(self.handle_client, path=socket_path)
+            address = socket_path
+        else:
+            server = await asyncio.start_server(self.handle_client, host=host, port=port)
+            address = "{}:{}".format(*server.sockets[0].getsockname()[:2])
+
+        stop = self.loop.create_future()
+        for signal_number in (signal.SIGINT, signal.SIGTERM):
+            self.loop.add_signal_handler(signal_number, lambda: stop.done() or stop.set_result(None))
+
+        print(f"Serving simulations on {address}", flush=True)
+        async with server:
+            await stop
+        await self.stop()
+        if socket_path:
+            with contextlib.suppress(FileNotFoundError):
+                os.remove(socket_path)
+
+
+async def submit(input_file, socket_path=None, host="127.0.0.1", port=None, output=sys.stdout):
+    """
+    Sends an input file to a server and writes the output it streams back.
+
+    :param input_file: Path to the input file
+    :param socket_path: Path of the Unix socket of the server
+    :param host: Host of the server when a TCP port is given
+    :param port: TCP port of the server when no Unix socket is given
+    :param output: Text stream the output is written to
+    """
+    if socket_path:
+        reader, writer = await asyncio.open_unix_connection(socket_path)
+    else:
+        reader, writer = await asyncio.open_connection(host, port)
+    with open(input_file, 'rb') as file:
+        writer.write(file.read())
+    writer.write_eof()
+    await writer.drain()
+
+    while chunk := await reader.read(STREAM_CHUNK_SIZE):
+        output.write(chunk.decode())
+    writer.close()
+    await writer.wait_closed()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve scheduling simulations over a Unix socket or localhost TCP")
+    address = parser.add_mutually_exclusive_group(required=True)
+    address.add_argument("--socket", help="path of the Unix socket to listen on")
+    address.add_argument("--port", type=int, help="TCP port to listen on (0 picks a free port)")
+    parser.add_argument("--host", default="127.0.0.1", help="host to listen on with --port")
+    parser.add_argument("--workers", type=int, default=None, help="number of worker processes (default: number of CPUs)")
+    parser.add_argument("--submit", metavar="INPUT_FILE", help="send an input file to a running server and print its output")
+    args = parser.parse_args()
+
+    if args.submit:
+        try:
+            asyncio.run(submit(args.submit, args.socket, args.host, args.port))
+        except FileNotFoundError:
+            print("Error: Input file or server socket not found.")
+            sys.exit(1)
+        except ConnectionError:
+            print("Error: Could not connect to the server.")
+            sys.exit(1)
+        return
+
+    asyncio.run(SimulationServer(args.workers).serve(args.socket, args.host, args.port))
+
+
+if __name__ == "__main__":
+    main()
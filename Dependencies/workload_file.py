@@ -0,0 +1,152 @@
+import mmap
+import os
+import struct
+import sys
+from array import array
+
+from Dependencies.data_structure import *
+from Dependencies.input_file_parsing import *
+
+"""
+This file contains the compact binary workload format. A workload file holds the same information
+as an input file (processes, runfor, algorithm and quantum) as raw 64-bit columns, so it can be
+memory-mapped and handed to a ProcessTable without parsing or copying.
+
+Layout (little-endian):
+    header          magic, process count, runfor, quantum (-1 if none), algorithm, name data size,
+                    parameter count
+    arrival times   process count x int64
+    burst times     process count x int64
+    name offsets    (process count + 1) x int64
+    name data       UTF-8 names back to back
+    parameters      parameter count x int64, the boost period and the quanta for 'mlfq', the target
+                    latency and the minimum granularity for 'fair'
+"""
+
+WORKLOAD_MAGIC = b"MPSWKLD1"
+WORKLOAD_EXTENSION = ".wl"
+WORKLOAD_HEADER = struct.Struct("<8sqqq16sqq")      # 64 bytes, keeps the columns 8-byte aligned
+
+
+def write_workload_file(workload_file, process_list, run_for, algorithm, quantum):
+    """
+    Writes a workload to a binary workload file.
+
+    :param workload_file: Path of the binary workload file to write
+    :param process_list: List of Process (or ProcessTable) to store
+    :param run_for: Total time units to run the simulation
+    :param algorithm: The scheduling algorithm to use
+    :param quantum: Time slice for Round Robin scheduling (None if not applicable), MLFQParameters for 'mlfq'
+                    and FairParameters for 'fair'
+    """
+    parameters = array("q")
+    if isinstance(quantum, MLFQParameters):
+        parameters.append(quantum.boost_period)
+        parameters.extend(quantum.quanta)
+        quantum = None
+    elif isinstance(quantum, FairParameters):
+        parameters.extend(quantum)
+        quantum = None
+
+    if isinstance(process_list, ProcessTable):
+        # The columns of a table are written as they are
+        arrival_times = array("q", process_list.columns["arrival_time"])
+        burst_times = array("q", process_list.columns["burst_time"])
+        name_offsets = array("q", process_list.name_offsets)
+        name_data = process_list.name_data
+    else:
+        arrival_times = array("q")
+        burst_times = array("q")
+        name_offsets = array("q", [0])
+        name_data = bytearray()
+        for process in process_list:
+            arrival_times.append(process.arrival_time)
+            burst_times.append(process.burst_time)
+            name_data += process.name.encode()
+            name_offsets.append(len(name_data))
+
+    if sys.byteorder != "little":
+        for column in (arrival_times, burst_times, name_offsets, parameters):
+            column.byteswap()
+
+    with open(workload_file, 'wb') as file:
+        file.write(WORKLOAD_HEADER.pack(WORKLOAD_MAGIC, len(arrival_times), run_for,
+                                        -1 if quantum is None else quantum, algorithm.encode(), len(name_data),
+                                        len(parameters)))
+        arrival_times.tofile(file)
+        burst_times.tofile(file)
+        name_offsets.tofile(file)
+        file.write(name_data)
+        parameters.tofile(file)
+
+
+def load_workload_file(workload_file):
+    """
+    Memory-maps a binary workload file. The arrival, burst and name columns of the returned
+    ProcessTable are views on the mapped file, nothing is parsed or copied.
+
+    :param workload_file: Path of the binary workload file
+    :return: Tuple (process_table, run_for, algorithm, quantum), like parse_input_file
+    """
+    try:
+        with open(workload_file, 'rb') as file:
+            mapping = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+    except FileNotFoundError:
+        print("Error: Workload file not found.")
+        sys.exit(1)
+    except ValueError:
+        print("Error: Invalid workload file.")
+        sys.exit(1)
+
+    if len(mapping) < WORKLOAD_HEADER.size:
+        print("Error: Invalid workload file.")
+        sys.exit(1)
+    magic, process_count, run_for, quantum, algorithm, name_size, parameter_count = WORKLOAD_HEADER.unpack_from(mapping)
+    column_size = process_count * 8
+    if magic != WORKLOAD_MAGIC or len(mapping) != WORKLOAD_HEADER.size + 3 * column_size + 8 + name_size + 8 * parameter_count:
+        print("Error: Invalid workload file.")
+        sys.exit(1)
+
+    buffer = memoryview(mapping)
+    offset = WORKLOAD_HEADER.size
+    columns = []
+    for size in (column_size, column_size, column_size + 8):
+        column = buffer[offset:offset + size].cast("q")
+        if sys.byteorder != "little":
+            column = array("q", column)
+            column.byteswap()
+        columns.append(column)
+        offset += size
+    name_data = buffer[offset:offset + name_size]
+    parameters = array("q", buffer[offset + name_size:].cast("q")) if parameter_count else None
+    if parameters is not None and sys.byteorder != "little":
+        parameters.byteswap()
+
+    process_table = ProcessTable.from_columns(columns[0], columns[1], columns[2], name_data)
+    algorithm = algorithm.rstrip(b"\0").decode()
+    if algorithm == 'mlfq':
+        return process_table, run_for, algorithm, MLFQParameters(tuple(parameters[1:]), parameters[0])
+    if algorithm == 'fair':
+        return process_table, run_for, algorithm, FairParameters(*parameters)
+    return process_table, run_for, algorithm, None if quantum == -1 else quantum
+
+
+def convert_input_file(input_file, workload_file):
+    """
+    Converts an input file to a binary workload file.
+
+    :param input_file: Path of the input file to convert
+    :param workload_file: Path of the binary workload file to write
+    """
+    process_table, run_for, algorithm, quantum = parse_input_file(input_file, columnar=True)
+    write_workload_file(workload_file, process_table, run_for, algorithm, quantum)
+
+
+if __name__ == "__main__":
+    if len(sys.argv) not in (2, 3):
+        print("Usage: python3 -m Dependencies.workload_file <input file> [<workload file>]")
+        sys.exit(1)
+
+    input_file = sys.argv[1]
+    workload_file = sys.argv[2] if len(sys.argv) == 3 else os.path.splitext(input_file)[0] + WORKLOAD_EXTENSION
+    convert_input_file(input_file, workload_file)
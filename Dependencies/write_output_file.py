@@ -1,37 +1,215 @@
+from itertools import chain
+
+from Dependencies.event_log import format_events, format_smp_events
+from Dependencies.metrics_sketch import MetricsAggregate, aggregate_summary_lines
+
+# Size of the write buffer of the output file, events are streamed through it
+OUTPUT_BUFFER_SIZE = 1 << 20
+
+
+# Function that renders the content of the output file
+def output_file_lines(process_list, algorithm, quantum, event_log, run_for, aggregate=False):
+    """
+    Render the scheduling results in the output file format, one line at a time (without the
+    trailing newline). The events are consumed lazily and the process summary is rendered once
+    all the events have been consumed.
+
+    Parameters:
+    process_list (list of Process): List of processes that were scheduled.
+    algorithm (str): The scheduling algorithm used.
+    quantum (int): Time slice for Round Robin scheduling (if applicable).
+    event_log (EventLog or iterable of event records): Events detailing the scheduling process.
+    run_for (int): Total time units the simulation ran.
+    aggregate (bool): Whether to summarize the metrics in aggregate instead of one line per process.
+    """
+    yield from output_header_lines(process_list, algorithm, quantum)
+    yield ""
+    
+    yield from format_events(process_list, event_log)
+    yield from output_footer_lines(process_list, run_for, aggregate)
+
+
+# Function that renders the end of the output file, after the events
+def output_footer_lines(process_list, run_for, aggregate=False):
+    """
+    Render the end time of the simulation and the summary of the processes, one line at a time.
+
+    Parameters:
+    process_list (list of Process): List of processes that were scheduled.
+    run_for (int): Total time units the simulation ran.
+    aggregate (bool): Whether to summarize the metrics in aggregate instead of one line per process.
+    """
+    yield f"Finished at time {run_for}"
+    yield ""
+    
+    if aggregate:
+        yield from aggregate_summary_lines(MetricsAggregate.from_processes(process_list))
+    else:
+        yield from process_summary_lines(process_list)
+
+
+# Function that renders the header of the output file
+def output_header_lines(process_list, algorithm, quantum):
+    """
+    Render the process count, the algorithm and its quantum, one line at a time.
+
+    Parameters:
+    process_list (list of Process): List of processes that were scheduled.
+    algorithm (str): The scheduling algorithm used.
+    quantum (int): Time slice for Round Robin scheduling (if applicable), MLFQParameters for MLFQ and
+    FairParameters for the fair scheduler.
+    """
+    yield f"{len(process_list)} processes"
+    
+    if algorithm == 'fcfs':
+        yield f"Using First-Come First-Served"
+    elif algorithm == 'sjf':
+        yield f"Using Preemptive Shortest Job First"
+    elif algorithm == 'rr':
+        yield f"Using Round-Robin"
+    elif algorithm == 'mlfq':
+        yield f"Using Multilevel Feedback Queue"
+    elif algorithm == 'fair':
+        yield f"Using Completely Fair Scheduler"
+        
+    if algorithm == 'rr':
+        yield f"Quantum {quantum}"
+    elif algorithm == 'mlfq':
+        yield f"Quanta {' '.join(map(str, quantum.quanta))}"
+        if quantum.boost_period:
+            yield f"Boost every {quantum.boost_period}"
+    elif algorithm == 'fair':
+        yield f"Target latency {quantum.target_latency}"
+        yield f"Minimum granularity {quantum.min_granularity}"
+
+
+# Function that renders the content of the output file of a multiprocessor run
+def smp_output_file_lines(process_list, algorithm, quantum, cpus, events, run_for):
+    """
+    Render the results of a multiprocessor run in the output file format, one line at a time.
+    The process summary is followed by the utilization of each CPU, the throughput and the
+    percentiles of the waiting time, so runs on different CPU counts can be compared.
+
+    Parameters:
+    process_list (list of Process): List of processes that were scheduled.
+    algorithm (str): The scheduling algorithm used.
+    quantum (int): Time slice for Round Robin scheduling (if applicable).
+    cpus (list of CPU): The simulated CPUs.
+    events (iterable of event records): Events of smp_events, with the CPU of each event.
+    run_for (int): Total time units the simulation ran.
+    """
+    yield from output_header_lines(process_list, algorithm, quantum)
+    yield f"CPUs {len(cpus)}"
+    yield ""
+
+    yield from format_smp_events(process_list, events)
+    yield f"Finished at time {run_for}"
+    yield ""
+
+    yield from process_summary_lines(process_list)
+    yield ""
+
+    yield from smp_summary_lines(process_list, cpus, run_for)
+
+
+# Function that renders the CPU statistics of a multiprocessor run
+def smp_summary_lines(process_list, cpus, run_for):
+    """
+    Render the utilization of each CPU, the throughput and the percentiles of the waiting time
+    of the finished processes, one line at a time.
+
+    Parameters:
+    process_list (list of Process): List of processes that were scheduled.
+    cpus (list of CPU): The simulated CPUs, once the simulation is over.
+    run_for (int): Total time units the simulation ran.
+    """
+    for cpu in cpus:
+        yield (f"CPU {cpu.cpu_id} utilization {100 * cpu.utilization(run_for):.2f}% busy {cpu.busy_time} "
+               f"dispatches {cpu.dispatches} steals {cpu.steals}")
+
+    waits = sorted(process.waiting_time for process in process_list if process.finish_time != -1)
+    throughput = len(waits) / run_for if run_for > 0 else 0.0
+    yield f"Throughput {throughput:.4f} processes per time unit"
+    if waits:
+        yield (f"Wait p50 {nearest_rank(waits, 50)} p95 {nearest_rank(waits, 95)} "
+               f"p99 {nearest_rank(waits, 99)} max {waits[-1]}")
+
+
+# Nearest-rank percentile of a sorted, non-empty list
+def nearest_rank(sorted_values, percent):
+    rank = -(-percent * len(sorted_values) // 100)  # Ceiling of percent * n / 100
+    return sorted_values[max(rank, 1) - 1]
+
+
+# Function that renders the summary of the processes
+def process_summary_lines(process_list):
+    """
+    Render the wait, turnaround and response time of each process, one line at a time.
+
+    Parameters:
+    process_list (list of Process): List of processes that were scheduled.
+    """
+    for process in process_list:
+        if process.finish_time == -1:
+            yield f"{process.name} did not finish"
+        else:
+            yield f"{process.name} wait {process.waiting_time} turnaround {process.turnaround_time} response {process.response_time}"
+
+
 # Function that writes the output file
-def write_output_file(output_file, process_list, algorithm, quantum, event_log, run_for):
+def write_output_file(output_file, process_list, algorithm, quantum, event_log, run_for, aggregate=False):
     """
     Write the scheduling results to an output file.
+
+    The events are consumed one at a time and written through a large buffer, so a scheduler
+    event generator can be passed directly and the events never have to be held in memory.
+    The process summary is written once all the events have been consumed.
     
     Parameters:
     output_file (str): The name of the output file.
     process_list (list of Process): List of processes that were scheduled.
     algorithm (str): The scheduling algorithm used.
     quantum (int): Time slice for Round Robin scheduling (if applicable).
-    event_log (list of str): Event log detailing the scheduling process.
+    event_log (EventLog or iterable of event records): Events detailing the scheduling process.
     run_for (int): Total time units the simulation ran.
+    aggregate (bool): Whether to summarize the metrics in aggregate instead of one line per process.
     """
-    with open(output_file, 'w') as file:
-        file.write(f"{len(process_list)} processes\n")
-        
-        if algorithm == 'fcfs':
-            file.write(f"Using First-Come First-Served\n")
-        elif algorithm == 'sjf':
-            file.write(f"Using Preemptive Shortest Job First\n")
-        elif algorithm == 'rr':
-            file.write(f"Using Round-Robin\n")
-            
-        if algorithm == 'rr':
-            file.write(f"Quantum {quantum}\n")
-        
-        file.write("\n")
-        
-        for event in event_log:
-            file.write(event + "\n")
-        file.write(f"Finished at time {run_for}\n\n")
-        
-        for process in process_list:
-            if process.finish_time == -1:
-                file.write(f"{process.name} did not finish\n")
-            else:
-                file.write(f"{process.name} wait {process.waiting_time} turnaround {process.turnaround_time} response {process.response_time}\n")
+    with open(output_file, 'w', buffering=OUTPUT_BUFFER_SIZE) as file:
+        lines = output_file_lines(process_list, algorithm, quantum, event_log, run_for, aggregate)
+        file.writelines(line + "\n" for line in lines)
+
+
+# Function that appends events to the trace of an existing output file
+def append_output_file(output_file, process_list, event_log, run_for):
+    """
+    Append the events of a resumed simulation to an output file whose end (end time and process
+    summary) was removed, then write the new end.
+
+    Parameters:
+    output_file (str): The name of the output file.
+    process_list (list of Process): List of processes that were scheduled.
+    event_log (EventLog or iterable of event records): Events of the resumed simulation.
+    run_for (int): Total time units the simulation ran.
+    """
+    with open(output_file, 'a', buffering=OUTPUT_BUFFER_SIZE) as file:
+        lines = chain(format_events(process_list, event_log), output_footer_lines(process_list, run_for))
+        file.writelines(line + "\n" for line in lines)
+
+
+# Function that writes the output file of a multiprocessor run
+def write_smp_output_file(output_file, process_list, algorithm, quantum, cpus, events, run_for):
+    """
+    Write the results of a multiprocessor run to an output file, streaming the events like
+    write_output_file.
+
+    Parameters:
+    output_file (str): The name of the output file.
+    process_list (list of Process): List of processes that were scheduled.
+    algorithm (str): The scheduling algorithm used.
+    quantum (int): Time slice for Round Robin scheduling (if applicable).
+    cpus (list of CPU): The simulated CPUs.
+    events (iterable of event records): Events of smp_events, with the CPU of each event.
+    run_for (int): Total time units the simulation ran.
+    """
+    with open(output_file, 'w', buffering=OUTPUT_BUFFER_SIZE) as file:
+        file.writelines(line + "\n" for line in smp_output_file_lines(process_list, algorithm, quantum, cpus, events, run_for))
@@ -11,9 +11,14 @@
 import sys
 import random
 import heapq
+from collections import deque
 
 # Data Structure of the processes. Used throughout the program to represent each process
 class Process:
+    # Slots instead of a per-instance __dict__ keep each process small in large workloads
+    __slots__ = ("name", "arrival_time", "burst_time", "remaining_burst_time", "start_time",
+                 "finish_time", "waiting_time", "turnaround_time", "response_time")
+
     def __init__(self, name, arrival_time, burst_time):
         """
         Initializes a new process with the given parameters. Some parameters are initialized 
@@ -185,16 +190,19 @@ def round_robin_scheduler(process_list, run_for, quantum):
     """
     current_time = 0                                # Initialize the current time
     event_log = []                                  # Initialize the event log
-    ready_queue = []                                # Initialize the ready queue
+    ready_queue = deque()                           # Initialize the ready queue
 
-    # Sort processes by arrival time
+    # Sort processes by arrival time, arrivals are consumed through an index cursor
     process_queue = sorted(process_list, key=lambda p: p.arrival_time)
+    next_arrival = 0
+    total_processes = len(process_queue)
 
-    while current_time < run_for and (process_queue or ready_queue):
+    while current_time < run_for and (next_arrival < total_processes or ready_queue):
 
         # Add processes to the ready queue as they arrive
-        while process_queue and process_queue[0].arrival_time <= current_time:
-            process = process_queue.pop(0)
+        while next_arrival < total_processes and process_queue[next_arrival].arrival_time <= current_time:
+            process = process_queue[next_arrival]
+            next_arrival += 1
             ready_queue.append(process)
             event_log.append(f"Time {current_time} : {process.name} arrived")
 
@@ -205,7 +213,7 @@ def round_robin_scheduler(process_list, run_for, quantum):
             continue
 
         # Get the next process from the ready queue
-        current_process = ready_queue.pop(0)
+        current_process = ready_queue.popleft()
         
         # Log process selection
         if current_process.start_time == -1:
@@ -214,20 +222,15 @@ def round_robin_scheduler(process_list, run_for, quantum):
         
         # Determine the time slice for the current process
         execution_time = min(quantum, current_process.remaining_burst_time)
+        current_time += execution_time
+        current_process.remaining_burst_time -= execution_time
 
-        # Simulate the execution of the process in smaller time increments to check for new arrivals
-        for _ in range(execution_time):
-            current_time += 1
-            current_process.remaining_burst_time -= 1
-
-            # Check for new arrivals during the execution
-            while process_queue and process_queue[0].arrival_time <= current_time:
-                process = process_queue.pop(0)
-                ready_queue.append(process)
-                event_log.append(f"Time {current_time} : {process.name} arrived")
-
-            if current_process.remaining_burst_time == 0:
-                break
+        # Processes arriving during the time slice are queued at their own arrival time
+        while next_arrival < total_processes and process_queue[next_arrival].arrival_time <= current_time:
+            process = process_queue[next_arrival]
+            next_arrival += 1
+            ready_queue.append(process)
+            event_log.append(f"Time {process.arrival_time} : {process.name} arrived")
         
         # Log process completion or re-queue if not finished
         if current_process.remaining_burst_time == 0:
@@ -235,12 +238,6 @@ def round_robin_scheduler(process_list, run_for, quantum):
             event_log.append(f"Time {current_time} : {current_process.name} finished")
         else:
             ready_queue.append(current_process)
-        
-        # Check for new arrivals at the end of the time slice
-        while process_queue and process_queue[0].arrival_time <= current_time:
-            process = process_queue.pop(0)
-            ready_queue.append(process)
-            event_log.append(f"Time {current_time} : {process.name} arrived")
 
     # Fill the remaining time with idle events if simulation time is not exhausted
     while current_time < run_for:
@@ -254,27 +251,29 @@ def fifo_scheduler(process_list, run_for):
     current_time = 0
     event_log = []
     process_queue = sorted(process_list, key=lambda p: p.arrival_time)
-    ready_queue = []
+    next_arrival = 0  # Index of the next process to arrive in process_queue
+    total_processes = len(process_queue)
+    ready_queue = deque()
     while current_time < run_for:
         # Check for newly arrived processes
-        while process_queue and process_queue[0].arrival_time <= current_time:
-            new_process = process_queue.pop(0)
+        while next_arrival < total_processes and process_queue[next_arrival].arrival_time <= current_time:
+            new_process = process_queue[next_arrival]
+            next_arrival += 1
             event_log.append(f"Time {current_time:>3} : {new_process.name} arrived")
             ready_queue.append(new_process)
 
         if ready_queue:
-            current_process = ready_queue.pop(0)
+            current_process = ready_queue.popleft()
             if current_process.start_time == -1:
                 current_process.set_start_time(current_time)
             event_log.append(f"Time {current_time:>3} : {current_process.name} selected (burst {current_process.burst_time:>3})")
-            finish_time = current_time + current_process.burst_time
-            while current_time < finish_time:
-                current_time += 1
-                # Check for newly arrived processes during the execution of the current process
-                while process_queue and process_queue[0].arrival_time <= current_time:
-                    new_process = process_queue.pop(0)
-                    event_log.append(f"Time {current_time:>3} : {new_process.name} arrived")
-                    ready_queue.append(new_process)
+            current_time += current_process.burst_time
+            # Processes arriving during the execution of the current process are logged at their arrival time
+            while next_arrival < total_processes and process_queue[next_arrival].arrival_time <= current_time:
+                new_process = process_queue[next_arrival]
+                next_arrival += 1
+                event_log.append(f"Time {new_process.arrival_time:>3} : {new_process.name} arrived")
+                ready_queue.append(new_process)
             current_process.finish_time = current_time
             current_process.update_metrics(current_time)
             event_log.append(f"Time {current_time:>3} : {current_process.name} finished")
@@ -288,7 +287,12 @@ def fifo_scheduler(process_list, run_for):
 def preemptive_sjf_scheduler(process_list, run_for):
     """
     Simulate the Preemptive Shortest Job First (SJF) scheduling algorithm.
-    
+
+    The simulation is event driven: under SJF a running process can only be preempted when a new
+    process arrives, so the current process runs straight to the next arrival, its completion or
+    the end of the simulation, whichever comes first. The cost grows with the number of events
+    instead of with 'run_for'.
+
     Parameters:
     process_list (list of Process): List of processes to be scheduled.
     run_for (int): Total time units to run the simulation.
@@ -297,129 +301,252 @@ def preemptive_sjf_scheduler(process_list, run_for):
     list of str: Event log detailing the scheduling process.
     """
     current_time = 0
-    tick_events = {}  # Dictionary to store events by tick
-    ready_queue = []  # Initialize the ready queue as a min-heap
+    event_log = []  # Events are produced in time order, no per-tick buffering needed
+    ready_queue = []  # Min-heap of (remaining burst, name, sequence, process)
+    current_entry = None  # Heap entry of the process holding the CPU
     last_process = None  # Track the last process that was running
 
-    heapq.heapify(ready_queue)
     process_queue = sorted(process_list, key=lambda p: p.arrival_time)
+    next_arrival = 0  # Index of the next process to arrive in process_queue
+    total_processes = len(process_queue)
 
     while current_time < run_for:
-        if current_time not in tick_events:
-            tick_events[current_time] = []
-
-        while process_queue and process_queue[0].arrival_time <= current_time:
-            process = process_queue.pop(0)
-            heapq.heappush(ready_queue, (process.remaining_burst_time, process.name, process))
-            tick_events[current_time].append(f"Time {current_time} : {process.name} arrived")
+        # Check and handle arrivals at the current time
+        while next_arrival < total_processes and process_queue[next_arrival].arrival_time <= current_time:
+            process = process_queue[next_arrival]
+            heapq.heappush(ready_queue, (process.remaining_burst_time, process.name, next_arrival, process))
+            event_log.append(f"Time {current_time} : {process.name} arrived")
+            next_arrival += 1
 
-        if not ready_queue:
-            tick_events[current_time].append(f"Time {current_time} : Idle")
-            current_time += 1
+        # Time of the next event that may change the scheduling decision
+        if next_arrival < total_processes:
+            next_event_time = min(process_queue[next_arrival].arrival_time, run_for)
+        else:
+            next_event_time = run_for
+
+        # Let the running process compete with the ready queue, keeping the shortest one
+        if current_entry is not None:
+            if ready_queue and ready_queue[0] < current_entry:
+                current_entry = heapq.heappushpop(ready_queue, current_entry)
+        elif ready_queue:
+            current_entry = heapq.heappop(ready_queue)
+        else:
+            # Nothing to run until the next arrival, the CPU stays idle
+            for idle_time in range(current_time, next_event_time):
+                event_log.append(f"Time {idle_time} : Idle")
+            current_time = next_event_time
             continue
 
-        _, _, current_process = heapq.heappop(ready_queue)
-
+        current_process = current_entry[3]
         if last_process != current_process:
             if current_process.start_time == -1:
                 current_process.start_time = current_time
             current_process.response_time = max(current_process.response_time, current_time - current_process.arrival_time)
-            tick_events[current_time].append(f"Time {current_time} : {current_process.name} selected (burst {current_process.remaining_burst_time})")
+            event_log.append(f"Time {current_time} : {current_process.name} selected (burst {current_process.remaining_burst_time})")
         last_process = current_process
 
-        # Simulate execution for 1 time unit
-        next_time = current_time + 1
-        if next_time not in tick_events:
-            tick_events[next_time] = []
-        current_process.remaining_burst_time -= 1
+        # Run the process until it finishes or the next event happens
+        execution_time = min(current_process.remaining_burst_time, next_event_time - current_time)
+        current_time += execution_time
+        current_process.remaining_burst_time -= execution_time
 
-        # Check for completion
         if current_process.remaining_burst_time == 0:
-            current_process.set_finish_time(next_time)
-            tick_events[next_time].append(f"Time {next_time} : {current_process.name} finished")
+            current_process.set_finish_time(current_time)
+            event_log.append(f"Time {current_time} : {current_process.name} finished")
+            current_entry = None
             last_process = None
         else:
-            heapq.heappush(ready_queue, (current_process.remaining_burst_time, current_process.name, current_process))
+            current_entry = (current_process.remaining_burst_time, current_process.name, current_entry[2], current_process)
 
-        current_time += 1
+    return event_log
 
-    # Compile the final event log from the tick_events dictionary
-    event_log = []
-    for time in sorted(tick_events.keys()):
-        event_log.extend(tick_events[time])
+# Ticket index of the Lottery Scheduler Algorithm
+class TicketIndex:
+    """
+    Binary indexed (Fenwick) tree over the tickets held by each process, in process list order.
+    Changing the tickets of a process, the total and drawing a winning process all cost O(log n).
+    """
+
+    def __init__(self, size):
+        """
+        :param size: Number of processes in the index, they all start with no tickets
+        """
+        self.size = size
+        self.tree = [0] * (size + 1)
+        self.tickets = [0] * size
+        self.total = 0
+        self.top_bit = 1 << size.bit_length() if size else 0  # Highest power of two used by the descent
+
+    def set_tickets(self, process_id, tickets):
+        """
+        Sets the number of tickets held by a process.
+
+        :param process_id: Index of the process in the process list
+        :param tickets: The new number of tickets of the process (0 once it finished)
+        """
+        delta = tickets - self.tickets[process_id]
+        if delta == 0:
+            return
+        self.tickets[process_id] = tickets
+        self.total += delta
+        position = process_id + 1
+        tree = self.tree
+        while position <= self.size:
+            tree[position] += delta
+            position += position & -position
+
+    def draw(self, lottery):
+        """
+        Finds the winner of a draw by prefix-sum descent: the first process, in process list
+        order, at which the running ticket count reaches the drawn ticket.
+
+        :param lottery: The drawn ticket, between 1 and the total number of tickets
+        :return: Index of the winning process in the process list
+        """
+        position = 0
+        remaining = lottery
+        step = self.top_bit
+        tree = self.tree
+        while step:
+            next_position = position + step
+            if next_position <= self.size and tree[next_position] < remaining:
+                position = next_position
+                remaining -= tree[next_position]
+            step >>= 1
+        return position
+
+
+# Number of lottery tickets a process holds, processes closer to completion hold more tickets
+def process_tickets(process):
+    return max(1, 10 - process.remaining_burst_time)
 
-    return event_log
 
 # Function for the Lottery Scheduler Algorithm
 def lottery_scheduling(processes, time_units):
     event_log = []
     current_time = 0
-    active_processes = processes[:]  # Keeps only active (not finished) processes
+    ticket_index = TicketIndex(len(processes))  # Tickets of the arrived, active (not finished) processes
     last_selected_process = None  # Tracks the last selected process
-    tick_events = {}  # Dictionary to hold events for each tick
 
-    def calculate_total_tickets():
-        # Only active processes are considered for ticket assignment
-        return sum(max(1, 10 - p.remaining_burst_time) for p in active_processes if p.arrival_time <= current_time)
-    
-    while current_time < time_units:
-        total_tickets = calculate_total_tickets()
-        current_process = None
+    # Processes by arrival time, processes arriving together stay in input order
+    arrival_order = sorted(range(len(processes)), key=lambda i: processes[i].arrival_time)
+    next_arrival = 0
+    total_processes = len(arrival_order)
 
-        # Initialize the list of events for the current tick if not already initialized
-        if current_time not in tick_events:
-            tick_events[current_time] = []
+    # Processes that arrived before the start of the simulation hold tickets from the start
+    while next_arrival < total_processes and processes[arrival_order[next_arrival]].arrival_time < current_time:
+        process_id = arrival_order[next_arrival]
+        ticket_index.set_tickets(process_id, process_tickets(processes[process_id]))
+        next_arrival += 1
 
+    while current_time < time_units:
         # Check and log arrivals at the current time
-        for process in processes:
-            if process.arrival_time == current_time:
-                tick_events[current_time].append(f"Time {current_time} : {process.name} arrived")
-
-        if total_tickets > 0:
-            lottery = random.randint(1, total_tickets)
-            current_ticket = 0
-
-            # Lottery selection process
-            for process in active_processes:
-                if process.arrival_time <= current_time:
-                    current_ticket += max(1, 10 - process.remaining_burst_time)
-                    if current_ticket >= lottery:
-                        current_process = process
-                        break
-
-            # Process execution and logging
-            if current_process:
-                if current_process.remaining_burst_time > 0:
-                    if last_selected_process != current_process:
-                        if current_process.response_time == -1:
-                            current_process.response_time = 0  # Set response time to 0 if it is -1
-                        tick_events[current_time].append(f"Time {current_time} : {current_process.name} selected (burst {max(0, current_process.remaining_burst_time)})")
-                    last_selected_process = current_process
-
-                    current_process.remaining_burst_time -= 1
-
-                    # Log when a process finishes
-                    if current_process.remaining_burst_time == 0:
-                        current_process.set_finish_time(current_time + 1)
-                        tick_events[current_time + 1] = tick_events.get(current_time + 1, []) + [f"Time {current_time + 1} : {current_process.name} finished"]
-                        active_processes.remove(current_process)  # Remove finished process from active list
-                        last_selected_process = None  # Reset last selected process as it has finished
-        else:
-            # Log idle without conditionally checking other events
-            tick_events[current_time].append(f"Time {current_time} : Idle")
+        while next_arrival < total_processes and processes[arrival_order[next_arrival]].arrival_time == current_time:
+            process_id = arrival_order[next_arrival]
+            ticket_index.set_tickets(process_id, process_tickets(processes[process_id]))
+            event_log.append(f"Time {current_time} : {processes[process_id].name} arrived")
+            next_arrival += 1
+
+        if ticket_index.total == 0:
+            # Nothing is runnable, the CPU stays idle until the next arrival
+            if next_arrival < total_processes:
+                idle_until = min(processes[arrival_order[next_arrival]].arrival_time, time_units)
+            else:
+                idle_until = time_units
+            for idle_time in range(current_time, idle_until):
+                event_log.append(f"Time {idle_time} : Idle")
+            current_time = idle_until
+            continue
+
+        # Lottery selection process
+        lottery = random.randint(1, ticket_index.total)
+        current_id = ticket_index.draw(lottery)
+        current_process = processes[current_id]
+
+        # Process execution and logging
+        if current_process.remaining_burst_time > 0:
+            if last_selected_process != current_process:
+                # The first selection is the start of the process, its response time is measured to it
+                current_process.set_start_time(current_time)
+                event_log.append(f"Time {current_time} : {current_process.name} selected (burst {max(0, current_process.remaining_burst_time)})")
+            last_selected_process = current_process
+
+            current_process.remaining_burst_time -= 1
+
+            # Log when a process finishes
+            if current_process.remaining_burst_time == 0:
+                current_process.set_finish_time(current_time + 1)
+                event_log.append(f"Time {current_time + 1} : {current_process.name} finished")
+                ticket_index.set_tickets(current_id, 0)  # Finished processes hold no tickets
+                last_selected_process = None  # Reset last selected process as it has finished
+            else:
+                ticket_index.set_tickets(current_id, process_tickets(current_process))
 
         current_time += 1
-    
-    # Compile events from tick_events dictionary into event_log list
-    for time in sorted(tick_events.keys()):
-        event_log.extend(tick_events[time])
 
     return event_log
 
+# Colors given to the processes in the report
+PREDEFINED_COLORS = [
+    "#FF6347", "#4682B4", "#32CD32", "#FFD700", "#8A2BE2", "#FF1493",
+    "#00CED1", "#FF8C00", "#ADFF2F", "#4B0082", "#FF4500", "#7CFC00"
+]
+
+# Function that builds the run-length segments of the Gantt chart
+def build_gantt_segments(events, end_time):
+    """
+    Builds the Gantt chart as run-length segments in a single pass over the sorted events.
+    A process holds the CPU from the time it is selected until it finishes or another process
+    is selected, and consecutive runs of the same process are merged. The gaps are idle time.
+
+    Parameters:
+    events (list of (int, str)): Events of the output file as (time, event text), in time order.
+    end_time (int): Time at which the chart ends.
+
+    Returns:
+    list of (str, int, int): Segments (process name or "Idle", start time, end time).
+    """
+    segments = []
+    last_end = 0
+    current_process = None
+    current_start = 0
+
+    def add_segment(process, start, end):
+        nonlocal last_end
+        end = min(end, end_time)
+        if start > last_end:
+            segments.append(("Idle", last_end, start))
+        if end > start:
+            if segments and segments[-1][0] == process and segments[-1][2] == start:
+                segments[-1] = (process, segments[-1][1], end)  # Same process selected again
+            else:
+                segments.append((process, start, end))
+        last_end = max(last_end, end)
+
+    for time, event in events:
+        if "selected" in event:
+            if current_process is not None:
+                add_segment(current_process, current_start, time)
+            current_process = event.split()[0]
+            current_start = time
+        elif "finished" in event:
+            if current_process is not None:
+                add_segment(current_process, current_start, time)
+            current_process = None
+
+    if current_process is not None:
+        add_segment(current_process, current_start, end_time)
+    if last_end < end_time:
+        segments.append(("Idle", last_end, end_time))
+    return segments
+
+
 # Function that generates the HTML file for visualizing the output
 def generate_html_file(output_file, input_file, html_file):
     """
     Generate an HTML file to display the input, output, and a Gantt chart of the scheduling process.
+    The Gantt chart has one cell per run-length segment rather than one per time unit, and the
+    page is assembled from a list of parts joined once.
 
     Parameters:
     output_file (str): The name of the output file.
@@ -434,50 +561,30 @@ def generate_html_file(output_file, input_file, html_file):
     with open(output_file, 'r') as file:
         output_content = file.readlines()
 
-    # Extract process names and events for the Gantt chart
+    # Extract the events and the end of the simulation for the Gantt chart
     events = []
-    max_time = 0
+    end_time = 0
     for line in output_content:
         if line.startswith("Time"):
             time, event = line.split(" : ")
             time = int(time.strip().split()[1])
-            event = event.strip()
-            events.append((time, event))
-            if "finished" in event:
-                max_time = max(max_time, time)
+            events.append((time, event.strip()))
+            end_time = max(end_time, time)
+        elif line.startswith("Finished at time"):
+            end_time = max(end_time, int(line.split()[-1]))
 
-    # Create a dictionary to hold the Gantt chart data
-    gantt_data = {}
-    process_colors = {}
-    predefined_colors = [
-        "#FF6347", "#4682B4", "#32CD32", "#FFD700", "#8A2BE2", "#FF1493",
-        "#00CED1", "#FF8C00", "#ADFF2F", "#4B0082", "#FF4500", "#7CFC00"
-    ]
-    current_process = None
-
-    for i in range(max_time + 1):
-        gantt_data[i] = "Idle"
-        for time, event in events:
-            if time == i:
-                if "arrived" in event:
-                    pass
-                elif "selected" in event:
-                    current_process = event.split()[0]
-                    gantt_data[i] = current_process
-                elif "finished" in event:
-                    gantt_data[i] = current_process
-                    current_process = None
-            elif current_process:
-                gantt_data[i] = current_process
+    segments = build_gantt_segments(events, end_time)
 
     # Assign colors to processes
-    unique_processes = set(gantt_data.values()) - {"Idle"}
+    process_colors = {}
+    predefined_colors = PREDEFINED_COLORS[:]
     random.shuffle(predefined_colors)
-    for idx, process in enumerate(unique_processes):
-        process_colors[process] = predefined_colors[idx % len(predefined_colors)]
+    for process, _, _ in segments:
+        if process != "Idle" and process not in process_colors:
+            process_colors[process] = predefined_colors[len(process_colors) % len(predefined_colors)]
 
     # Initialize the HTML content
-    html_content = f"""
+    html_parts = ["""
     <!DOCTYPE html>
     <html lang="en">
     <head>
@@ -485,22 +592,22 @@ def generate_html_file(output_file, input_file, html_file):
         <meta name="viewport" content="width=device-width, initial-scale=1.0">
         <title>Scheduling Simulation Results</title>
         <style>
-            body {{{{ font-family: Arial, sans-serif; }}}}
-            h1 {{{{ text-align: center; }}}}
-            h2 {{{{ margin-top: 50px; }}}}
-            pre {{{{ background-color: #f4f4f4; padding: 15px; border: 1px solid #ccc; }}}}
-            table {{{{ width: 100%; border-collapse: collapse; margin-top: 20px; }}}}
-            th, td {{{{ padding: 10px; border: 1px solid #ccc; text-align: center; }}}}
-            .idle {{{{ background-color: #f0f0f0; }}}}
-            .chart-table {{{{ border: 1px solid black; border-collapse: collapse; width: 100%; }}}}
-            .chart-table td {{{{ border: 1px solid black; text-align: center; padding: 5px; }}}}
-    """
+            body { font-family: Arial, sans-serif; }
+            h1 { text-align: center; }
+            h2 { margin-top: 50px; }
+            pre { background-color: #f4f4f4; padding: 15px; border: 1px solid #ccc; }
+            table { width: 100%; border-collapse: collapse; margin-top: 20px; }
+            th, td { padding: 10px; border: 1px solid #ccc; text-align: center; }
+            .idle { background-color: #f0f0f0; }
+            .chart-table { border: 1px solid black; border-collapse: collapse; width: 100%; table-layout: fixed; }
+            .chart-table td { border: 1px solid black; text-align: center; padding: 5px; overflow: hidden; }
+    """]
 
     # Add styles for each process
     for process, color in process_colors.items():
-        html_content += f".{process} {{{{ background-color: {color}; }}}}\n"
+        html_parts.append(f".{process} {{ background-color: {color}; }}\n")
 
-    html_content += """
+    html_parts.append(f"""
         </style>
     </head>
     <body>
@@ -508,59 +615,61 @@ def generate_html_file(output_file, input_file, html_file):
         <h2>Input</h2>
         <pre>{input_content}</pre>
         <h2>Output</h2>
-        <pre>{output_content}</pre>
+        <pre>{''.join(output_content)}</pre>
         <h2>Time Frame</h2>
         <table>
             <tr>
                 <th>Time</th>
                 <th>Event</th>
             </tr>
-    """
-
-    # Process the output content to extract events and visualize them
-    for line in output_content:
-        if line.startswith("Time"):
-            time, event = line.split(" : ")
-            time = time.strip()
-            event = event.strip()
-            css_class = "idle" if event == "Idle" else gantt_data[int(time.split()[1])]
-            html_content += f"""
+    """)
+
+    # Rows of the events, colored with the process holding the CPU at that time. Events and
+    # segments are both in time order, so the matching segment is found by moving forward
+    segment_index = 0
+    for time, event in events:
+        while segment_index < len(segments) and segments[segment_index][2] <= time:
+            segment_index += 1
+        if event == "Idle" or segment_index == len(segments) or segments[segment_index][0] == "Idle":
+            css_class = "idle"
+        else:
+            css_class = segments[segment_index][0]
+        html_parts.append(f"""
             <tr class="{css_class}">
-                <td>{time}</td>
+                <td>Time {time}</td>
                 <td>{event}</td>
             </tr>
-            """
+            """)
 
-    # Add the Gantt chart
-    html_content += """
+    # Add the Gantt chart, one cell per segment with a width proportional to its length
+    html_parts.append("""
         </table>
         <h2>Gantt Chart</h2>
         <table class="chart-table">
             <tr>
-    """
+    """)
 
-    # Add time labels to the Gantt chart
-    for i in range(max_time + 1):
-        html_content += f"<td>{i}</td>"
-    html_content += "</tr><tr>"
+    # Add the start time of each segment
+    for _, start, end in segments:
+        html_parts.append(f"<td style='width: {100 * (end - start) / end_time:.4f}%'>{start}</td>")
+    html_parts.append("</tr><tr>")
 
     # Add process labels to the Gantt chart
-    for i in range(max_time + 1):
-        process = gantt_data[i]
+    for process, start, end in segments:
         css_class = "idle" if process == "Idle" else process
-        html_content += f"<td class='{css_class}'>{process}</td>"
+        html_parts.append(f"<td class='{css_class}' title='{process} {start}-{end}'>{process}</td>")
 
     # Close the HTML tags
-    html_content += """
+    html_parts.append("""
             </tr>
         </table>
     </body>
     </html>
-    """
+    """)
 
     # Write the HTML content to the file
     with open(html_file, 'w') as file:
-        file.write(html_content.format(input_content=input_content, output_content=''.join(output_content)))
+        file.write("".join(html_parts))
 
 
 # Main function that sets the flow of the program
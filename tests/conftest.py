@@ -0,0 +1,20 @@
+import random
+
+# Shapes of the random workloads, as (latest arrival, longest burst). Close arrivals and short
+# bursts give ties and long queues, spread out arrivals give idle time
+WORKLOAD_SHAPES = [(5, 3), (5, 20), (60, 3), (60, 20)]
+
+
+def random_workload(seed):
+    """
+    Seeded random workload shared by the tests that check a scheduler against another one.
+
+    :param seed: Seed of the workload
+    :return: Tuple (list of (name, arrival time, burst time) in no particular order, random.Random
+             seeded with 'seed' to draw the other parameters of the run from)
+    """
+    rng = random.Random(seed)
+    latest_arrival, longest_burst = WORKLOAD_SHAPES[seed % len(WORKLOAD_SHAPES)]
+    processes = [(f"P{i}", rng.randint(0, latest_arrival), rng.randint(1, longest_burst))
+                 for i in range(rng.randint(1, 25))]
+    return processes, rng
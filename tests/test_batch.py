@@ -0,0 +1,35 @@
+import csv
+
+from Dependencies.batch import SUMMARY_FIELDS, collect_input_files, run_batch, write_summary_file
+
+INPUT_FILES = {
+    "a.in": "processcount 3\nrunfor 30\nuse rr\nquantum 2\n"
+            "process name A arrival 0 burst 5\nprocess name B arrival 1 burst 4\nprocess name C arrival 3 burst 2\nend\n",
+    "b.in": "processcount 2\nrunfor 10\nuse fcfs, sjf\n"
+            "process name A arrival 0 burst 6\nprocess name B arrival 1 burst 2\nend\n",
+    "bad.in": "processcount 2\nrunfor 10\nuse fcfs\nprocess name A arrival 0 burst 6\nend\n",
+}
+
+
+def test_summary_has_one_row_per_run(tmp_path):
+    for name, text in INPUT_FILES.items():
+        (tmp_path / name).write_text(text)
+    (tmp_path / "notes.txt").write_text("not an input file")
+    input_files = collect_input_files([str(tmp_path)])
+    assert input_files == [str(tmp_path / name) for name in sorted(INPUT_FILES)]
+
+    summary_file = tmp_path / "summary.csv"
+    write_summary_file(str(summary_file), run_batch(input_files, workers=2, write_html=False))
+    with open(summary_file, newline='') as file:
+        reader = csv.DictReader(file)
+        assert reader.fieldnames == SUMMARY_FIELDS
+        rows = [[row[field] for field in SUMMARY_FIELDS[:-1]] for row in reader]
+
+    assert rows == [
+        [str(tmp_path / "a.in"), "ok", "rr", "3", "3", "4.667", "8.333", "1.333"],
+        [str(tmp_path / "b.in"), "ok", "fcfs", "2", "2", "2.5", "6.5", "2.5"],
+        [str(tmp_path / "b.in"), "ok", "sjf", "2", "2", "1.0", "5.0", "0.0"],
+        [str(tmp_path / "bad.in"), "Error: Number of processes does not match 'processcount'.", "", "", "", "", "", ""],
+    ]
+    # Each run writes its own output file, a failed input file writes none
+    assert sorted(path.name for path in tmp_path.glob("*.out")) == ["a.out", "b-fcfs.out", "b-sjf.out"]
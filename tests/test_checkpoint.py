@@ -0,0 +1,49 @@
+import random
+
+import pytest
+
+from Dependencies.main import resume_checkpoint, run_input_file
+
+WORKLOAD = """processcount 4
+runfor {run_for}
+use {algorithm}
+quantum 2
+process name A arrival 0 burst 9
+process name B arrival 1 burst 4
+process name C arrival 3 burst 7
+process name D arrival 20 burst 5
+end
+"""
+
+
+def write_input(directory, algorithm, run_for):
+    directory.mkdir()
+    input_file = directory / "workload.in"
+    input_file.write_text(WORKLOAD.format(algorithm=algorithm, run_for=run_for))
+    return str(input_file)
+
+
+@pytest.mark.parametrize("algorithm", ["fcfs", "sjf", "rr", "lottery", "mlfq", "fair"])
+@pytest.mark.parametrize("write_html", [False, True])
+def test_resumed_run_matches_single_run(tmp_path, algorithm, write_html):
+    single = write_input(tmp_path / "single", algorithm, 30)
+    run_input_file(single, True, write_html, seed=7)
+
+    checkpointed = write_input(tmp_path / "checkpointed", algorithm, 8)
+    checkpoint_file = str(tmp_path / "run.ckpt")
+    run_input_file(checkpointed, True, write_html, checkpoint_file, seed=7)
+    random.seed(12345)  # Whatever ran in between, the resumed run continues the saved generator
+    resume_checkpoint(checkpoint_file, 16)
+    resume_checkpoint(checkpoint_file, 30)
+
+    with open(single.replace(".in", ".out")) as expected, open(checkpointed.replace(".in", ".out")) as resumed:
+        assert resumed.read() == expected.read()
+
+
+def test_resume_needs_a_larger_runfor(tmp_path, capsys):
+    input_file = write_input(tmp_path / "run", "rr", 10)
+    checkpoint_file = str(tmp_path / "run.ckpt")
+    run_input_file(input_file, True, False, checkpoint_file)
+    with pytest.raises(SystemExit):
+        resume_checkpoint(checkpoint_file, 10)
+    assert "'runfor' must be larger than 10" in capsys.readouterr().out
@@ -0,0 +1,37 @@
+import random
+from collections import deque
+
+from Dependencies.compare import compare_items, run_compare, run_summary
+from Dependencies.data_structure import Process
+from Dependencies.input_file_parsing import parse_input_lines
+from Dependencies.main import scheduler_events
+
+WORKLOAD = """processcount 5
+runfor 60
+process name A arrival 0 burst 7
+process name B arrival 2 burst 3
+process name C arrival 3 burst 9
+process name D arrival 9 burst 1
+process name E arrival 30 burst 4
+end
+"""
+
+
+def test_use_line_is_optional_for_compare_mode():
+    process_list, run_for, runs = parse_input_lines(WORKLOAD.splitlines(), with_runs=False)
+    assert (len(process_list), run_for, runs) == (5, 60, [])
+
+
+def test_workers_match_a_sequential_run(tmp_path):
+    input_file = tmp_path / "workload.in"
+    input_file.write_text(WORKLOAD)
+    algorithms = ("fcfs", "sjf", "rr", "lottery", "mlfq", "fair")
+    summaries = run_compare(str(input_file), algorithms, (2, 5), seed=11, workers=2)
+
+    process_list, run_for, _ = parse_input_lines(WORKLOAD.splitlines(), with_runs=False)
+    for summary, (label, algorithm, quantum) in zip(summaries, compare_items(algorithms, (2, 5))):
+        random.seed(11)
+        processes = [Process(process.name, process.arrival_time, process.burst_time) for process in process_list]
+        deque(scheduler_events(processes, run_for, algorithm, quantum), maxlen=0)
+        expected = run_summary(label, processes, 0)
+        assert {**summary, "seconds": 0} == expected
@@ -0,0 +1,45 @@
+import random
+from collections import deque
+
+import pytest
+
+from Dependencies.data_structure import Process
+from Dependencies.main import scheduler_events
+
+# A runs 0-3, B 3-5 (or in slices with rr), the CPU is idle 5-6, C runs 6-8, then idle until 10
+EXPECTED_COUNTERS = {
+    ("fcfs", None): dict(loop_iterations=3, context_switches=3, idle_ticks=3, simulated_ticks=10),
+    ("rr", 2): dict(loop_iterations=5, context_switches=4, queue_pushes=4, queue_pops=4, idle_ticks=3,
+                    simulated_ticks=10),
+    # B arrives with the remaining time of A and loses the tie on the name, nothing is preempted
+    ("sjf", None): dict(loop_iterations=6, context_switches=3, heap_pushes=3, heap_pops=3, heap_pushpops=0,
+                        idle_ticks=3, simulated_ticks=10),
+    # One draw per busy time unit, one ticket update per arrival and per draw
+    ("lottery", None): dict(loop_iterations=9, context_switches=3, lottery_draws=7, ticket_updates=10,
+                            idle_ticks=3, simulated_ticks=10),
+}
+
+
+def workload():
+    return [Process("A", 0, 3), Process("B", 1, 2), Process("C", 6, 2)]
+
+
+@pytest.mark.parametrize("algorithm, quantum", list(EXPECTED_COUNTERS))
+def test_counters_of_a_small_workload(algorithm, quantum):
+    random.seed(1)
+    counters = {}
+    events = list(scheduler_events(workload(), 10, algorithm, quantum, None, counters))
+    assert counters == EXPECTED_COUNTERS[algorithm, quantum]
+
+    # Counting changes nothing in the simulation
+    random.seed(1)
+    assert list(scheduler_events(workload(), 10, algorithm, quantum)) == events
+
+
+def test_counters_are_only_stored_once_the_events_are_consumed():
+    counters = {}
+    events = scheduler_events(workload(), 10, "rr", 2, None, counters)
+    next(events)
+    assert counters == {}
+    deque(events, maxlen=0)
+    assert counters["context_switches"] == 4
@@ -0,0 +1,47 @@
+import pytest
+
+from Dependencies.data_structure import Process, ProcessTable, Workload
+from Dependencies.main import scheduler_events
+
+METRICS = ("start_time", "finish_time", "turnaround_time", "waiting_time", "response_time", "remaining_burst_time")
+
+
+def metrics(process_list):
+    return [tuple(getattr(process, column) for column in METRICS) for process in process_list]
+
+
+def workload():
+    return Workload.from_processes([Process("A", 0, 5), Process("Bé", 1, 3), Process("C", 4, 1)])
+
+
+def test_workload_rejects_mutation():
+    frozen = workload()
+    with pytest.raises(AttributeError):
+        frozen.arrival_times = [9, 9, 9]
+    with pytest.raises(AttributeError):
+        frozen.label = "new attribute"
+    with pytest.raises(TypeError):
+        frozen.burst_times[0] = 1
+    with pytest.raises(TypeError):
+        frozen.name_data[0] = 0
+    assert list(frozen.burst_times) == [5, 3, 1]
+
+
+@pytest.mark.parametrize("columnar", [False, True])
+def test_every_run_starts_from_the_frozen_workload(columnar):
+    frozen = workload()
+    first = frozen.new_run(columnar)
+    assert isinstance(first, ProcessTable) == columnar
+    assert [(process.name, process.arrival_time, process.burst_time) for process in first] == [
+        ("A", 0, 5), ("Bé", 1, 3), ("C", 4, 1)]
+    fresh = metrics(first)
+    assert fresh == [(-1, -1, 0, 0, -1, 5), (-1, -1, 0, 0, -1, 3), (-1, -1, 0, 0, -1, 1)]
+
+    list(scheduler_events(first, 20, "rr", 2))
+    assert metrics(first) != fresh
+    # The run changed its own state only, the next runs start over and give the same result
+    second = frozen.new_run(columnar)
+    assert metrics(second) == fresh
+    list(scheduler_events(second, 20, "rr", 2))
+    assert metrics(second) == metrics(first)
+    assert list(frozen.burst_times) == [5, 3, 1] and len(frozen) == 3
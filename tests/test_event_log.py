@@ -0,0 +1,56 @@
+from Dependencies.data_structure import Process
+from Dependencies.event_log import EVENT_ARRIVED, EVENT_FINISHED, EVENT_IDLE, EVENT_SELECTED, EventLog
+
+
+def test_consecutive_idle_time_is_one_record():
+    process_list = [Process("A", 2, 1), Process("B", 6, 1)]
+    event_log = EventLog.collect(process_list, [
+        (0, EVENT_IDLE, -1, 1),
+        (1, EVENT_IDLE, -1, 1),     # Extends the previous idle record
+        (2, EVENT_ARRIVED, 0, 0),
+        (2, EVENT_SELECTED, 0, 1),
+        (3, EVENT_FINISHED, 0, 0),
+        (3, EVENT_IDLE, -1, 0),     # No idle time, not recorded
+        (3, EVENT_IDLE, -1, 2),
+        (5, EVENT_IDLE, -1, 1),
+        (6, EVENT_ARRIVED, 1, 0),
+        (6, EVENT_SELECTED, 1, 1),
+        (7, EVENT_FINISHED, 1, 0),
+    ])
+    assert list(event_log) == [
+        (0, EVENT_IDLE, -1, 2),
+        (2, EVENT_ARRIVED, 0, 0),
+        (2, EVENT_SELECTED, 0, 1),
+        (3, EVENT_FINISHED, 0, 0),
+        (3, EVENT_IDLE, -1, 3),
+        (6, EVENT_ARRIVED, 1, 0),
+        (6, EVENT_SELECTED, 1, 1),
+        (7, EVENT_FINISHED, 1, 0),
+    ]
+    assert len(event_log) == 8
+
+
+def test_idle_runs_render_one_line_per_time_unit():
+    process_list = [Process("A", 0, 2), Process("B", 4, 1)]
+    event_log = EventLog(process_list)
+    event_log.append(0, EVENT_ARRIVED, 0)
+    event_log.append(0, EVENT_SELECTED, 0, 2)
+    event_log.append(2, EVENT_FINISHED, 0)
+    event_log.append(2, EVENT_IDLE, value=2)
+    event_log.append(4, EVENT_ARRIVED, 1)
+    event_log.append(4, EVENT_SELECTED, 1, 1)
+    event_log.append(5, EVENT_FINISHED, 1)
+    # Idle time that does not follow the previous idle record directly starts a new one
+    event_log.append(6, EVENT_IDLE, value=1)
+    assert len(event_log) == 8
+    assert list(event_log.lines()) == [
+        "Time 0 : A arrived",
+        "Time 0 : A selected (burst 2)",
+        "Time 2 : A finished",
+        "Time 2 : Idle",
+        "Time 3 : Idle",
+        "Time 4 : B arrived",
+        "Time 4 : B selected (burst 1)",
+        "Time 5 : B finished",
+        "Time 6 : Idle",
+    ]
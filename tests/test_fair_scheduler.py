@@ -0,0 +1,53 @@
+import random
+
+from Dependencies.data_structure import Process
+from Dependencies.event_log import EVENT_FINISHED, EVENT_SELECTED
+from Dependencies.Scheduler_Algorithms.fair_scheduler import fair_events
+
+
+def selections(process_list, events, since=0):
+    return [(time, process_list[process_id].name) for time, kind, process_id, _ in events
+            if kind == EVENT_SELECTED and time >= since]
+
+
+def test_runnable_processes_share_the_target_latency():
+    process_list = [Process("A", 0, 6), Process("B", 0, 6), Process("C", 0, 6)]
+    events = list(fair_events(process_list, 40, 6, 1))
+    assert selections(process_list, events)[:6] == [(0, "A"), (2, "B"), (4, "C"), (6, "A"), (8, "B"), (10, "C")]
+    assert [(process.start_time, process.finish_time) for process in process_list] == [(0, 14), (2, 16), (4, 18)]
+
+
+def test_new_process_starts_at_the_smallest_virtual_runtime():
+    # B arrives once A has 50 units of virtual runtime, it gets its share instead of running alone
+    process_list = [Process("A", 0, 100), Process("B", 50, 10)]
+    events = list(fair_events(process_list, 200, 4, 1))
+    # The arrival of B shrinks the share of A, which is preempted at 50 instead of 52
+    assert selections(process_list, events, since=48)[:6] == [(48, "A"), (50, "A"), (52, "B"), (54, "A"), (56, "B"), (58, "A")]
+    assert (process_list[1].start_time, process_list[1].finish_time) == (52, 70)
+    assert process_list[0].finish_time == 110
+
+
+def test_smallest_virtual_runtime_runs_next():
+    for seed in range(15):
+        rng = random.Random(seed)
+        process_list = [Process(f"P{i}", 0, rng.randint(1, 20)) for i in range(rng.randint(1, 10))]
+        target_latency = rng.randint(1, 12)
+        min_granularity = rng.randint(1, 3)
+        events = list(fair_events(process_list, 1000, target_latency, min_granularity))
+
+        # All the processes arrive at 0, so their virtual runtime is the CPU time they received
+        received = [0] * len(process_list)
+        finished = set()
+        running = None
+        for time, kind, process_id, remaining in events:
+            if kind == EVENT_SELECTED:
+                if running is not None:
+                    received[running[0]] += time - running[1]
+                runnable = [i for i in range(len(process_list)) if i not in finished]
+                assert process_id == min(runnable, key=lambda i: (received[i], i)), f"seed {seed}"
+                running = (process_id, time)
+            elif kind == EVENT_FINISHED:
+                received[process_id] += time - running[1]
+                finished.add(process_id)
+                running = None
+        assert received == [process.burst_time for process in process_list]
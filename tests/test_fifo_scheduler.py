@@ -0,0 +1,61 @@
+import pytest
+
+from Benchmarks.reference_schedulers import reference_fifo_scheduler
+from Dependencies.data_structure import Process, ProcessTable
+from Dependencies.Scheduler_Algorithms import fifo_scheduler as fifo_module
+from Dependencies.Scheduler_Algorithms.fifo_scheduler import fifo_scheduler, vectorized_fifo_scheduler
+from tests.conftest import random_workload
+
+METRICS = ("start_time", "finish_time", "turnaround_time", "waiting_time", "response_time")
+
+
+def metrics(process_list):
+    return [tuple(getattr(process, column) for column in METRICS) for process in process_list]
+
+
+@pytest.fixture(params=["numpy", "python"])
+def engine(request, monkeypatch):
+    if request.param == "numpy":
+        pytest.importorskip("numpy")
+    else:
+        monkeypatch.setattr(fifo_module, "np", None)
+    return request.param
+
+
+@pytest.mark.parametrize("columnar", [False, True])
+def test_closed_form_matches_the_simulation(engine, columnar):
+    for seed in range(40):
+        processes, rng = random_workload(seed)
+        run_for = rng.randint(1, 150)
+
+        expected = [Process(*process) for process in processes]
+        expected_events = list(fifo_scheduler(expected, run_for))
+        if columnar:
+            computed = ProcessTable()
+            for process in processes:
+                computed.add_process(*process)
+        else:
+            computed = [Process(*process) for process in processes]
+        computed_events = list(vectorized_fifo_scheduler(computed, run_for, trace=True))
+
+        assert metrics(computed) == metrics(expected), f"seed {seed}"
+        assert computed_events == expected_events, f"seed {seed}"
+
+
+def test_metrics_only_run_builds_no_trace(engine):
+    process_list = [Process("A", 2, 3), Process("B", 0, 4), Process("C", 20, 1), Process("D", 21, 1)]
+    assert vectorized_fifo_scheduler(process_list, 10) is None
+    # The CPU is free before 'runfor', so C still runs after it, but D never gets the CPU
+    assert metrics(process_list) == [(4, 7, 5, 2, 2), (0, 4, 4, 0, 0), (20, 21, 1, 0, 0), (-1, -1, 0, 0, -1)]
+
+
+def test_arrival_cursor_matches_the_list_queue():
+    for seed in range(40):
+        processes, rng = random_workload(seed)
+        run_for = rng.randint(1, 150)
+        process_list = [Process(*process) for process in processes]
+        expected = [Process(*process) for process in processes]
+
+        lines = list(fifo_scheduler(process_list, run_for).lines())
+        assert lines == reference_fifo_scheduler(expected, run_for), f"seed {seed}"
+        assert metrics(process_list) == metrics(expected), f"seed {seed}"
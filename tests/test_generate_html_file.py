@@ -0,0 +1,49 @@
+import re
+
+from Dependencies.data_structure import Process
+from Dependencies.event_log import EventLog
+from Dependencies.generate_html_file import generate_html_file
+from Dependencies.main import run_input_file, scheduler_events
+
+
+def render(tmp_path, process_list, run_for, algorithm="fcfs", quantum=None):
+    events = EventLog.collect(process_list, scheduler_events(process_list, run_for, algorithm, quantum))
+    html_file = tmp_path / "report.html"
+    generate_html_file(str(html_file), process_list, algorithm, quantum, events, run_for)
+    return html_file.read_text()
+
+
+def test_zero_runfor_renders_an_empty_chart(tmp_path):
+    html = render(tmp_path, [Process("A", 0, 3)], 0)
+    assert "Gantt Chart" in html
+
+
+def test_empty_workload_renders(tmp_path):
+    assert "Gantt Chart" in render(tmp_path, [], 0)
+    assert "<td>Time 0-9</td>" in render(tmp_path, [], 10)
+
+
+def test_idle_time_is_one_row_per_run(tmp_path):
+    html = render(tmp_path, [Process("A", 0, 2), Process("B", 1000, 2)], 2000, "rr", 2)
+    assert html.count("<td>Idle</td>") == 2
+    assert "<td>Time 2-999</td>" in html
+    assert "<td>Time 1002-1999</td>" in html
+    assert "Time 500<" not in html
+
+
+def test_report_sections_come_from_the_simulation(tmp_path):
+    input_file = tmp_path / "run.in"
+    input_file.write_text("processcount 2   # two processes\nrunfor 12\nuse rr\nquantum 2\n"
+                          "process name A arrival 0 burst 3\nprocess name B arrival 1 burst 2  # B\nend\n")
+    run_input_file(str(input_file), write_output=True, write_html=True)
+    input_section, output_section = re.findall(r"<pre>(.*?)</pre>", (tmp_path / "run_out.html").read_text(), re.S)
+    # The input section is rendered from the parsed workload, so the comments are gone
+    assert input_section == ("processcount 2\nrunfor 12\nuse rr\nquantum 2\n"
+                             "process name A arrival 0 burst 3\nprocess name B arrival 1 burst 2\nend\n")
+    assert output_section == (tmp_path / "run.out").read_text()
+
+    # Without an output file the report still has the output section, it never reads the '.out' file
+    (tmp_path / "run.out").unlink()
+    run_input_file(str(input_file), write_output=False, write_html=True)
+    assert not (tmp_path / "run.out").exists()
+    assert re.findall(r"<pre>(.*?)</pre>", (tmp_path / "run_out.html").read_text(), re.S)[1] == output_section
@@ -0,0 +1,52 @@
+import pytest
+
+from Dependencies.data_structure import ProcessTable
+from Dependencies.input_file_parsing import parse_input_lines
+
+LINES = [
+    "processcount 4   # Read 4 processes",
+    "runfor 20",
+    "use rr",
+    "quantum 2",
+    "process name A arrival 0 burst 5",
+    "process name B arrival 1 burst 3   # trailing comment, general path",
+    "  process name C arrival 2 burst 1",
+    "process\tname D arrival 4 burst 2",
+    "end",
+]
+EXPECTED = [("A", 0, 5), ("B", 1, 3), ("C", 2, 1), ("D", 4, 2)]
+
+
+def fields(process_list):
+    return [(process.name, process.arrival_time, process.burst_time) for process in process_list]
+
+
+def test_fast_and_general_process_lines_parse_alike():
+    process_list, run_for, runs = parse_input_lines(LINES)
+    assert fields(process_list) == EXPECTED
+    assert run_for == 20
+    assert runs == [("rr", 2)]
+
+
+def test_columnar_parse_matches_list_parse():
+    process_table, _, _ = parse_input_lines(LINES, columnar=True)
+    assert isinstance(process_table, ProcessTable)
+    assert fields(process_table) == EXPECTED
+    assert [process.remaining_burst_time for process in process_table] == [5, 3, 1, 2]
+    assert [process.start_time for process in process_table] == [-1] * 4
+    # A parsed table can still grow
+    assert process_table.add_process("E", 9, 1) == 4
+    assert process_table.name_of(4) == "E"
+
+
+@pytest.mark.parametrize("columnar", [False, True])
+def test_process_count_mismatch_is_rejected(columnar, capsys):
+    with pytest.raises(SystemExit):
+        parse_input_lines(LINES[:4] + LINES[5:], columnar)
+    assert "does not match 'processcount'" in capsys.readouterr().out
+
+
+def test_invalid_process_line_is_rejected(capsys):
+    with pytest.raises(SystemExit):
+        parse_input_lines(["processcount 1", "runfor 5", "use fcfs", "process name A burst 3 arrival 0", "end"])
+    assert "Invalid process specification" in capsys.readouterr().out
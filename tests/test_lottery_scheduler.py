@@ -0,0 +1,81 @@
+import random
+
+import pytest
+
+from Dependencies.data_structure import Process
+from Dependencies.event_log import EVENT_SELECTED
+from Dependencies.Scheduler_Algorithms.lottery_scheduler import TicketIndex, lottery_events
+
+
+def workload():
+    return [Process("A", 0, 6), Process("B", 0, 4), Process("C", 2, 5), Process("D", 3, 3)]
+
+
+@pytest.mark.parametrize("batched", [False, True])
+def test_response_time_is_measured_to_the_first_selection(batched):
+    random.seed(3)
+    process_list = workload()
+    rng = pytest.importorskip("numpy").random.default_rng(3) if batched else None
+    events = list(lottery_events(process_list, 40, rng=rng))
+
+    first_selection = {}
+    for time, kind, process_id, _ in events:
+        if kind == EVENT_SELECTED:
+            first_selection.setdefault(process_id, time)
+    for process_id, process in enumerate(process_list):
+        assert process.finish_time != -1
+        assert process.start_time == first_selection[process_id]
+        assert process.response_time == process.start_time - process.arrival_time
+    # Only one process can start at time 0, the other one waits for it
+    assert max(process.response_time for process in process_list) > 0
+
+
+def test_ticket_index_draws_by_prefix_sum():
+    ticket_index = TicketIndex(4)
+    for process_id, tickets in enumerate([2, 0, 3, 1]):
+        ticket_index.set_tickets(process_id, tickets)
+    assert ticket_index.total == 6
+    assert [ticket_index.draw(lottery) for lottery in range(1, 7)] == [0, 0, 2, 2, 2, 3]
+    ticket_index.set_tickets(2, 0)
+    assert [ticket_index.draw(lottery) for lottery in range(1, 4)] == [0, 0, 3]
+
+
+def expected_winner(tickets, lottery):
+    # First process at which the running ticket count reaches the drawn ticket
+    running = 0
+    for process_id, count in enumerate(tickets):
+        running += count
+        if running >= lottery:
+            return process_id
+
+
+def test_ticket_index_follows_updates_and_removals():
+    rng = random.Random(7)
+    for size in (1, 2, 5, 8, 13):
+        ticket_index = TicketIndex(size)
+        tickets = [0] * size
+        for _ in range(200):
+            process_id = rng.randrange(size)
+            # A third of the updates remove the process, as when it finishes
+            tickets[process_id] = rng.choice([0, rng.randint(1, 10)])
+            ticket_index.set_tickets(process_id, tickets[process_id])
+            assert ticket_index.total == sum(tickets)
+            for lottery in range(1, ticket_index.total + 1):
+                assert ticket_index.draw(lottery) == expected_winner(tickets, lottery)
+
+
+def test_ticket_index_never_draws_a_removed_process():
+    ticket_index = TicketIndex(6)
+    for process_id in range(6):
+        ticket_index.set_tickets(process_id, process_id + 1)
+    # The first, a middle and the last process finish, the others change their tickets
+    for process_id in (0, 3, 5):
+        ticket_index.set_tickets(process_id, 0)
+    ticket_index.set_tickets(1, 4)
+    ticket_index.set_tickets(4, 1)
+    assert ticket_index.total == 8
+    assert [ticket_index.draw(lottery) for lottery in range(1, 9)] == [1, 1, 1, 1, 2, 2, 2, 4]
+    # A single process left wins every draw
+    ticket_index.set_tickets(1, 0)
+    ticket_index.set_tickets(2, 0)
+    assert [ticket_index.draw(lottery) for lottery in range(1, ticket_index.total + 1)] == [4]
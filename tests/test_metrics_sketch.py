@@ -0,0 +1,80 @@
+import math
+import random
+from fractions import Fraction
+
+import pytest
+
+from Dependencies.data_structure import Process
+from Dependencies.metrics_sketch import AGGREGATE_METRICS, AGGREGATE_QUANTILES, MetricsAggregate, QuantileSketch
+
+PERCENTS = (0, 1, 2.2, 25, 50, 75) + AGGREGATE_QUANTILES + (100,)
+
+
+def nearest_rank(sorted_values, percent):
+    # Exact nearest-rank quantile, fractional percentages included
+    rank = math.ceil(Fraction(str(percent)) * len(sorted_values) / 100)
+    return sorted_values[max(rank, 1) - 1]
+
+
+def sample(seed, count):
+    rng = random.Random(seed)
+    distribution = seed % 3
+    if distribution == 0:
+        return [rng.randint(0, 1000) for _ in range(count)]
+    if distribution == 1:
+        return [int(rng.expovariate(1 / 500)) for _ in range(count)]
+    return [int(rng.paretovariate(1.2) * 10) for _ in range(count)]  # Heavy tail, many buckets
+
+
+@pytest.mark.parametrize("count", [1, 7, 1500, 20000])
+def test_quantiles_within_the_relative_accuracy(count):
+    # Three seeds, one per distribution
+    for seed in range(3):
+        values = sample(seed, count)
+        sketch = QuantileSketch(relative_accuracy=0.01)
+        for value in values:
+            sketch.add(value)
+
+        values.sort()
+        for percent in PERCENTS:
+            exact = nearest_rank(values, percent)
+            assert sketch.quantile(percent) == pytest.approx(exact, rel=0.01, abs=1e-9), f"seed {seed}"
+
+
+def test_empty_sketch_has_no_quantile():
+    assert QuantileSketch().quantile(50) is None
+
+
+def test_merged_buckets_keep_the_high_quantiles():
+    sketch = QuantileSketch(relative_accuracy=0.01, max_buckets=50)
+    values = [int(1.05 ** exponent) + 1 for exponent in range(400)]
+    for value in values:
+        sketch.add(value)
+    assert len(sketch.buckets) <= 50
+
+    values.sort()
+    for percent in (90, 99, 99.9, 100):
+        assert sketch.quantile(percent) == pytest.approx(nearest_rank(values, percent), rel=0.01)
+
+
+def test_aggregate_matches_the_exact_metrics():
+    rng = random.Random(5)
+    process_list = []
+    for index in range(3000):
+        process = Process(f"P{index}", rng.randint(0, 100), rng.randint(1, 50))
+        if index % 10:  # Every tenth process did not finish
+            process.start_time = process.arrival_time + rng.randint(0, 400)
+            process.finish_time = process.start_time + process.burst_time + rng.randint(0, 200)
+            process.update_metrics(process.finish_time)
+        process_list.append(process)
+    aggregate = MetricsAggregate.from_processes(process_list, outliers=5)
+
+    finished = [process for process in process_list if process.finish_time != -1]
+    assert (aggregate.processes, aggregate.finished) == (3000, len(finished))
+    for metric, attribute in AGGREGATE_METRICS.items():
+        values = sorted(getattr(process, attribute) for process in finished)
+        assert aggregate.mean(metric) == pytest.approx(sum(values) / len(values))
+        assert (aggregate.minimums[metric], aggregate.maximums[metric]) == (values[0], values[-1])
+        for percent in AGGREGATE_QUANTILES:
+            assert aggregate.quantile(metric, percent) == pytest.approx(nearest_rank(values, percent), rel=0.01)
+        assert [value for _, value in aggregate.outliers_of(metric)] == values[:-6:-1]
@@ -0,0 +1,86 @@
+from collections import deque
+
+from Dependencies.data_structure import Process
+from Dependencies.event_log import EVENT_SELECTED
+from Dependencies.Scheduler_Algorithms.mlfq_scheduler import find_first_set, mlfq_events
+from tests.conftest import random_workload
+
+
+def reference_mlfq(process_list, run_for, quanta, boost_period):
+    """
+    MLFQ simulated one time unit at a time, with the boosts applied exactly at their time.
+
+    :return: List of (start time, finish time) of each process
+    """
+    queues = [deque() for _ in quanta]
+    level = [0] * len(process_list)
+    used = [0] * len(process_list)
+    remaining = [process.burst_time for process in process_list]
+    start = [-1] * len(process_list)
+    finish = [-1] * len(process_list)
+    arrival_order = sorted(range(len(process_list)), key=lambda i: process_list[i].arrival_time)
+    current = None
+    demoted = None  # Process that used up its quantum, queued after the arrivals of the next time unit
+
+    for time in range(run_for):
+        for process_id in arrival_order:
+            if process_list[process_id].arrival_time == time:
+                queues[0].append(process_id)
+        if demoted is not None:
+            queues[level[demoted]].append(demoted)
+            demoted = None
+        if boost_period and time and time % boost_period == 0:
+            if current is not None and level[current] > 0:
+                queues[level[current]].appendleft(current)
+                current = None
+            for queue in queues[1:]:
+                for process_id in queue:
+                    level[process_id] = used[process_id] = 0
+                queues[0].extend(queue)
+                queue.clear()
+        if current is not None and any(queues[:level[current]]):
+            queues[level[current]].appendleft(current)  # Preempted by a higher level
+            current = None
+        if current is None:
+            ready = [queue for queue in queues if queue]
+            if not ready:
+                continue
+            current = ready[0].popleft()
+            if start[current] == -1:
+                start[current] = time
+
+        remaining[current] -= 1
+        used[current] += 1
+        if remaining[current] == 0:
+            finish[current] = time + 1
+            current = None
+        elif used[current] == quanta[level[current]]:
+            used[current] = 0
+            level[current] = min(level[current] + 1, len(quanta) - 1)
+            demoted, current = current, None
+    return list(zip(start, finish))
+
+
+def test_find_first_set():
+    assert [find_first_set(bitmap) for bitmap in (1, 2, 6, 8, 0b101000)] == [0, 1, 1, 3, 3]
+
+
+def test_boost_preempts_a_lower_level_at_its_time():
+    process_list = [Process("A", 0, 20), Process("B", 0, 20)]
+    events = list(mlfq_events(process_list, 100, (2, 4), boost_period=5))
+    selections = [(time, process_list[process_id].name) for time, kind, process_id, _ in events if kind == EVENT_SELECTED]
+    # A runs at level 1 from time 4 and is boosted at 5, not at the end of its quantum at 8
+    assert selections[:5] == [(0, "A"), (2, "B"), (4, "A"), (5, "A"), (7, "B")]
+
+
+def test_matches_tick_by_tick_reference():
+    for seed in range(30):
+        processes, rng = random_workload(seed)
+        quanta = tuple(rng.randint(1, 6) for _ in range(rng.randint(1, 4)))
+        boost_period = rng.choice([0, 3, 7, 10, 25])
+        process_list = [Process(*process) for process in processes]
+        run_for = sum(process.burst_time for process in process_list) + 70
+
+        expected = reference_mlfq(process_list, run_for, quanta, boost_period)
+        list(mlfq_events(process_list, run_for, quanta, boost_period))
+        assert [(process.start_time, process.finish_time) for process in process_list] == expected, f"seed {seed}"
@@ -0,0 +1,77 @@
+import io
+from collections import deque
+
+import pytest
+
+from Dependencies.data_structure import Process
+from Dependencies.event_log import EVENT_FINISHED, EVENT_IDLE
+from Dependencies.online import run_online
+from Dependencies.Scheduler_Algorithms.round_robin_scheduler import online_round_robin_events, round_robin_events
+from Dependencies.Scheduler_Algorithms.sjf_scheduler import online_preemptive_sjf_events, preemptive_sjf_events
+from tests.conftest import random_workload
+
+
+def batch_and_online(algorithm, processes, run_for, quantum):
+    process_list = [Process(*process) for process in processes]
+    arrivals = (Process(*process) for process in processes)
+    live = {}
+    if algorithm == "rr":
+        batch = list(round_robin_events(process_list, run_for, quantum))
+        online = online_round_robin_events(arrivals, run_for, quantum, live)
+    else:
+        batch = list(preemptive_sjf_events(process_list, run_for))
+        online = online_preemptive_sjf_events(arrivals, run_for, live)
+
+    events = []
+    finished = {}
+    for record in online:
+        events.append(record)
+        if record[1] == EVENT_FINISHED:
+            process = live[record[2]]
+            finished[record[2]] = (process.start_time, process.finish_time, process.response_time)
+    expected = {index: (process.start_time, process.finish_time, process.response_time)
+                for index, process in enumerate(process_list) if process.finish_time != -1}
+    return batch, events, expected, finished, live
+
+
+@pytest.mark.parametrize("algorithm", ["rr", "sjf"])
+def test_online_matches_batch(algorithm):
+    for seed in range(20):
+        processes, rng = random_workload(seed)
+        processes.sort(key=lambda process: process[1])  # A stream is read in arrival order
+        run_for = rng.randint(1, 200)
+        batch, online, expected, finished, live = batch_and_online(algorithm, processes, run_for, rng.randint(1, 5))
+        assert online == batch, f"seed {seed}"
+        assert finished == expected, f"seed {seed}"
+        # Only the processes read from the stream that did not finish are left
+        assert set(live) | set(finished) == set(range(len(live) + len(finished)))
+        assert all(process.finish_time == -1 for process in live.values())
+
+
+@pytest.mark.parametrize("algorithm", ["rr", "sjf"])
+def test_online_without_runfor_stops_when_the_stream_ends(algorithm):
+    processes = [("A", 0, 4), ("B", 2, 3), ("C", 20, 2)]
+    batch, online, expected, finished, live = batch_and_online(algorithm, processes, None, 2)
+    assert len(finished) == 3 and not live
+    assert online[-1] == (22, EVENT_FINISHED, 2, 0)
+    assert [record for record in online if record[1] == EVENT_IDLE] == [(7, EVENT_IDLE, -1, 13)]
+
+
+def test_online_counters_and_state_hooks_are_kept():
+    process_list = [Process("A", 0, 5), Process("B", 1, 3), Process("C", 9, 4)]
+    state, counters = {}, {}
+    deque(round_robin_events(process_list, 6, 2, state, counters), maxlen=0)
+    assert counters["simulated_ticks"] == 6 and counters["queue_pops"] == counters["context_switches"]
+    assert state["next_arrival"] == 2
+    resumed = list(round_robin_events(process_list, 30, 2, state))
+    assert resumed[0][0] >= 6
+    assert [process.finish_time for process in process_list] == [8, 7, 13]
+
+
+def test_run_online_summary():
+    stream = ["use rr", "quantum 2", "process name A arrival 0 burst 3", "process name B arrival 1 burst 1", "end"]
+    output = io.StringIO()
+    assert run_online(stream, output) == (2, 2)
+    lines = output.getvalue().splitlines()
+    assert lines[-2:] == ["Finished at time 4", "2 processes"]
+    assert "B wait 1 turnaround 2 response 1" in lines
@@ -0,0 +1,37 @@
+from Dependencies import profiling
+from Dependencies.main import run_input_file
+from Dependencies.profiling import PhaseProfiler
+
+WORKLOAD = """processcount 2
+runfor 10
+use rr
+quantum 2
+process name A arrival 0 burst 3
+process name B arrival 1 burst 2
+end
+"""
+
+
+def test_run_without_a_profiler_measures_nothing(tmp_path, monkeypatch):
+    def profiled_phase(*args, **kwargs):
+        raise AssertionError("a phase was profiled")
+
+    monkeypatch.setattr(profiling, "ProfiledPhase", profiled_phase)
+    input_file = tmp_path / "run.in"
+    input_file.write_text(WORKLOAD)
+    [(process_list, *_)] = run_input_file(str(input_file), True, True)
+    assert [process.finish_time for process in process_list] == [5, 4]
+
+
+def test_profiled_run_records_each_phase(tmp_path):
+    input_file = tmp_path / "run.in"
+    input_file.write_text(WORKLOAD)
+    profiler = PhaseProfiler()
+    run_input_file(str(input_file), True, True, profiler=profiler)
+
+    phases = {phase.record["phase"]: phase.record for phase in profiler.phases}
+    assert list(phases) == ["parse", "schedule", "write", "render"]
+    assert phases["parse"]["counts"]["processes"] == 2
+    assert phases["schedule"]["counts"]["context_switches"] == 3
+    assert phases["write"]["counts"]["bytes"] == (tmp_path / "run.out").stat().st_size
+    assert all(record["wall_seconds"] >= 0 for record in phases.values())
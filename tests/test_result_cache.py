@@ -0,0 +1,98 @@
+import os
+
+from Dependencies.data_structure import Process, Workload
+from Dependencies.main import run_input_file
+from Dependencies.result_cache import ResultCache
+
+WORKLOAD = """processcount 3
+runfor 30
+use rr
+quantum 2
+process name A arrival 0 burst 5
+process name B arrival 1 burst 4
+process name C arrival 3 burst 2
+end
+"""
+
+# The same workload with another layout and comments
+REFORMATTED = """processcount   3   # three processes
+runfor 30
+use rr
+quantum 2
+process name A arrival 0 burst 5
+process   name B   arrival 1   burst 4  # B
+process name C arrival 3 burst 2
+end
+"""
+
+METRICS = ("start_time", "finish_time", "turnaround_time", "waiting_time", "response_time")
+
+
+def metrics(process_list):
+    return [tuple(getattr(process, column) for column in METRICS) for process in process_list]
+
+
+def test_identical_workloads_share_their_result(tmp_path):
+    cache = ResultCache(str(tmp_path / "cache"))
+    first = tmp_path / "first.in"
+    first.write_text(WORKLOAD)
+    second = tmp_path / "second.in"
+    second.write_text(REFORMATTED)
+
+    [(simulated, *_)] = run_input_file(str(first), True, True, result_cache=cache)
+    [(restored, *_)] = run_input_file(str(second), True, True, result_cache=cache)
+
+    statistics = cache.statistics()
+    assert (statistics["hits"], statistics["misses"], statistics["entries"]) == (1, 1, 1)
+    assert metrics(restored) == metrics(simulated)
+    assert (tmp_path / "second.out").read_text() == (tmp_path / "first.out").read_text()
+    assert (tmp_path / "second_out.html").read_text() == (tmp_path / "first_out.html").read_text()
+
+
+def test_key_depends_on_the_workload_and_not_on_its_container(tmp_path):
+    key = ResultCache(str(tmp_path / "cache")).key
+    process_list = [Process("A", 0, 5), Process("B", 1, 4)]
+    table = Workload.from_processes(process_list).new_run(columnar=True)
+
+    assert key(process_list, 30, "rr", 2) == key(table, 30, "rr", 2)
+    assert key(process_list, 30, "rr", 2) != key(process_list, 30, "rr", 3)
+    assert key(process_list, 30, "rr", 2) != key([Process("A", 0, 5), Process("B", 1, 5)], 30, "rr", 2)
+    assert key(process_list, 30, "rr", 2) != key(process_list, 30, "rr", 2, aggregate=True)
+    # A lottery result is only deterministic, and cached, with a seed
+    assert key(process_list, 30, "lottery", None) is None
+    assert key(process_list, 30, "lottery", None, seed=1) != key(process_list, 30, "lottery", None, seed=2)
+
+
+def test_entry_without_a_requested_file_is_a_miss(tmp_path):
+    cache = ResultCache(str(tmp_path / "cache"))
+    process_list = [Process("A", 0, 5)]
+    key = cache.key(process_list, 30, "fcfs", None)
+    cache.store(key, process_list)  # Metrics only
+    assert not cache.restore(key, [Process("A", 0, 5)], output_file=str(tmp_path / "a.out"))
+    assert cache.restore(key, [Process("A", 0, 5)])
+    assert (cache.statistics()["hits"], cache.statistics()["misses"]) == (1, 1)
+
+
+def test_least_recently_used_entries_are_evicted(tmp_path):
+    output_file = tmp_path / "run.out"
+    output_file.write_text("x" * 1000)
+    cache = ResultCache(str(tmp_path / "cache"), max_bytes=3500)
+
+    keys = []
+    for index in range(3):
+        process_list = [Process("A", 0, index + 1)]
+        keys.append(cache.key(process_list, 30, "fcfs", None))
+        cache.store(keys[-1], process_list, str(output_file))
+        # Entries are ordered by modification time, they are spread out so the order is exact
+        os.utime(os.path.join(cache.entries_directory, keys[-1]), (index, index))
+    assert cache.statistics()["entries"] == 3
+
+    # Using the oldest entry makes the second one the least recently used
+    assert cache.restore(keys[0], [Process("A", 0, 1)])
+    process_list = [Process("A", 0, 4)]
+    cache.store(cache.key(process_list, 30, "fcfs", None), process_list, str(output_file))
+
+    remaining = set(os.listdir(cache.entries_directory))
+    assert keys[0] in remaining and keys[1] not in remaining and keys[2] in remaining
+    assert cache.statistics()["evictions"] == 1
+    assert cache.statistics()["bytes"] <= 3500
@@ -0,0 +1,43 @@
+from Benchmarks.reference_schedulers import reference_round_robin_scheduler
+from Dependencies.data_structure import Process
+from Dependencies.Scheduler_Algorithms.round_robin_scheduler import round_robin_scheduler
+from tests.conftest import random_workload
+
+METRICS = ("start_time", "finish_time", "turnaround_time", "waiting_time", "response_time")
+
+
+def metrics(process_list):
+    return [tuple(getattr(process, column) for column in METRICS) for process in process_list]
+
+
+def test_arrivals_during_a_slice_queue_before_the_preempted_process():
+    process_list = [Process("A", 0, 5), Process("B", 1, 2), Process("C", 8, 1)]
+    assert list(round_robin_scheduler(process_list, 12, 3).lines()) == [
+        "Time 0 : A arrived",
+        "Time 0 : A selected (burst 5)",
+        "Time 1 : B arrived",
+        "Time 3 : B selected (burst 2)",
+        "Time 5 : B finished",
+        "Time 5 : A selected (burst 2)",
+        "Time 7 : A finished",
+        "Time 7 : Idle",
+        "Time 8 : C arrived",
+        "Time 8 : C selected (burst 1)",
+        "Time 9 : C finished",
+        "Time 9 : Idle",
+        "Time 10 : Idle",
+        "Time 11 : Idle",
+    ]
+
+
+def test_deque_queue_matches_the_list_queue():
+    for seed in range(40):
+        processes, rng = random_workload(seed)
+        run_for = rng.randint(1, 200)
+        quantum = rng.randint(1, 5)
+        process_list = [Process(*process) for process in processes]
+        expected = [Process(*process) for process in processes]
+
+        lines = list(round_robin_scheduler(process_list, run_for, quantum).lines())
+        assert lines == reference_round_robin_scheduler(expected, run_for, quantum), f"seed {seed}"
+        assert metrics(process_list) == metrics(expected), f"seed {seed}"
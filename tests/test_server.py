@@ -0,0 +1,130 @@
+import asyncio
+import os
+import signal
+
+from Dependencies.data_structure import Process
+from Dependencies.main import scheduler_events
+from Dependencies import server as server_module
+from Dependencies.server import SimulationServer
+from Dependencies.write_output_file import output_file_lines
+
+SMALL = """processcount 3
+runfor 30
+use rr
+quantum 2
+process name A arrival 0 burst 5
+process name B arrival 1 burst 4
+process name C arrival 3 burst 2
+end
+"""
+
+
+def large_workload(processes):
+    lines = [f"processcount {processes}", "runfor 100000000", "use rr", "quantum 1"]
+    lines += [f"process name P{index} arrival 0 burst 200" for index in range(processes)]
+    return "\n".join(lines + ["end"]) + "\n"
+
+
+def expected_output():
+    process_list = [Process("A", 0, 5), Process("B", 1, 4), Process("C", 3, 2)]
+    events = scheduler_events(process_list, 30, "rr", 2)
+    return "".join(line + "\n" for line in output_file_lines(process_list, "rr", 2, events, 30))
+
+
+async def send(socket_path, text):
+    reader, writer = await asyncio.open_unix_connection(socket_path)
+    writer.write(text.encode())
+    writer.write_eof()
+    await writer.drain()
+    return reader, writer
+
+
+async def request(socket_path, text):
+    reader, writer = await send(socket_path, text)
+    output = await reader.read()
+    writer.close()
+    return output.decode()
+
+
+def run_with_server(tmp_path, scenario, workers=1):
+    async def main():
+        socket_path = str(tmp_path / "server.sock")
+        server = SimulationServer(workers)
+        server.start()
+        listener = await asyncio.start_unix_server(server.handle_client, path=socket_path)
+        try:
+            return await asyncio.wait_for(scenario(server, socket_path), 60)
+        finally:
+            listener.close()
+            await server.stop()
+
+    return asyncio.run(main())
+
+
+def test_streams_the_output_file(tmp_path):
+    async def scenario(server, socket_path):
+        outputs = await asyncio.gather(*(request(socket_path, SMALL) for _ in range(3)))
+        assert outputs == [expected_output()] * 3
+        assert (await request(socket_path, "runfor 5\nend\n")).startswith("Error: ")
+        assert not server.streams and not server.writers
+
+    run_with_server(tmp_path, scenario, workers=2)
+
+
+def test_dead_worker_ends_the_request_and_the_pool_is_replaced(tmp_path):
+    async def scenario(server, socket_path):
+        pool = server.pool
+        reader, writer = await send(socket_path, large_workload(5000))
+        # The client does not read, so its worker is paused with a full window of chunks
+        await asyncio.sleep(2)
+        for process_id in list(pool._processes):
+            os.kill(process_id, signal.SIGKILL)
+        output = (await reader.read()).decode()
+        writer.close()
+        assert output.endswith("Error: The simulation worker stopped unexpectedly.\n")
+        assert server.pool is not pool
+        assert await request(socket_path, SMALL) == expected_output()
+        assert not server.streams and not server.writers
+
+    run_with_server(tmp_path, scenario)
+
+
+def test_client_disconnect_cancels_its_simulation(tmp_path):
+    async def scenario(server, socket_path):
+        _, writer = await send(socket_path, large_workload(20000))
+        await asyncio.sleep(2)
+        writer.transport.abort()
+        # The only worker is free again well before the large simulation could have finished
+        output = await asyncio.wait_for(request(socket_path, SMALL), 10)
+        assert output == expected_output()
+        assert not server.streams and not server.writers
+
+    run_with_server(tmp_path, scenario)
+
+
+def test_client_that_stops_reading_does_not_hold_the_others_back(tmp_path):
+    async def scenario(server, socket_path):
+        _, stalled = await send(socket_path, large_workload(5000))
+        await asyncio.sleep(2)
+        # The stalled request paused its worker, the dispatcher still serves the other requests
+        outputs = await asyncio.wait_for(asyncio.gather(*(request(socket_path, SMALL) for _ in range(3))), 10)
+        assert outputs == [expected_output()] * 3
+        assert list(server.streams) == [1]
+        stalled.transport.abort()
+
+    run_with_server(tmp_path, scenario, workers=2)
+
+
+def test_client_that_stops_reading_is_dropped(tmp_path, monkeypatch):
+    monkeypatch.setattr(server_module, "SLOW_CLIENT_TIMEOUT", 1)
+
+    async def scenario(server, socket_path):
+        _, stalled = await send(socket_path, large_workload(5000))
+        while server.streams:
+            await asyncio.sleep(0.1)
+        # The dropped request freed the only worker
+        assert await asyncio.wait_for(request(socket_path, SMALL), 10) == expected_output()
+        assert not server.streams and not server.writers
+        stalled.close()
+
+    run_with_server(tmp_path, scenario)
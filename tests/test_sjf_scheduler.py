@@ -0,0 +1,61 @@
+from Dependencies.data_structure import Process
+from Dependencies.event_log import EVENT_SELECTED
+from Dependencies.Scheduler_Algorithms.sjf_scheduler import preemptive_sjf_events
+from tests.conftest import random_workload
+
+
+def reference_srtf(process_list, run_for):
+    """
+    Preemptive SJF simulated one time unit at a time: every time unit goes to the arrived process
+    with the shortest remaining time, ties broken by name then by position. The response time of
+    a process that did not finish is the longest wait before one of its selections.
+
+    :return: Tuple (list of (start time, finish time, response time) of each process, list of
+             (time, process id) of the selections)
+    """
+    remaining = [process.burst_time for process in process_list]
+    start = [-1] * len(process_list)
+    finish = [-1] * len(process_list)
+    response = [-1] * len(process_list)
+    selections = []
+    last = None
+    for time in range(run_for):
+        ready = [i for i, process in enumerate(process_list) if process.arrival_time <= time and remaining[i]]
+        if not ready:
+            continue
+        current = min(ready, key=lambda i: (remaining[i], process_list[i].name, i))
+        if current != last:
+            if start[current] == -1:
+                start[current] = time
+            response[current] = max(response[current], time - process_list[current].arrival_time)
+            selections.append((time, current))
+        last = current
+
+        remaining[current] -= 1
+        if remaining[current] == 0:
+            finish[current] = time + 1
+            response[current] = start[current] - process_list[current].arrival_time  # Final once finished
+            last = None
+    return list(zip(start, finish, response)), selections
+
+
+def test_preempts_for_a_shorter_arrival():
+    process_list = [Process("A", 0, 8), Process("B", 1, 4), Process("C", 2, 9), Process("D", 3, 5)]
+    events = list(preemptive_sjf_events(process_list, 40))
+    selections = [(time, process_list[process_id].name) for time, kind, process_id, _ in events if kind == EVENT_SELECTED]
+    assert selections == [(0, "A"), (1, "B"), (5, "D"), (10, "A"), (17, "C")]
+    assert [(process.start_time, process.finish_time) for process in process_list] == [(0, 17), (1, 5), (17, 26), (5, 10)]
+
+
+def test_matches_tick_by_tick_reference():
+    for seed in range(40):
+        processes, rng = random_workload(seed)
+        run_for = rng.randint(1, 200)
+        process_list = [Process(*process) for process in processes]
+
+        expected, expected_selections = reference_srtf(process_list, run_for)
+        events = list(preemptive_sjf_events(process_list, run_for))
+        selections = [(time, process_id) for time, kind, process_id, _ in events if kind == EVENT_SELECTED]
+        metrics = [(process.start_time, process.finish_time, process.response_time) for process in process_list]
+        assert metrics == expected, f"seed {seed}"
+        assert selections == expected_selections, f"seed {seed}"
@@ -0,0 +1,69 @@
+import pytest
+
+from Dependencies.data_structure import Process
+from Dependencies.event_log import EVENT_SELECTED
+from Dependencies.Scheduler_Algorithms.fifo_scheduler import fifo_events
+from Dependencies.Scheduler_Algorithms.round_robin_scheduler import round_robin_events
+from Dependencies.Scheduler_Algorithms.smp_scheduler import CPU, SMP_ALGORITHMS, smp_events
+from Dependencies.Scheduler_Algorithms.sjf_scheduler import preemptive_sjf_events
+from tests.conftest import random_workload
+
+
+def single_cpu_events(process_list, run_for, algorithm, quantum):
+    if algorithm == "rr":
+        return round_robin_events(process_list, run_for, quantum)
+    if algorithm == "sjf":
+        return preemptive_sjf_events(process_list, run_for)
+    return fifo_events(process_list, run_for)
+
+
+@pytest.mark.parametrize("work_stealing", [True, False])
+def test_idle_cpu_steals_from_the_longest_run_queue(work_stealing):
+    # A and C are placed on CPU 0, B and D on CPU 1 behind the long B
+    process_list = [Process("A", 0, 1), Process("B", 0, 20), Process("C", 0, 1), Process("D", 0, 5)]
+    cpus = [CPU(0), CPU(1)]
+    events = list(smp_events(process_list, 40, "fcfs", 1, cpus, work_stealing))
+
+    d_selection = [(time, cpu_id) for time, kind, process_id, _, cpu_id in events if kind == EVENT_SELECTED and process_id == 3]
+    if work_stealing:
+        assert d_selection == [(2, 0)]
+        assert [cpu.steals for cpu in cpus] == [1, 0]
+        assert process_list[3].finish_time == 7
+    else:
+        assert d_selection == [(20, 1)]
+        assert [cpu.steals for cpu in cpus] == [0, 0]
+        assert process_list[3].finish_time == 25
+
+
+@pytest.mark.parametrize("algorithm", SMP_ALGORITHMS)
+def test_single_cpu_matches_the_single_cpu_schedulers(algorithm):
+    for seed in range(12):
+        processes, rng = random_workload(seed)
+        quantum = rng.randint(1, 4)
+        expected = [Process(*process) for process in processes]
+        list(single_cpu_events(expected, 200, algorithm, quantum))
+        process_list = [Process(*process) for process in processes]
+        list(smp_events(process_list, 200, algorithm, quantum, [CPU(0)]))
+        assert [(p.start_time, p.finish_time) for p in process_list] == [(p.start_time, p.finish_time) for p in expected], f"seed {seed}"
+
+
+@pytest.mark.parametrize("algorithm", SMP_ALGORITHMS)
+@pytest.mark.parametrize("cpu_count", [2, 3, 4])
+def test_cpus_run_one_process_at_a_time_and_account_every_burst(algorithm, cpu_count):
+    for seed in range(4):
+        processes, _ = random_workload(seed)
+        process_list = [Process(*process) for process in processes]
+        cpus = [CPU(cpu_id) for cpu_id in range(cpu_count)]
+        events = list(smp_events(process_list, 500, algorithm, 3, cpus))
+
+        # A CPU is only selected again once its time slice ended (sjf may preempt it earlier)
+        slice_ends = {}
+        for time, kind, process_id, remaining, cpu_id in events:
+            if kind == EVENT_SELECTED:
+                if algorithm != "sjf":
+                    assert time >= slice_ends.get(cpu_id, 0)
+                slice_ends[cpu_id] = time + (min(3, remaining) if algorithm == "rr" else remaining)
+
+        assert all(process.finish_time != -1 and process.remaining_burst_time == 0 for process in process_list)
+        assert sum(cpu.busy_time for cpu in cpus) == sum(process.burst_time for process in process_list)
+        assert sum(cpu.dispatches for cpu in cpus) == sum(kind == EVENT_SELECTED for _, kind, *_ in events)
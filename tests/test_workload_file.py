@@ -0,0 +1,76 @@
+import sys
+
+import pytest
+
+from Dependencies import workload_file as workload_module
+from Dependencies.input_file_parsing import parse_input_file
+from Dependencies.main import scheduler_events
+from Dependencies.workload_file import WORKLOAD_HEADER, convert_input_file, load_workload_file
+
+PROCESS_LINES = """process name A arrival 0 burst 5
+process name Bé arrival 1 burst 3
+process name C arrival 4 burst 1
+process name D arrival 4 burst 7
+end
+"""
+
+INPUTS = {
+    "rr": "processcount 4\nrunfor 30\nuse rr\nquantum 2\n",
+    "sjf": "processcount 4\nrunfor 30\nuse sjf\n",
+    "mlfq": "processcount 4\nrunfor 30\nuse mlfq\nquantum 1 2 4\nboost 9\n",
+    "fair": "processcount 4\nrunfor 30\nuse fair\nlatency 6\ngranularity 2\n",
+}
+
+
+def fields(process_list):
+    return [(process.name, process.arrival_time, process.burst_time) for process in process_list]
+
+
+def convert(tmp_path, algorithm):
+    input_file = tmp_path / f"{algorithm}.in"
+    input_file.write_text(INPUTS[algorithm] + PROCESS_LINES)
+    workload_file = tmp_path / f"{algorithm}.wl"
+    convert_input_file(str(input_file), str(workload_file))
+    return str(input_file), str(workload_file)
+
+
+@pytest.mark.parametrize("algorithm", sorted(INPUTS))
+def test_workload_file_loads_like_its_input_file(tmp_path, algorithm):
+    input_file, workload_file = convert(tmp_path, algorithm)
+    process_list, run_for, parsed_algorithm, quantum = parse_input_file(input_file)
+    process_table, loaded_run_for, loaded_algorithm, loaded_quantum = load_workload_file(workload_file)
+
+    assert fields(process_table) == fields(process_list)
+    assert (loaded_run_for, loaded_algorithm, loaded_quantum) == (run_for, parsed_algorithm, quantum)
+    # The mapped table runs like the parsed list
+    events = list(scheduler_events(process_list, run_for, algorithm, quantum))
+    assert list(scheduler_events(process_table, run_for, algorithm, quantum)) == events
+
+
+def test_big_endian_host_swaps_the_columns(tmp_path, monkeypatch):
+    _, workload_file = convert(tmp_path, "mlfq")
+    with open(workload_file, 'rb') as file:
+        little_endian = file.read()
+    expected_table, *expected = load_workload_file(workload_file)
+
+    # Seen from a big-endian host, the native columns are swapped on both the write and the load path
+    monkeypatch.setattr(workload_module.sys, "byteorder", "big" if sys.byteorder == "little" else "little")
+    (tmp_path / "swapped").mkdir()
+    _, swapped_file = convert(tmp_path / "swapped", "mlfq")
+    with open(swapped_file, 'rb') as file:
+        swapped = file.read()
+    process_table, run_for, algorithm, quantum = load_workload_file(swapped_file)
+    assert fields(process_table) == fields(expected_table)
+    assert [run_for, algorithm, quantum] == expected
+
+    # The header is always little-endian, every 64-bit word of the columns and parameters is reversed
+    header_size = WORKLOAD_HEADER.size
+    assert swapped[:header_size] == little_endian[:header_size]
+    column_end = header_size + 3 * 4 * 8 + 8
+    for offset in range(header_size, column_end, 8):
+        assert swapped[offset:offset + 8] == little_endian[offset:offset + 8][::-1]
+    name_size = len("ABéCD".encode())
+    assert swapped[column_end:column_end + name_size] == little_endian[column_end:column_end + name_size]
+    parameters = column_end + name_size
+    for offset in range(parameters, len(little_endian), 8):
+        assert swapped[offset:offset + 8] == little_endian[offset:offset + 8][::-1]
@@ -0,0 +1,47 @@
+from Dependencies.data_structure import Process
+from Dependencies.Scheduler_Algorithms.round_robin_scheduler import round_robin_events, round_robin_scheduler
+from Dependencies.write_output_file import write_output_file
+
+EXPECTED = """4 processes
+Using Round-Robin
+Quantum 2
+
+Time 0 : A arrived
+Time 0 : A selected (burst 3)
+Time 1 : B arrived
+Time 2 : B selected (burst 2)
+Time 4 : B finished
+Time 4 : A selected (burst 1)
+Time 5 : A finished
+Time 5 : Idle
+Time 6 : C arrived
+Time 6 : C selected (burst 2)
+Time 8 : C finished
+Time 8 : Idle
+Time 9 : Idle
+Finished at time 10
+
+A wait 2 turnaround 5 response 0
+B wait 1 turnaround 3 response 1
+C wait 0 turnaround 2 response 0
+D did not finish
+"""
+
+
+def workload():
+    return [Process("A", 0, 3), Process("B", 1, 2), Process("C", 6, 2), Process("D", 12, 1)]
+
+
+def test_streamed_events_are_written_in_the_output_format(tmp_path):
+    output_file = tmp_path / "run.out"
+    process_list = workload()
+    # The events go straight from the scheduler to the file, the summary is written once they are consumed
+    write_output_file(str(output_file), process_list, "rr", 2, round_robin_events(process_list, 10, 2), 10)
+    assert output_file.read_text() == EXPECTED
+
+
+def test_event_log_and_event_stream_give_the_same_file(tmp_path):
+    process_list = workload()
+    event_log = round_robin_scheduler(process_list, 10, 2)
+    write_output_file(str(tmp_path / "log.out"), process_list, "rr", 2, event_log, 10)
+    assert (tmp_path / "log.out").read_text() == EXPECTED